@@ -6,9 +6,41 @@
 """
 import os
 import sys
+from argparse import ArgumentParser, Namespace
 from typing import List, Optional, Tuple
 
 
+def _check(parser: ArgumentParser, parsed_args: Namespace) -> int:
+    """Run the check subcommand and return its exit code."""
+    from .core.check import check, check_all
+
+    sources: List[str] = parsed_args.check_source
+    check_hashfile: Optional[str] = getattr(parsed_args, "check_hashfile")
+    if check_hashfile is not None:
+        return int(
+            not check_all(
+                check_hashfile,
+                *sources,
+                jobs=getattr(parsed_args, "jobs"),
+                quick=getattr(parsed_args, "check_quick"),
+                verbose=parsed_args.verbose,
+            )
+        )
+
+    if not 1 <= len(sources) <= 2:
+        parser.error("Expected a SOURCE and an optional HASHFILE.")
+    if getattr(parsed_args, "jobs") != 1:
+        parser.error("Jobs can only be specified with --hashfile.")
+    return int(
+        not check(
+            sources[0],
+            hash_filepath=None if len(sources) == 1 else sources[1],
+            quick=getattr(parsed_args, "check_quick"),
+            verbose=parsed_args.verbose,
+        )
+    )
+
+
 def _resolve_archive_sources(
     archive_sources: List[str], masks: List[str]
 ) -> Tuple[List[str], List[str]]:
@@ -46,14 +78,11 @@ def main(args: Optional[List[str]] = None) -> int:
     """
     from sortedcontainers import SortedDict
 
-    from argparse import ArgumentParser, Namespace
-
     from . import __version__, schema
     from ._cmdparser import get_parser
     from .core.archive.archive import archive
     from .core.archive.filemap import MappingBehavior
     from .core.build import build, LINUX_HIDDEN_CHAR
-    from .core.check import check
     from .core.init import init
 
     if args is None:
@@ -119,8 +148,14 @@ def main(args: Optional[List[str]] = None) -> int:
                     else os.path.abspath(schema_filepath)
                 ),
                 cache_filepath=increment,
+                chunksize=getattr(parsed_args, "chunksize"),
                 hash_filepath=hashfile,
+                jobs=getattr(parsed_args, "jobs"),
+                lock_timeout=getattr(parsed_args, "lock_timeout"),
                 overwrite=parsed_args.force,
+                pipeline=getattr(parsed_args, "pipeline"),
+                raw=getattr(parsed_args, "raw"),
+                stale_after=getattr(parsed_args, "stale_after"),
                 verbose=parsed_args.verbose,
             )
         )
@@ -134,28 +169,22 @@ def main(args: Optional[List[str]] = None) -> int:
         build(
             parsed_args.build_destination,
             *file_list,
+            chunksize=getattr(parsed_args, "chunksize"),
             hash_filepath=(
                 None
                 if parsed_args.hashfile is None
                 else os.path.abspath(parsed_args.hashfile)
             ),
-            # There is no bulletproof way of knowing which files were added
-            # since the last build, so every build will be a full-build.
+            # Files added since the last build are found using the manifest.
             incremental=False,
+            jobs=getattr(parsed_args, "jobs"),
+            manifest=not getattr(parsed_args, "build_no_manifest"),
             overwrite=parsed_args.force,
             post_hash=not getattr(parsed_args, "build_no_hash"),
             verbose=parsed_args.verbose,
         )
     elif getattr(parsed_args, "check", False):
-        return int(
-            not check(
-                parsed_args.check_source,
-                hash_filepath=(
-                    None if parsed_args.hashfile is None else parsed_args.hashfile
-                ),
-                verbose=parsed_args.verbose,
-            )
-        )
+        return _check(parser, parsed_args)
     elif getattr(parsed_args, "init", False):
         new_schema = SortedDict()
         for (i, header) in zip(range(0, len(parsed_args.headers)), parsed_args.headers):
@@ -132,6 +132,62 @@ def get_parser() -> argparse.ArgumentParser:
         required=False,
         type=str,
     )
+    archive_parser.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        help="number of processes used to read and split the data files (default: 1)",
+        metavar="N",
+        required=False,
+        type=int,
+    )
+    stream_exclusive_group = archive_parser.add_mutually_exclusive_group(required=False)
+    stream_exclusive_group.add_argument(
+        "--chunksize",
+        default=None,
+        help="stream each data file by reading at most ROWS rows at once",
+        metavar="ROWS",
+        required=False,
+        type=int,
+    )
+    stream_exclusive_group.add_argument(
+        "--pipeline",
+        action="store_true",
+        default=False,
+        help="overlap reading, splitting, and writing the data files",
+        required=False,
+    )
+    archive_parser.add_argument(
+        "--raw",
+        action="store_true",
+        default=False,
+        help="copy data rows verbatim, parsing only the schema columns",
+        required=False,
+    )
+    archive_parser.add_argument(
+        "--lock-timeout",
+        default=None,
+        dest="lock_timeout",
+        help=(
+            "seconds to wait for a lock file held by another archival "
+            "(default: wait indefinitely)"
+        ),
+        metavar="SECONDS",
+        required=False,
+        type=float,
+    )
+    archive_parser.add_argument(
+        "--stale-after",
+        default=None,
+        dest="stale_after",
+        help=(
+            "seconds after which a held lock file is considered abandoned and broken "
+            "(default: only when its process is no longer running on this host)"
+        ),
+        metavar="SECONDS",
+        required=False,
+        type=float,
+    )
     archive_parser.add_argument(
         "-s",
         "--schema",
@@ -225,6 +281,29 @@ def get_parser() -> argparse.ArgumentParser:
         metavar="HASHFILE",
         nargs="?",
     )
+    build_parser.add_argument(
+        "--chunksize",
+        default=None,
+        help=(
+            "stream the build by reading at most ROWS rows from a file at once; with "
+            "-j, files are read by one process and only formatted in parallel"
+        ),
+        metavar="ROWS",
+        required=False,
+        type=int,
+    )
+    build_parser.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        help=(
+            "number of processes used to parse the archived files; without "
+            "--chunksize, up to 2*N whole files are held in memory (default: 1)"
+        ),
+        metavar="N",
+        required=False,
+        type=int,
+    )
     build_parser.add_argument(
         "--no-hash",
         action="store_true",
@@ -233,6 +312,17 @@ def get_parser() -> argparse.ArgumentParser:
         help="skip the hashing process",
         required=False,
     )
+    build_parser.add_argument(
+        "--no-manifest",
+        action="store_true",
+        default=False,
+        dest="build_no_manifest",
+        help=(
+            "always perform a full build and do not record the built files in a "
+            "manifest beside DESTINATION"
+        ),
+        required=False,
+    )
 
     # check command
     # create check subcommand parser
@@ -241,6 +331,11 @@ def get_parser() -> argparse.ArgumentParser:
         epilog=hashfile_epilog,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         help="verifies the integrity of a built file",
+        usage=(
+            "%(prog)s [-h] [--quick | --full] SOURCE [HASHFILE]\n"
+            "       %(prog)s [-h] [--quick | --full] [-j N] --hashfile HASHFILE "
+            "[SOURCE ...]"
+        ),
     )
     # optional, hidden argument that is true when using this subparser
     # but does not exist otherwise
@@ -252,14 +347,56 @@ def get_parser() -> argparse.ArgumentParser:
         required=False,
     )
     check_parser.add_argument(
-        "check_source", help="file output by the build command", metavar="SOURCE"
+        "check_source",
+        help=(
+            "file output by the build command, optionally followed by the HASHFILE "
+            "containing its hash entry"
+        ),
+        metavar="SOURCE",
+        nargs="*",
     )
     check_parser.add_argument(
-        "hashfile",
+        "--hashfile",
         default=None,
-        help="the file containing the hash entry of the SOURCE file",
+        dest="check_hashfile",
+        help=(
+            "check every SOURCE against HASHFILE, or every entry in HASHFILE if no "
+            "SOURCE is given"
+        ),
         metavar="HASHFILE",
-        nargs="?",
+        required=False,
+        type=str,
+    )
+    check_parser.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        help=(
+            "number of files hashed at once; only valid with --hashfile, since a "
+            "single SOURCE is hashed by one process (default: 1)"
+        ),
+        metavar="N",
+        required=False,
+        type=int,
+    )
+    quick_exclusive_group = check_parser.add_mutually_exclusive_group(required=False)
+    quick_exclusive_group.add_argument(
+        "--quick",
+        action="store_true",
+        default=False,
+        dest="check_quick",
+        help=(
+            "skip hashing files whose size, modification time, and inode are "
+            "unchanged since they last passed a quick check"
+        ),
+        required=False,
+    )
+    quick_exclusive_group.add_argument(
+        "--full",
+        action="store_false",
+        dest="check_quick",
+        help="hash every file, even if it is unchanged (the default)",
+        required=False,
     )
 
     # init command
@@ -0,0 +1,52 @@
+"""syphon.core._parallel.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Callable, Deque, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def ordered(
+    function: Callable[..., T],
+    calls: Iterable[Tuple[Any, ...]],
+    executor: Optional[Executor],
+    ahead: int,
+) -> Iterator[T]:
+    """Yield the result of calling a function with each argument tuple, in order.
+
+    With an executor, up to `ahead` calls are submitted ahead of the result being
+    yielded, so at most that many results are held at once. Without one, each call is
+    made once its result is requested.
+    """
+    remaining: Iterator[Tuple[Any, ...]] = iter(calls)
+    if executor is None:
+        for arguments in remaining:
+            yield function(*arguments)
+        return
+
+    pending: Deque[Future] = deque(
+        executor.submit(function, *arguments) for arguments in islice(remaining, ahead)
+    )
+    while len(pending) > 0:
+        future: Future = pending.popleft()
+        for arguments in islice(remaining, 1):
+            pending.append(executor.submit(function, *arguments))
+        yield future.result()
+
+
+@contextmanager
+def pool(jobs: int) -> Iterator[Optional[Executor]]:
+    """Provide a process pool if more than one job is requested, otherwise None."""
+    if jobs == 1:
+        yield None
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield executor
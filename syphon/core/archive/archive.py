@@ -4,68 +4,593 @@
    Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
 
 """
+import asyncio
 import os
-from typing import Dict, List, Optional, Set
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
-from pandas import DataFrame, Series, concat, read_csv
+from pandas import DataFrame, RangeIndex, concat, isna, read_csv
 from sortedcontainers import SortedDict
 
 from ... import schema as schema_help
 from ...errors import InconsistentMetadataError
-from .datafilter import datafilter
-from .filemap import MappingBehavior, filemap
+from .._parallel import ordered, pool
+from .datafilter import keyed_datafilter
+from .filemap import MappingBehavior, filemap, unmatched
+from .journal import Journal, recover
 from .lockmanager import LockManager
+from .writer import ArchiveWriter
 
+# Hidden, so partition locks are never mistaken for archived data.
+PARTITION_LOCK_FILE: str = ".#lock"
 
-def merge_metafiles(
-    filemap: Dict[str, List[str]], datafile: str, data_rows: int
-) -> Optional[DataFrame]:
-    # merge all metadata files into a single DataFrame
-    meta_frame = DataFrame()
-    for metafile in filemap[datafile]:
-        new_frame = DataFrame(read_csv(metafile, dtype=str))
 
-        new_frame.dropna(axis=1, how="all", inplace=True)
-        for header in list(new_frame.columns.values):
-            # complain if there's more than one value in a column
-            if len(new_frame[header].drop_duplicates().values) > 1:
-                raise InconsistentMetadataError(header)
+def _broadcast(metadata: List[Tuple[str, Any]], data_rows: int) -> Optional[DataFrame]:
+    """Repeat each metadata value for every data row.
+
+    All columns are filled by a single DataFrame construction, so no per-row lists
+    are built and no intermediate frames are copied.
+
+    Returns:
+        A DataFrame with a column for each (header, value) tuple, or None if there is
+        no metadata or there are no rows.
+    """
+    if len(metadata) == 0 or data_rows == 0:
+        return None
+
+    # Columns are keyed by position so that repeated headers are kept.
+    meta_frame = DataFrame(
+        {i: value for i, (_, value) in enumerate(metadata)},
+        index=RangeIndex(data_rows),
+    )
+    meta_frame.columns = [header for header, _ in metadata]
+    return meta_frame
+
+
+def _collate(
+    datafile: str,
+    metadata: List[Tuple[str, Any]],
+    schema: SortedDict,
+    content: Optional[bytes] = None,
+) -> Optional[List[Tuple[Tuple[Any, ...], str]]]:
+    """Merge a data file with its metadata and split it according to the schema.
+
+    The data file is read unless its content is given. The metadata is a list of
+    (header, value) tuples as given by `_metadata`.
+
+    Returns:
+        A list of (key, text) tuples as given by `keyed_datafilter`, except that each
+        partition is rendered as CSV text. None is returned if the data file is empty.
+
+    Raises:
+        IndexError: Schema value is not a column header of the data.
+    """
+    from io import BytesIO
+
+    from pandas.errors import EmptyDataError
+
+    try:
+        data_frame = DataFrame(
+            read_csv(datafile if content is None else BytesIO(content), dtype=str)
+        )
+    except EmptyDataError:
+        # trigger the empty check below
+        data_frame = DataFrame()
+
+    if data_frame.empty:
+        return None
+
+    # remove empty columns
+    data_frame.dropna(axis=1, how="all", inplace=True)
+
+    meta_frame: Optional[DataFrame] = _broadcast(metadata, data_frame.shape[0])
+    if meta_frame is not None:
+        data_frame = concat([data_frame, meta_frame], axis=1)
+
+    schema_help.Schema.compile(schema).check_columns(data_frame)
+
+    return [
+        (key, data.to_csv(index=False))
+        for key, data in keyed_datafilter(schema, data_frame)
+    ]
+
+
+def _delimiters(record: str) -> int:
+    """Count the commas of a CSV record that are not inside quotes."""
+    if '"' not in record:
+        return record.count(",")
+    count: int = 0
+    quoted: bool = False
+    for char in record:
+        if char == '"':
+            quoted = not quoted
+        elif char == "," and not quoted:
+            count += 1
+    return count
+
+
+def _collate_raw(
+    datafile: str,
+    metadata: List[Tuple[str, Any]],
+    schema: SortedDict,
+    content: Optional[bytes] = None,
+) -> Optional[List[Tuple[Tuple[Any, ...], str]]]:
+    """Split a data file like `_collate`, copying its rows verbatim.
+
+    Only the schema columns are parsed. Every other column stays inside the text of
+    its row, so wide data files are split without building a value for each cell.
+    Unlike `_collate`, empty columns are kept, and values are written as they appear
+    in the data file instead of being quoted again. Rows shorter than the header are
+    padded with empty columns before metadata is appended.
+
+    Returns:
+        A list of (key, text) tuples as given by `_collate`, or None if the data file
+        is empty.
+
+    Raises:
+        IndexError: Schema value is not a column header of the data.
+        ValueError: The rows of the data file cannot be told apart without parsing
+            every column, or a row is longer than the header.
+    """
+    from csv import reader, writer
+    from io import StringIO
+
+    compiled: schema_help.Schema = schema_help.Schema.compile(schema)
+
+    if content is None:
+        with open(datafile, "rb") as file:
+            content = file.read()
+    text: str = content.decode("utf-8-sig")
+
+    records: List[str] = _records(text)
+    if len(records) < 2:
+        return None
+    header: str = records[0]
+    rows: int = len(records) - 1
+
+    columns: Set[str] = set(next(reader(StringIO(header))))
+    wanted: Set[str] = {h for h in compiled.headers if h in columns}
+    key_frame = DataFrame(index=RangeIndex(rows))
+    if len(wanted) != 0:
+        key_frame = DataFrame(
+            read_csv(StringIO(text), dtype=str, usecols=lambda c: c in wanted)
+        )
+        if key_frame.shape[0] != rows:
+            raise ValueError(f"Cannot copy the rows of data file @ {datafile}")
+        key_frame.dropna(axis=1, how="all", inplace=True)
+
+    suffix: str = ""
+    padding: List[str] = [""] * rows
+    meta_frame: Optional[DataFrame] = _broadcast(metadata, rows)
+    if meta_frame is not None:
+        key_frame = concat([key_frame, meta_frame], axis=1)
+        buffer = StringIO()
+        csv_writer = writer(buffer, lineterminator="\n")
+        csv_writer.writerow([h for h, _ in metadata])
+        header = f"{header},{buffer.getvalue()[:-1]}"
+        buffer.seek(0)
+        buffer.truncate()
+        csv_writer.writerow(["" if isna(v) else v for _, v in metadata])
+        suffix = f",{buffer.getvalue()[:-1]}"
+
+        width: int = _delimiters(records[0])
+        for i in range(rows):
+            missing: int = width - _delimiters(records[i + 1])
+            if missing < 0:
+                raise ValueError(f"Cannot copy the rows of data file @ {datafile}")
+            padding[i] = "," * missing
+
+    compiled.check_columns(key_frame)
+
+    return [
+        (
+            key,
+            "".join(
+                [f"{header}{os.linesep}"]
+                + [
+                    f"{records[i + 1]}{padding[i]}{suffix}{os.linesep}"
+                    for i in data.index
+                ]
+            ),
+        )
+        for key, data in keyed_datafilter(compiled, key_frame)
+    ]
+
+
+def _collated(
+    metadata: Dict[str, List[Tuple[str, Any]]],
+    schema: SortedDict,
+    executor: Optional[Executor],
+    jobs: int,
+    raw: bool = False,
+) -> Iterator[Tuple[str, Optional[List[Tuple[Tuple[Any, ...], str]]]]]:
+    """Yield each data file with its collated partitions in the order given.
+
+    With an executor, up to twice as many data files as there are jobs are collated
+    ahead of the data file being yielded. Raw data files are collated by
+    `_collate_raw`.
+    """
+    collate = _collate_raw if raw else _collate
+    yield from zip(
+        metadata,
+        ordered(
+            collate,
+            ((datafile, metadata[datafile], schema) for datafile in metadata),
+            executor,
+            2 * jobs,
+        ),
+    )
+
+
+def _discard(future: "asyncio.Future") -> None:
+    """Cancel a future, or retrieve its exception so it is not reported."""
+    if future.done():
+        if not future.cancelled():
+            future.exception()
+    else:
+        future.cancel()
+
+
+def _lock_sources(
+    lock_manager: LockManager, data_files: List[str], meta_files: List[str]
+) -> List[str]:
+    """Lock the directories of all data and metadata files.
+
+    Each directory is locked once, and always in the same order, so concurrent
+    archivals cannot deadlock. Nothing is left locked if an error is raised.
+
+    Returns:
+        A list of the created lock files.
+
+    Raises:
+        FileNotFoundError: A given file does not exist.
+        OSError: File operation error. Error type raised may be a subclass of OSError.
+    """
+    for d_file in data_files:
+        if not os.path.exists(d_file):
+            raise FileNotFoundError(f"Cannot archive nonexistent data file @ {d_file}")
+
+    for m_file in meta_files:
+        if not os.path.exists(m_file):
+            raise FileNotFoundError(
+                f"Cannot archive nonexistent metadata file @ {m_file}"
+            )
+
+    # add '#lock' file to all data and metadata directories
+    return lock_manager.lock_all(os.path.dirname(f) for f in data_files + meta_files)
+
+
+def _metadata(
+    metafiles: List[str], cache: Dict[str, List[Tuple[str, Any]]]
+) -> List[Tuple[str, Any]]:
+    """Return the (header, value) tuples of the given metadata files in order.
+
+    Each metadata file is read once, and its tuples are kept in the cache.
+
+    Raises:
+        InconsistentMetadataError: More than one value exists in a column.
+    """
+    result: List[Tuple[str, Any]] = []
+    for metafile in metafiles:
+        if metafile not in cache:
+            cache[metafile] = _read_metafile(metafile)
+        result.extend(cache[metafile])
+    return result
+
+
+def _nonempty_columns(datafile: str, chunksize: int) -> Optional[List[str]]:
+    """Return the columns of a data file that hold at least one value.
+
+    The data file is read one chunk at a time.
+
+    Returns:
+        The column headers in the order they appear, or None if the data file has no
+        rows.
+    """
+    columns: List[str] = []
+    filled: Set[str] = set()
+    rows: int = 0
+    for chunk in read_csv(datafile, dtype=str, chunksize=chunksize):
+        columns = list(chunk.columns)
+        filled.update(chunk.columns[chunk.notna().any()])
+        rows += chunk.shape[0]
+
+    return None if rows == 0 else [header for header in columns if header in filled]
+
+
+async def _pipeline(
+    archive_dir: str,
+    metadata: Dict[str, List[Tuple[str, Any]]],
+    schema: SortedDict,
+    collated_files: Dict[str, List[str]],
+    executor: Optional[Executor],
+    io_executor: Executor,
+    jobs: int,
+    overwrite: bool,
+    verbose: bool,
+    writer: ArchiveWriter,
+    raw: bool = False,
+) -> None:
+    """Read, split, and write data files in separate stages that run concurrently.
+
+    Stages are connected by queues holding at most `jobs` data files, so a slow
+    stage holds back the stages before it. Data files are split by the executor, or
+    by the I/O executor without one. Raw data files are split by `_collate_raw`.
+    """
+    loop = asyncio.get_event_loop()
+    # Data files with their content.
+    reads: "asyncio.Queue[Optional[Tuple[str, bytes]]]" = asyncio.Queue(jobs)
+    # Data files with the future of their partitions.
+    splits: "asyncio.Queue[Optional[Tuple[str, asyncio.Future]]]" = asyncio.Queue(jobs)
+    claimed: Dict[str, str] = dict()
+
+    def _read(datafile: str) -> bytes:
+        with open(datafile, "rb") as file:
+            return file.read()
+
+    async def _read_stage() -> None:
+        for datafile in metadata:
+            content: bytes = await loop.run_in_executor(io_executor, _read, datafile)
+            await reads.put((datafile, content))
+        await reads.put(None)
+
+    async def _split_stage() -> None:
+        while True:
+            item = await reads.get()
+            if item is None:
+                break
+            datafile, content = item
+            future = loop.run_in_executor(
+                io_executor if executor is None else executor,
+                _collate_raw if raw else _collate,
+                datafile,
+                metadata[datafile],
+                schema,
+                content,
+            )
+            await splits.put((datafile, future))
+        await splits.put(None)
+
+    async def _write_stage() -> None:
+        while True:
+            item = await splits.get()
+            if item is None:
+                break
+            datafile, future = item
+            filtered_data = await future
+            if filtered_data is None:
+                if verbose:
+                    print(f"Skipping empty data file @ {datafile}")
+                continue
+
+            collated_files[datafile] = await loop.run_in_executor(
+                io_executor,
+                write_filtered_data,
+                archive_dir,
+                filtered_data,
+                datafile,
+                claimed,
+                overwrite,
+                verbose,
+                writer,
+            )
+
+    stages: List[asyncio.Future] = [
+        asyncio.ensure_future(stage())
+        for stage in [_read_stage, _split_stage, _write_stage]
+    ]
+    try:
+        await asyncio.gather(*stages)
+    except BaseException:
+        for stage in stages:
+            stage.cancel()
+        await asyncio.gather(*stages, return_exceptions=True)
+        while not splits.empty():
+            item = splits.get_nowait()
+            if item is not None:
+                _discard(item[1])
+        raise
+
+
+def _read_metafile(metafile: str) -> List[Tuple[str, Any]]:
+    """Return the header and value of each non-empty column in a metadata file.
+
+    Raises:
+        InconsistentMetadataError: More than one value exists in a column.
+    """
+    new_frame = DataFrame(read_csv(metafile, dtype=str))
+
+    new_frame.dropna(axis=1, how="all", inplace=True)
+    result: List[Tuple[str, Any]] = []
+    for header in list(new_frame.columns.values):
+        # complain if there's more than one value in a column
+        if len(new_frame[header].drop_duplicates().values) > 1:
+            raise InconsistentMetadataError(header)
+        result.append((header, new_frame[header].iloc[0]))
+    return result
+
+
+def _records(text: str) -> List[str]:
+    """Split CSV text into its records without parsing any fields.
+
+    A line with an unbalanced number of quotes continues onto the next line. Blank
+    records are skipped, as `pandas.read_csv` does, and line endings are removed.
+    """
+    records: List[str] = []
+    pending: List[str] = []
+    quotes: int = 0
+    for line in text.split("\n"):
+        pending.append(line)
+        quotes += line.count('"')
+        if quotes % 2 != 0:
+            continue
+
+        record: str = "\n".join(pending)
+        if record.endswith("\r"):
+            record = record[:-1]
+        if record.strip() != "":
+            records.append(record)
+        pending = []
+        quotes = 0
+
+    if len(pending) != 0:
+        records.append("\n".join(pending))
+    return records
+
+
+def _stream(
+    archive_dir: str,
+    datafile: str,
+    metadata: List[Tuple[str, Any]],
+    schema: schema_help.Schema,
+    chunksize: int,
+    claimed: Dict[str, str],
+    overwrite: bool,
+    verbose: bool,
+    writer: ArchiveWriter,
+) -> Optional[List[str]]:
+    """Archive a data file one chunk of rows at a time.
+
+    Each chunk is merged with its metadata and split according to the schema. The
+    first rows of a partition create its archive file, and later rows are appended
+    without a header, so the archive files match those written from the whole data
+    file. Empty columns are found by reading the data file once beforehand.
+
+    Unlike `write_filtered_data`, targets are checked as they are first met, so an
+    error can leave the files written from earlier chunks behind.
+
+    Returns:
+        A list of written files, or None if the data file is empty.
+
+    Raises:
+        FileExistsError: The target file already exists and overwrite is False, or
+            another data file was archived to the same target file.
+        IndexError: Schema value is not a column header of the data.
+    """
+    from pandas.errors import EmptyDataError
+
+    try:
+        columns: Optional[List[str]] = _nonempty_columns(datafile, chunksize)
+    except EmptyDataError:
+        return None
 
-            if len(new_frame[header]) is data_rows:
-                meta_frame = concat([meta_frame, new_frame[header]], axis=1)
-            else:
-                meta_value = new_frame[header].iloc[0]
-                series = Series([meta_value] * data_rows, name=header)
-                meta_frame = concat([meta_frame, series], axis=1)
+    if columns is None:
+        return None
 
-    return None if meta_frame.empty else meta_frame
+    datafilename = os.path.basename(datafile)
+    written_files: List[str] = []
+    for chunk in read_csv(datafile, dtype=str, chunksize=chunksize):
+        # Chunks are numbered from the start of the file, but metadata is not.
+        data_frame: DataFrame = chunk[columns].reset_index(drop=True)
+
+        meta_frame: Optional[DataFrame] = _broadcast(metadata, data_frame.shape[0])
+        if meta_frame is not None:
+            data_frame = concat([data_frame, meta_frame], axis=1)
+
+        schema.check_columns(data_frame)
+
+        for key, data in keyed_datafilter(schema, data_frame):
+            path: str = schema.resolve_key_path(archive_dir, key)
+            target_filename: str = os.path.join(path, datafilename)
+
+            created: bool = claimed.get(target_filename) != datafile
+            if created:
+                if target_filename in claimed:
+                    raise FileExistsError(
+                        f"Both {claimed[target_filename]} and {datafile} would be "
+                        f"archived @ {target_filename}"
+                    )
+                if writer.exists(target_filename) and not overwrite:
+                    raise FileExistsError(
+                        f"File already exists in archive @ {target_filename}"
+                    )
+                writer.makedirs(path)
+
+            writer.write(
+                target_filename,
+                data.to_csv(index=False, header=created),
+                append=not created,
+            )
+
+            if created:
+                claimed[target_filename] = datafile
+                written_files.append(target_filename)
+                if verbose:
+                    print(f"Archived {target_filename}")
+
+    return written_files
+
+
+def merge_metafiles(
+    filemap: Dict[str, List[str]],
+    datafile: str,
+    data_rows: int,
+    cache: Optional[Dict[str, List[Tuple[str, Any]]]] = None,
+) -> Optional[DataFrame]:
+    # merge all metadata files into a single DataFrame
+    # (metadata files already in the given cache are not read again)
+    return _broadcast(
+        _metadata(filemap[datafile], dict() if cache is None else cache), data_rows
+    )
 
 
 def write_filtered_data(
     archive: str,
-    schema: SortedDict,
-    filtered_data: List[DataFrame],
+    filtered_data: List[Tuple[Tuple[Any, ...], str]],
     datafile: str,
+    claimed: Dict[str, str],
     overwrite: bool,
     verbose: bool,
+    writer: Optional[ArchiveWriter] = None,
 ) -> List[str]:
-    """Returns a list of written files."""
-    datafilename = os.path.basename(datafile)
+    """Returns a list of written files.
 
-    written_files: List[str] = []
-    for data in filtered_data:
-        path: Optional[str] = None
-        path = schema_help.resolve_path(archive, schema, data)
+    Each item of `filtered_data` is a (key, text) tuple, where the key alone
+    determines where the CSV text is written.
+
+    `claimed` maps every file already written during this archival to the data file
+    it came from. It is updated with the written files.
+
+    Files are written through the given writer, which the caller must close. Without
+    one, the files are closed before returning.
 
-        target_filename: str = os.path.join(
-            path, datafilename
-        ) if path is not None else datafilename
+    Raises:
+        FileExistsError: The target file already exists and overwrite is False, or
+            another data file was archived to the same target file.
+    """
+    if writer is None:
+        with ArchiveWriter() as local_writer:
+            return write_filtered_data(
+                archive,
+                filtered_data,
+                datafile,
+                claimed,
+                overwrite,
+                verbose,
+                writer=local_writer,
+            )
 
-        if os.path.exists(target_filename) and not overwrite:
+    datafilename = os.path.basename(datafile)
+
+    targets: List[Tuple[str, str, str]] = []
+    for key, text in filtered_data:
+        path: str = schema_help.resolve_key_path(archive, key)
+        target_filename: str = os.path.join(path, datafilename)
+
+        if target_filename in claimed:
+            raise FileExistsError(
+                f"Both {claimed[target_filename]} and {datafile} would be archived "
+                f"@ {target_filename}"
+            )
+        if writer.exists(target_filename) and not overwrite:
             raise FileExistsError(f"File already exists in archive @ {target_filename}")
+        targets.append((path, target_filename, text))
 
-        os.makedirs(path, exist_ok=True)
-        data.to_csv(target_filename, index=False)
+    written_files: List[str] = []
+    for path, target_filename, text in targets:
+        writer.makedirs(path)
+        writer.write(target_filename, text)
+        claimed[target_filename] = datafile
         written_files.append(target_filename)
         if verbose:
             print(f"Archived {target_filename}")
@@ -81,56 +606,140 @@ def collate_data(
     schema: SortedDict,
     overwrite: bool,
     verbose: bool,
+    jobs: int = 1,
+    pipeline: bool = False,
+    chunksize: Optional[int] = None,
+    raw: bool = False,
+    lock_timeout: Optional[float] = None,
+    stale_after: Optional[float] = None,
 ) -> Dict[str, List[str]]:
     """Returns a dictionary containing string keys which index string lists.
 
     Keys are the given data files.
     Each value is a list of files collated and archived from the data file key.
+
+    Data files are read, merged, and split by a pool of `jobs` processes. Files are
+    written in the order the data files were given. As a pipeline, reading, splitting,
+    and writing run concurrently, so waiting on one data file's reads and writes
+    overlaps with splitting another.
+
+    With a chunksize, each data file is instead streamed into the archive at most
+    `chunksize` rows at a time, one data file after another. Otherwise, raw data
+    files have their rows copied verbatim, and only their schema columns are parsed.
+
+    Files are staged beside their targets and replace them once every data file is
+    archived. If an error is raised, then the staged files are removed. A journal in
+    the archive directory lets `syphon.core.archive.journal.recover` finish or undo
+    an archival that died before it could do either. Partition directories are
+    locked while files are replaced, as configured by `lock_timeout` and
+    `stale_after` (see `LockManager`).
     """
-    from pandas.errors import EmptyDataError
+    # Compiled once, so an invalid schema is reported before any data file is read.
+    compiled: schema_help.Schema = schema_help.Schema.compile(schema)
 
     fmap: Dict[str, List[str]]
     collated_files: Dict[str, List[str]]
     if len(meta_list) > 0:
         fmap = filemap(filemap_behavior, data_list, meta_list)
         collated_files = {key: [] for key in data_list}
+        if verbose:
+            lone_data, lone_meta = unmatched(fmap, data_list, meta_list)
+            for datafile in lone_data:
+                print(f"No metadata file matches data file @ {datafile}")
+            for metafile in lone_meta:
+                print(f"No data file matches metadata file @ {metafile}")
     else:
         fmap = {key: [] for key in data_list}
         collated_files = fmap.copy()
 
-    for datafile in fmap.keys():
-        try:
-            data_frame = DataFrame(read_csv(datafile, dtype=str))
-        except EmptyDataError:
-            # trigger the empty check below
-            data_frame = DataFrame()
-
-        if data_frame.empty:
-            if verbose:
-                print(f"Skipping empty data file @ {datafile}")
-            continue
-
-        # remove empty columns
-        data_frame.dropna(axis=1, how="all", inplace=True)
-
-        try:
-            meta_frame: Optional[DataFrame] = merge_metafiles(
-                fmap, datafile, data_frame.shape[0]
-            )
-        except InconsistentMetadataError as err:
-            raise ValueError(
-                f'More than one value exists under the "{err.column}" column.'
-            )
-
-        if meta_frame is not None:
-            data_frame = concat([data_frame, meta_frame], axis=1)
-
-        schema_help.check_columns(schema, data_frame)
-
-        filtered_data: List[DataFrame] = datafilter(schema, data_frame)
-
-        collated_files[datafile] = write_filtered_data(
-            archive_dir, schema, filtered_data, datafile, overwrite, verbose
+    # Every metadata file is read once, no matter how many data files share it.
+    cache: Dict[str, List[Tuple[str, Any]]] = dict()
+    try:
+        metadata: Dict[str, List[Tuple[str, Any]]] = {
+            datafile: _metadata(metafiles, cache)
+            for datafile, metafiles in fmap.items()
+        }
+    except InconsistentMetadataError as err:
+        raise ValueError(f'More than one value exists under the "{err.column}" column.')
+
+    claimed: Dict[str, str] = dict()
+    # Nothing reaches the archive unless every data file is archived.
+    with ArchiveWriter(
+        journal=Journal(archive_dir),
+        lock_manager=LockManager(
+            timeout=lock_timeout, stale_after=stale_after, filename=PARTITION_LOCK_FILE
+        ),
+        overwrite=overwrite,
+    ) as writer:
+        if chunksize is not None:
+            for datafile, constants in metadata.items():
+                archived: Optional[List[str]] = _stream(
+                    archive_dir,
+                    datafile,
+                    constants,
+                    compiled,
+                    chunksize,
+                    claimed,
+                    overwrite,
+                    verbose,
+                    writer,
+                )
+                if archived is None:
+                    if verbose:
+                        print(f"Skipping empty data file @ {datafile}")
+                    continue
+
+                collated_files[datafile] = archived
+
+        elif pipeline:
+            from concurrent.futures import ThreadPoolExecutor
+
+            loop = asyncio.new_event_loop()
+            try:
+                # One thread for each stage.
+                with pool(jobs) as executor, ThreadPoolExecutor(3) as io_executor:
+                    loop.run_until_complete(
+                        _pipeline(
+                            archive_dir,
+                            metadata,
+                            compiled,
+                            collated_files,
+                            executor,
+                            io_executor,
+                            jobs,
+                            overwrite,
+                            verbose,
+                            writer,
+                            raw=raw,
+                        )
+                    )
+            finally:
+                loop.close()
+
+        else:
+            with pool(jobs) as executor:
+                for datafile, filtered_data in _collated(
+                    metadata, compiled, executor, jobs, raw=raw
+                ):
+                    if filtered_data is None:
+                        if verbose:
+                            print(f"Skipping empty data file @ {datafile}")
+                        continue
+
+                    collated_files[datafile] = write_filtered_data(
+                        archive_dir,
+                        filtered_data,
+                        datafile,
+                        claimed,
+                        overwrite,
+                        verbose,
+                        writer=writer,
+                    )
+
+    if verbose:
+        print(
+            "Archive file system calls: {scandir} scandir, {makedirs} makedirs, "
+            "{open} open".format(**writer.counts)
         )
 
     return collated_files
@@ -143,8 +752,14 @@ def archive(
     filemap_behavior: MappingBehavior = MappingBehavior.ONE_TO_ONE,
     schema_filepath: Optional[str] = None,
     cache_filepath: Optional[str] = None,
+    chunksize: Optional[int] = None,
     hash_filepath: Optional[str] = None,
+    jobs: int = 1,
+    lock_timeout: Optional[float] = None,
     overwrite: bool = False,
+    pipeline: bool = False,
+    raw: bool = False,
+    stale_after: Optional[float] = None,
     verbose: bool = False,
 ) -> bool:
     # NOTE:
@@ -158,10 +773,25 @@ def archive(
         filemap_behavior: How data and metadata files should be mapped.
         schema_filepath: Absolute path to a JSON file containing a storage schema.
         cache_filepath: Path to a build file to increment.
+        chunksize: Number of rows to read from a data file at once. If not given, then
+            each data file is read in its entirety. Streamed data files are archived
+            one after another, and cannot be combined with pipeline.
         hash_filepath: Path to a file containing a SHA256 sum of the cache. If not
             given, then the default is calculated by joining the cache directory with
             `syphon.core.check.DEFAULT_FILE`.
+        jobs: Number of processes used to read and split the data files. Defaults
+            to 1.
+        lock_timeout: Seconds to wait for a lock file held by another archival before
+            giving up. Waits indefinitely if not given.
         overwrite: Whether existing files should be overwritten during archival.
+        pipeline: Whether to overlap reading, splitting, and writing data files.
+            Defaults to False.
+        raw: Whether to copy the rows of data files verbatim, parsing only their
+            schema columns. Empty columns are kept and values are not quoted again.
+            Cannot be combined with chunksize. Defaults to False.
+        stale_after: Seconds after which a held lock file is considered abandoned and
+            is broken. Lock files held by a process that no longer runs on this host
+            are always abandoned.
         verbose: Whether activities should be printed to the standard output.
 
     Returns:
@@ -170,20 +800,42 @@ def archive(
         command.
 
     Raises:
-        FileExistsError: An archive file already exists with the same filepath.
+        FileExistsError: An archive file already exists with the same filepath, or
+            two data files would be archived to the same filepath.
         FileNotFoundError: A given file does not exist.
         IndexError: Schema value is not a column header of a given DataFrame.
         OSError: File operation error. Error type raised may be a subclass of OSError.
-        ValueError: More than one unique metadata value exists under a column header.
+        TimeoutError: A lock file was held by another archival for longer than
+            lock_timeout.
+        ValueError: More than one unique metadata value exists under a column header,
+            chunksize or jobs is less than 1, lock_timeout or stale_after is
+            negative, chunksize is given with pipeline or raw, the rows of a raw data
+            file cannot be told apart, or a journal in the archive directory is
+            malformed.
         Exception: Any error raised by pandas.read_csv.
     """
     from ..build import build as syphon_build
 
+    if jobs < 1:
+        raise ValueError(f"Expected at least 1 job, received {jobs}")
+
+    if chunksize is not None:
+        if chunksize < 1:
+            raise ValueError(f"Chunksize must be at least 1, received {chunksize}")
+        if pipeline:
+            raise ValueError("Chunksize cannot be combined with pipeline")
+        if raw:
+            raise ValueError("Chunksize cannot be combined with raw")
+
+    if lock_timeout is not None and lock_timeout < 0:
+        raise ValueError(f"Lock timeout cannot be negative, received {lock_timeout}")
+    if stale_after is not None and stale_after < 0:
+        raise ValueError(f"Stale lock age cannot be negative, received {stale_after}")
+
     if meta_files is None:
         meta_files = []
 
-    lock_manager = LockManager()
-    lock_list: List[str] = list()
+    lock_manager = LockManager(timeout=lock_timeout, stale_after=stale_after)
 
     if len(data_files) == 0:
         lock_manager.release_all()
@@ -199,23 +851,12 @@ def archive(
             )
         schema = schema_help.load(schema_filepath)
 
-    # add '#lock' file to all data directories
-    for d_file in data_files:
-        if not os.path.exists(d_file):
-            lock_manager.release_all()
-            raise FileNotFoundError(f"Cannot archive nonexistent data file @ {d_file}")
-        lock_list.append(lock_manager.lock(os.path.dirname(d_file)))
-
-    # add '#lock' file to all metadata directories
-    for m_file in meta_files:
-        if not os.path.exists(m_file):
-            lock_manager.release_all()
-            raise FileNotFoundError(
-                f"Cannot archive nonexistent metadata file @ {m_file}"
-            )
-        lock_list.append(lock_manager.lock(os.path.dirname(m_file)))
+    _lock_sources(lock_manager, data_files, meta_files)
 
     try:
+        # Finish or undo archivals that died in this archive.
+        recover(archive_dir, verbose)
+
         archival_map: Dict[str, List[str]] = collate_data(
             archive_dir,
             data_files,
@@ -224,6 +865,12 @@ def archive(
             schema,
             overwrite,
             verbose,
+            jobs=jobs,
+            pipeline=pipeline,
+            chunksize=chunksize,
+            raw=raw,
+            lock_timeout=lock_timeout,
+            stale_after=stale_after,
         )
     finally:
         lock_manager.release_all()
@@ -241,8 +888,11 @@ def archive(
     return syphon_build(
         cache_filepath,
         *newly_archived,
+        chunksize=chunksize,
         hash_filepath=hash_filepath,
         incremental=True,
+        jobs=jobs,
+        manifest=True,
         overwrite=True,
         post_hash=True,
         verbose=verbose,
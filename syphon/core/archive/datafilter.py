@@ -4,17 +4,57 @@
    Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
 
 """
-from typing import List
+from typing import Any, Dict, List, Sequence, Tuple
 
+from numpy import ndarray
 from pandas import DataFrame
 from sortedcontainers import SortedDict
 
+from ...schema import Schema
+
+
+def _group_positions(
+    columns: Sequence[int], datapool: DataFrame
+) -> List[Tuple[Tuple[Any, ...], ndarray]]:
+    """Group the rows of the datapool by the values of the given columns.
+
+    Columns are given by position, so no header is looked up. Groups are ordered as
+    if the datapool were split one column at a time, with the values of each column
+    visited in order of first appearance.
+
+    Returns:
+        A list of (key, positions) tuples. Each key holds a value for every column,
+        and the positions are the ascending row positions of the group.
+    """
+    groups: Dict[Any, ndarray] = datapool.groupby(
+        [datapool.iloc[:, column] for column in columns], sort=False
+    ).indices
+
+    # The first row position of every key prefix. Splitting one column at a time
+    # visits prefixes in the order of their first rows.
+    first_rows: Dict[Tuple[Any, ...], int] = dict()
+    keyed: List[Tuple[Tuple[Any, ...], ndarray]] = []
+    for key, positions in groups.items():
+        key = key if isinstance(key, tuple) else (key,)
+        keyed.append((key, positions))
+        for depth in range(1, len(key) + 1):
+            prefix = key[:depth]
+            first_rows[prefix] = min(first_rows.get(prefix, positions[0]), positions[0])
+
+    keyed.sort(
+        key=lambda pair: tuple(
+            first_rows[pair[0][:depth]] for depth in range(1, len(pair[0]) + 1)
+        )
+    )
+    return keyed
+
 
 def datafilter(schema: SortedDict, datapool: DataFrame, **kwargs) -> List[DataFrame]:
     """Splits a DataFrame based on the value of applicable columns.
 
     Each DataFrame object in the returned list will have a single value for
-    those columns contained in the schema.
+    those columns contained in the schema. Rows missing a value in any of those
+    columns are not included.
 
     Args:
         schema: Column names to use for filtering.
@@ -25,18 +65,34 @@ def datafilter(schema: SortedDict, datapool: DataFrame, **kwargs) -> List[DataFr
         values could be found.
     """
     result: List[DataFrame] = kwargs["filtered"].copy() if "filtered" in kwargs else []
+    result.extend(frame for _, frame in keyed_datafilter(schema, datapool))
+    return result
 
-    this_schema: SortedDict = schema.copy()
-    try:
-        _, header = this_schema.popitem(index=0)
-    except KeyError:
-        result.append(datapool)
-        return result
 
-    if header not in datapool.columns:
-        return result
+def keyed_datafilter(
+    schema: SortedDict, datapool: DataFrame
+) -> List[Tuple[Tuple[Any, ...], DataFrame]]:
+    """Splits a DataFrame like `datafilter`, keeping the value of each partition.
 
-    for value in datapool.get(header).drop_duplicates().values:
-        new_pool: DataFrame = datapool.loc[datapool.get(header) == value]
-        result = datafilter(this_schema, new_pool, filtered=result)
-    return result
+    Args:
+        schema: Column names to use for filtering. May be a compiled `Schema`.
+        datapool: Data to filter.
+
+    Returns:
+        A list of (key, DataFrame) tuples in the order given by `datafilter`. Each key
+        holds the value of every schema column in schema order. An empty list is
+        returned if no schema values could be found.
+    """
+    compiled = Schema.compile(schema)
+    if len(compiled) == 0:
+        return [((), datapool)]
+
+    try:
+        columns: Tuple[int, ...] = compiled.positions(datapool.columns)
+    except IndexError:
+        return []
+
+    return [
+        (key, datapool.iloc[positions])
+        for key, positions in _group_positions(columns, datapool)
+    ]
@@ -6,7 +6,7 @@
 """
 import os
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
 
 
 class MappingBehavior(Enum):
@@ -14,6 +14,12 @@ class MappingBehavior(Enum):
     ONE_TO_MANY = 1
 
 
+def _name(filepath: str) -> str:
+    """Return the filename of the given path without its extension."""
+    name, _ = os.path.splitext(os.path.basename(filepath))
+    return name
+
+
 def filemap(
     behavior: MappingBehavior, data: List[str], meta: List[str]
 ) -> Dict[str, List[str]]:
@@ -38,18 +44,19 @@ def filemap(
         the data file key.
 
         Empty if the requested behavior could not be performed on the
-        given file lists.
+        given file lists. Use `unmatched` to find the files left out.
     """
     result: Dict[str, List[str]] = dict()
 
     if behavior == MappingBehavior.ONE_TO_ONE and len(data) == len(meta):
-        # Associate one data file to a matching metadata file.
+        # Associate one data file to a matching metadata file. Metadata files are
+        # indexed by name, so each data file is matched with a single lookup. When
+        # names repeat, the last metadata file wins.
+        index: Dict[str, str] = {_name(metafile): metafile for metafile in meta}
         for datafile in data:
-            dataname, _ = os.path.splitext(os.path.basename(datafile))
-            for metafile in meta:
-                metaname, _ = os.path.splitext(os.path.basename(metafile))
-                if dataname == metaname:
-                    result[datafile] = [metafile]
+            metafile = index.get(_name(datafile))
+            if metafile is not None:
+                result[datafile] = [metafile]
 
     elif behavior == MappingBehavior.ONE_TO_MANY:
         # Associate each data file to all metadata files.
@@ -57,3 +64,28 @@ def filemap(
             result[datafile] = [metafile for metafile in meta]
 
     return result
+
+
+def unmatched(
+    fmap: Dict[str, List[str]], data: List[str], meta: List[str]
+) -> Tuple[List[str], List[str]]:
+    """Find the files that were left out of a data-metadata file pair map.
+
+    Args:
+        fmap: File map created by `filemap` from the given file lists.
+        data: Data file paths given to `filemap`.
+        meta: Metadata file paths given to `filemap`.
+
+    Returns:
+        A tuple of (data, meta) lists in the order given. Data files are those
+        without an entry in the file map, and metadata files are those not
+        associated with any data file.
+    """
+    matched: Set[str] = set()
+    for metafiles in fmap.values():
+        matched.update(metafiles)
+
+    return (
+        [datafile for datafile in data if datafile not in fmap],
+        [metafile for metafile in meta if metafile not in matched],
+    )
@@ -0,0 +1,281 @@
+"""syphon.core.archive.journal.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+from typing import IO, List, Optional, Tuple
+
+from .process import alive, host
+
+FILE_PREFIX: str = ".syphon-"
+FILE_SUFFIX: str = ".journal"
+
+
+def _read_records(
+    archive_dir: str, lines: List[str]
+) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """Return the staged files and the made directories recorded in a journal.
+
+    Raises:
+        TypeError: If a record is not a list of paths.
+        ValueError: If a record holds neither one nor two paths.
+    """
+    from json import JSONDecodeError, loads
+
+    staged: List[Tuple[str, str]] = []
+    directories: List[str] = []
+    for line in lines:
+        try:
+            paths: List[str] = loads(line)
+        except JSONDecodeError:
+            # A record cut short by the crash; its file was never created.
+            continue
+        if len(paths) == 1:
+            directories.append(os.path.join(archive_dir, paths[0]))
+        else:
+            temp, target = paths
+            staged.append(
+                (os.path.join(archive_dir, temp), os.path.join(archive_dir, target))
+            )
+    return (staged, directories)
+
+
+def _sync_directory(path: str) -> None:
+    """Flush the entries of a directory to disk, where the platform allows it."""
+    if os.name == "nt":
+        return
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _undo(staged: List[Tuple[str, str]], directories: List[str]) -> None:
+    """Remove staged files, then the given directories while they are empty."""
+    for temp, _ in staged:
+        try:
+            os.remove(temp)
+        except FileNotFoundError:
+            pass
+    for directory in reversed(directories):
+        try:
+            os.rmdir(directory)
+        except OSError:
+            # Holds files of another archival, or is already gone.
+            pass
+
+
+class Journal(object):
+    def __init__(self, archive_dir: str):
+        """A record of the files staged by an archival.
+
+        Staged files are hidden temporary files written beside their targets. Every
+        staged file and every directory made for one is recorded on disk before it is
+        created, and all staged files replace their targets in `commit`. If the
+        archival dies, then `recover` uses the journal to either finish the commit or
+        remove the staged files and the empty directories made for them, so no
+        partially written file is ever left at a target path.
+
+        A rollback leaves the directories in place, since another running archival
+        may be about to write into them.
+
+        Args:
+            archive_dir: Directory that holds the journal and every target file.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        from json import dumps
+        from uuid import uuid4
+
+        super().__init__()
+        self.archive_dir: str = os.path.abspath(archive_dir)
+        # Directories made by this journal, in the order they were made.
+        self.directories: List[str] = []
+        self.staged: List[Tuple[str, str]] = []
+        self.token: str = uuid4().hex
+        self.filepath: str = os.path.join(
+            self.archive_dir, f"{FILE_PREFIX}{self.token}{FILE_SUFFIX}"
+        )
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        self._file: Optional[IO[str]] = open(self.filepath, "x", encoding="utf-8")
+        self._record(dumps({"host": host(), "pid": os.getpid()}), sync=True)
+        _sync_directory(self.archive_dir)
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        try:
+            os.remove(self.filepath)
+        except FileNotFoundError:
+            # Already resolved by `recover`.
+            pass
+
+    def _record(self, line: str, sync: bool = False) -> None:
+        if self._file is None:
+            raise ValueError(f"Journal is closed @ {self.filepath}")
+        self._file.write(f"{line}\n")
+        self._file.flush()
+        if sync:
+            os.fsync(self._file.fileno())
+
+    def commit(self) -> None:
+        """Replace every target with its staged file and remove the journal.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        self._record("commit", sync=True)
+        for temp, target in self.staged:
+            try:
+                os.replace(temp, target)
+            except FileNotFoundError:
+                # Already replaced by `recover`.
+                pass
+        self._close()
+
+    def makedirs(self, path: str) -> None:
+        """Create a directory and its missing parents, recording each one made.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        from json import dumps
+
+        missing: List[str] = []
+        directory: str = os.path.abspath(path)
+        while not os.path.isdir(directory):
+            missing.append(directory)
+            parent: str = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+
+        for directory in reversed(missing):
+            self._record(
+                dumps([os.path.relpath(directory, self.archive_dir)]), sync=True
+            )
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                # Made by another archival in the meantime.
+                continue
+            self.directories.append(directory)
+
+    def rollback(self) -> None:
+        """Remove every staged file and the journal.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        _undo(self.staged, [])
+        self._close()
+
+    def stage(self, target: str) -> str:
+        """Record a target file and return the path of its staged file.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        from json import dumps
+
+        directory, name = os.path.split(os.path.abspath(target))
+        temp: str = os.path.join(directory, f".{name}.{self.token}.tmp")
+        # Synced, so the staged file is never on disk without its record.
+        self._record(
+            dumps(
+                [
+                    os.path.relpath(temp, self.archive_dir),
+                    os.path.relpath(target, self.archive_dir),
+                ]
+            ),
+            sync=True,
+        )
+        self.staged.append((temp, target))
+        return temp
+
+
+def recover(archive_dir: str, verbose: bool = False) -> List[str]:
+    """Resolve the journals left behind by archivals that did not finish.
+
+    Only journals of archival processes that are no longer running on this host are
+    resolved. The staged files of a committed journal replace their targets.
+    Otherwise, the staged files and the empty directories made for them are removed.
+    Journals of running or remote archivals are left alone, even once committed.
+
+    Returns:
+        A list of the resolved journal files.
+
+    Raises:
+        OSError: File operation error. Error type raised may be
+            a subclass of OSError.
+        ValueError: If a journal is malformed.
+    """
+    from json import JSONDecodeError, loads
+
+    try:
+        with os.scandir(archive_dir) as entries:
+            journals: List[str] = sorted(
+                entry.path
+                for entry in entries
+                if entry.name.startswith(FILE_PREFIX)
+                and entry.name.endswith(FILE_SUFFIX)
+            )
+    except FileNotFoundError:
+        return []
+
+    resolved: List[str] = []
+    for journal in journals:
+        with open(journal, "r", encoding="utf-8") as file:
+            lines: List[str] = file.read().splitlines()
+
+        committed: bool = len(lines) != 0 and lines[-1] == "commit"
+        owner: Optional[Tuple[str, int]] = None
+        directories: List[str] = []
+        staged: List[Tuple[str, str]] = []
+        try:
+            if len(lines) != 0:
+                header = loads(lines[0])
+                owner = (str(header["host"]), int(header["pid"]))
+            staged, directories = _read_records(
+                archive_dir, lines[1 : len(lines) - 1 if committed else len(lines)]
+            )
+        except (JSONDecodeError, KeyError, TypeError, ValueError) as err:
+            raise ValueError(f"Malformed journal file @ {journal}") from err
+
+        # Even a committed journal may still be replaying in its running archival.
+        if owner is None or owner[0] != host() or alive(owner[1]):
+            continue
+
+        if committed:
+            for temp, target in staged:
+                try:
+                    os.replace(temp, target)
+                except FileNotFoundError:
+                    pass
+        else:
+            _undo(staged, directories)
+        try:
+            os.remove(journal)
+        except FileNotFoundError:
+            # Resolved by another archival in the meantime.
+            continue
+        resolved.append(journal)
+        if verbose:
+            print(
+                f"{'Committed' if committed else 'Rolled back'} unfinished archival "
+                f"@ {journal}"
+            )
+
+    return resolved
@@ -5,7 +5,16 @@
 
 """
 import os
-from typing import List
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from .process import alive, host
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
 
 
 class LockManager(object):
@@ -14,12 +23,39 @@ class LockManager(object):
     A lock file is any file named #lock. Lock files allow
     communication between programs with lock file support to prevent
     the removal of files that may be in use.
+
+    Lock files are held with an advisory lock (flock, or msvcrt.locking on
+    Windows), so only one process can hold the lock file of a directory at a
+    time. Other processes wait for it to be released. The holder's process ID,
+    host, and the time it was locked are written to the lock file.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        stale_after: Optional[float] = None,
+        poll_interval: float = 0.05,
+        filename: str = "#lock",
+    ):
+        """Configure how long to wait for lock files held by other processes.
+
+        Args:
+            timeout: Seconds to wait for a lock file held by another process. Waits
+                indefinitely if not given.
+            stale_after: Seconds after which a held lock file is considered
+                abandoned. Lock files held by a process that no longer runs on this
+                host are always abandoned.
+            poll_interval: Seconds between attempts to take a held lock file.
+            filename: Lock file name. Defaults to "#lock".
+        """
         super().__init__()
-        self._filename = "#lock"
-        self._locks: List[str] = list()
+        self._filename = filename
+        # Open lock files and the number of times each was locked.
+        self._counts: Dict[str, int] = dict()
+        self._handles: Dict[str, int] = dict()
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.timeout = timeout
 
     @property
     def filename(self) -> str:
@@ -29,32 +65,110 @@ class LockManager(object):
     @property
     def locks(self) -> list:
         """List of current lock files."""
-        return self._locks
+        return list(self._handles)
 
     @staticmethod
-    def _delete(filepath: str):
-        """Delete a given file.
+    def _record(fd: int):
+        """Write the holder of a lock file into it.
 
         Raises:
             OSError: File operation error. Error type raised may be
                 a subclass of OSError.
         """
-        os.remove(filepath)
+        from json import dumps
+
+        holder = dumps({"pid": os.getpid(), "host": host(), "time": time.time()})
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.ftruncate(fd, 0)
+        os.write(fd, holder.encode("utf-8"))
+
+    @staticmethod
+    def _same_file(fd: int, filepath: str) -> bool:
+        """Whether an open file is still the file at the given path."""
+        try:
+            current = os.stat(filepath)
+        except FileNotFoundError:
+            return False
+        opened = os.fstat(fd)
+        return (current.st_dev, current.st_ino) == (opened.st_dev, opened.st_ino)
 
     @staticmethod
-    def _touch(filepath: str):
-        """Linux touch-like command.
+    def _try_lock(fd: int) -> bool:
+        """Take the advisory lock of an open file without waiting.
+
+        Returns:
+            True if the lock was taken, False if another holder has it.
+        """
+        if sys.platform == "win32":
+            os.lseek(fd, 0, os.SEEK_SET)
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            except OSError:
+                return False
+        else:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+        return True
+
+    @staticmethod
+    def _unlock(filepath: str, fd: int):
+        """Delete a held lock file, then release and close it.
+
+        The lock file is only deleted if it is still the file that was locked.
 
         Raises:
             OSError: File operation error. Error type raised may be
                 a subclass of OSError.
         """
-        with open(filepath, "a"):
-            os.utime(filepath, None)
+        delete: bool = LockManager._same_file(fd, filepath)
+        try:
+            if sys.platform == "win32":
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            elif delete:
+                # Deleted while locked, so waiting processes see the change.
+                delete = False
+                os.remove(filepath)
+        except FileNotFoundError:
+            pass
+        finally:
+            os.close(fd)
+
+        if delete:
+            try:
+                os.remove(filepath)
+            except (FileNotFoundError, PermissionError):
+                # Opened by a waiting process, which will take it.
+                pass
+
+    def _stale(self, fd: int) -> bool:
+        """Whether the held lock file open as fd was abandoned by its holder.
+
+        The holder is read from the open file rather than its path, so a lock file
+        created at the same path in the meantime is never judged by another's holder.
+        """
+        from json import loads
+
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            holder = loads(os.read(fd, 4096).decode("utf-8"))
+            pid, holder_host = int(holder["pid"]), str(holder["host"])
+            locked = holder["time"]
+        except (OSError, KeyError, TypeError, UnicodeDecodeError, ValueError):
+            return False
+
+        if holder_host == host() and not alive(pid):
+            return True
+        return self.stale_after is not None and time.time() - locked > self.stale_after
 
     def lock(self, path: str) -> str:
         """Create a lock file in a given directory.
 
+        A directory already locked by this manager is not locked again. Instead, the
+        lock file must be released once more before it is removed.
+
         Args:
             path (str): Directory to lock.
 
@@ -64,18 +178,88 @@ class LockManager(object):
         Raises:
             OSError: File operation error. Error type raised may be
                 a subclass of OSError.
+            TimeoutError: The lock file is held by another process for longer than
+                the timeout.
         """
         filepath = os.path.join(os.path.abspath(path), self.filename)
 
-        LockManager._touch(filepath)
+        if filepath in self._counts:
+            self._counts[filepath] += 1
+            return filepath
+
+        deadline: Optional[float] = (
+            None if self.timeout is None else time.monotonic() + self.timeout
+        )
+        while True:
+            fd = os.open(filepath, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0))
+            try:
+                if LockManager._try_lock(fd):
+                    if LockManager._same_file(fd, filepath):
+                        break
+                    # The lock file was deleted by its last holder, so start over.
+                    os.close(fd)
+                    continue
+                # Only the stale lock file itself is removed. Another waiter may
+                # already have replaced it with a fresh one.
+                if self._stale(fd) and LockManager._same_file(fd, filepath):
+                    try:
+                        os.remove(filepath)
+                    except FileNotFoundError:
+                        pass
+                    os.close(fd)
+                    continue
+            except BaseException:
+                os.close(fd)
+                raise
+
+            os.close(fd)
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for lock file @ {filepath}")
+            time.sleep(self.poll_interval)
 
-        if filepath not in self._locks:
-            self._locks.append(filepath)
+        try:
+            LockManager._record(fd)
+        except BaseException:
+            LockManager._unlock(filepath, fd)
+            raise
+
+        self._counts[filepath] = 1
+        self._handles[filepath] = fd
 
         return filepath
 
+    def lock_all(self, paths: Iterable[str]) -> List[str]:
+        """Lock each unique directory of the given paths once.
+
+        Directories are locked in sorted order, so managers locking overlapping
+        directories cannot deadlock. Nothing is left locked by this call if an
+        error is raised.
+
+        Args:
+            paths (Iterable[str]): Directories to lock.
+
+        Returns:
+            List[str]: Absolute filepaths of the lock files in the order locked.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+            TimeoutError: A lock file is held by another process for longer than
+                the timeout.
+        """
+        directories: Set[str] = {os.path.abspath(path) for path in paths}
+        result: List[str] = []
+        try:
+            for directory in sorted(directories):
+                result.append(self.lock(directory))
+        except BaseException:
+            for filepath in result:
+                self.release(filepath)
+            raise
+        return result
+
     def release(self, filepath: str):
-        """Remove the given lock file.
+        """Remove the given lock file once it was released as often as it was locked.
 
         Args:
             filepath (str): Location of a lock file.
@@ -86,12 +270,11 @@ class LockManager(object):
         """
         fullpath: str = os.path.abspath(filepath)
 
-        if fullpath in self._locks:
-            self._locks.remove(fullpath)
-            try:
-                LockManager._delete(fullpath)
-            except FileNotFoundError:
-                pass
+        if fullpath in self._counts:
+            self._counts[fullpath] -= 1
+            if self._counts[fullpath] == 0:
+                del self._counts[fullpath]
+                LockManager._unlock(fullpath, self._handles.pop(fullpath))
 
     def release_all(self):
         """Remove all lock files.
@@ -100,9 +283,7 @@ class LockManager(object):
             OSError: File operation error. Error type raised may be
                 a subclass of OSError.
         """
-        while len(self._locks) != 0:
-            lock = self._locks.pop()
-            try:
-                LockManager._delete(lock)
-            except FileNotFoundError:
-                pass
+        self._counts.clear()
+        while len(self._handles) != 0:
+            lock, fd = self._handles.popitem()
+            LockManager._unlock(lock, fd)
@@ -0,0 +1,31 @@
+"""syphon.core.archive.process.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+
+def alive(pid: int) -> bool:
+    """Whether a process with the given ID is running on this host.
+
+    Always True where process IDs cannot be probed without side effects.
+    """
+    if os.name == "nt":
+        return True
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def host() -> str:
+    """Name of this host, as recorded by journals and lock files."""
+    from socket import gethostname
+
+    return gethostname()
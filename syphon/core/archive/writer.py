@@ -0,0 +1,255 @@
+"""syphon.core.archive.writer.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+from collections import OrderedDict
+from typing import IO, Dict, Optional, Set
+
+from .journal import Journal
+from .lockmanager import LockManager
+
+
+class ArchiveWriter(object):
+    """Archive file helper."""
+
+    def __init__(
+        self,
+        journal: Optional[Journal] = None,
+        lock_manager: Optional[LockManager] = None,
+        overwrite: bool = True,
+        max_handles: int = 64,
+    ):
+        """Combine the file system operations of an archival.
+
+        Directories are listed once, created once, and output files stay open between
+        writes, which keeps metadata operations to a minimum on network file systems.
+        Open files must be closed with `close`. The number of directory listings,
+        directory creations, and file opens are counted in `counts`.
+
+        With a journal, files are staged and only replace their targets once the
+        writer is committed, and directories are made through the journal. Used as a
+        context manager, the writer commits if no error was raised and rolls back
+        otherwise.
+
+        With a lock manager, the directories of the staged files are locked in order
+        while they are committed, so concurrent writers to disjoint directories
+        never wait on each other, and colliding commits are serialized.
+
+        Args:
+            journal: Journal that stages the written files.
+            lock_manager: Lock manager that locks directories during a commit.
+            overwrite: Whether a commit may replace files created by another process
+                after they were staged.
+            max_handles: Number of output files kept open at once. The least recently
+                written file is closed when another must be opened.
+
+        Raises:
+            ValueError: If max_handles is less than 1.
+        """
+        if max_handles < 1:
+            raise ValueError(f"Max handles must be at least 1, received {max_handles}")
+
+        super().__init__()
+        self._counts: Dict[str, int] = {"scandir": 0, "makedirs": 0, "open": 0}
+        self._created: Set[str] = set()
+        self._handles: "OrderedDict[str, IO[str]]" = OrderedDict()
+        self._journal: Optional[Journal] = journal
+        self._listings: Dict[str, Set[str]] = dict()
+        self._lock_manager: Optional[LockManager] = lock_manager
+        self._max_handles = max_handles
+        self._overwrite = overwrite
+        # Staged files whose target did not exist when it was staged.
+        self._new: Set[str] = set()
+        self._staged: Dict[str, str] = dict()
+        self._written: Set[str] = set()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, *_) -> None:
+        if self._journal is None:
+            self.close()
+        elif exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Number of calls made to each file system operation."""
+        return self._counts
+
+    def _listing(self, directory: str) -> Set[str]:
+        """Return the normalized names of the entries in a directory.
+
+        The directory is only listed the first time it is given. A nonexistent
+        directory has no entries.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        if directory not in self._listings:
+            self._counts["scandir"] += 1
+            try:
+                with os.scandir(directory) as entries:
+                    self._listings[directory] = {
+                        os.path.normcase(entry.name) for entry in entries
+                    }
+                self._created.add(directory)
+            except FileNotFoundError:
+                self._listings[directory] = set()
+        return self._listings[directory]
+
+    def _release(self, handle: IO[str]) -> None:
+        """Close an output file, syncing staged files to disk before a commit."""
+        if self._journal is not None:
+            handle.flush()
+            os.fsync(handle.fileno())
+        handle.close()
+
+    def close(self) -> None:
+        """Close all open output files.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        while len(self._handles) != 0:
+            _, handle = self._handles.popitem(last=False)
+            self._release(handle)
+
+    def commit(self) -> None:
+        """Close all open output files and replace the targets of staged files.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        self.close()
+        if self._journal is None:
+            return
+
+        if self._lock_manager is None:
+            self._journal.commit()
+            return
+
+        try:
+            # Directories are always locked in the same order, so concurrent commits
+            # cannot deadlock.
+            self._lock_manager.lock_all(os.path.dirname(t) for t in self._staged)
+
+            if not self._overwrite:
+                for target in sorted(self._new):
+                    if os.path.exists(target):
+                        raise FileExistsError(
+                            f"File already exists in archive @ {target}"
+                        )
+
+            self._journal.commit()
+        except BaseException:
+            self._journal.rollback()
+            raise
+        finally:
+            self._lock_manager.release_all()
+
+    def rollback(self) -> None:
+        """Close all open output files and remove the staged files.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        while len(self._handles) != 0:
+            _, handle = self._handles.popitem(last=False)
+            handle.close()
+        if self._journal is not None:
+            self._journal.rollback()
+
+    def exists(self, filepath: str) -> bool:
+        """Whether a file existed before this run or was written by this writer.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        filepath = os.path.abspath(filepath)
+        if filepath in self._written:
+            return True
+        directory, name = os.path.split(filepath)
+        return os.path.normcase(name) in self._listing(directory)
+
+    def makedirs(self, path: str) -> None:
+        """Create a directory and its parents unless this writer has seen it before.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        path = os.path.abspath(path)
+        if path not in self._created:
+            self._counts["makedirs"] += 1
+            if self._journal is None:
+                os.makedirs(path, exist_ok=True)
+            else:
+                self._journal.makedirs(path)
+            self._created.add(path)
+
+    def write(self, filepath: str, text: str, append: bool = False) -> None:
+        """Write text to a file.
+
+        Text is appended if the file is already open. Otherwise, the file is opened
+        in append mode when append is True, or truncated when it is False.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        filepath = os.path.abspath(filepath)
+        handle = self._handles.get(filepath)
+        if handle is not None and not append:
+            del self._handles[filepath]
+            self._release(handle)
+            handle = None
+
+        if handle is None:
+            if len(self._handles) >= self._max_handles:
+                _, oldest = self._handles.popitem(last=False)
+                self._release(oldest)
+
+            path: str = filepath
+            if self._journal is not None:
+                if filepath not in self._staged:
+                    if not self.exists(filepath):
+                        self._new.add(filepath)
+                    self._staged[filepath] = self._journal.stage(filepath)
+                    if append and os.path.exists(filepath):
+                        from shutil import copyfile
+
+                        # Staged appends start from the current target.
+                        copyfile(filepath, self._staged[filepath])
+                path = self._staged[filepath]
+
+            self._counts["open"] += 1
+            try:
+                handle = open(
+                    path, "a" if append else "w", encoding="utf-8", newline=""
+                )
+            except FileNotFoundError:
+                # The empty directory was removed by `recover` after it was made.
+                directory: str = os.path.dirname(filepath)
+                self._created.discard(directory)
+                self.makedirs(directory)
+                handle = open(
+                    path, "a" if append else "w", encoding="utf-8", newline=""
+                )
+            self._handles[filepath] = handle
+
+            self._written.add(filepath)
+        else:
+            self._handles.move_to_end(filepath)
+
+        handle.write(text)
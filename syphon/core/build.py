@@ -4,23 +4,401 @@
    Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
 
 """
-import os.path
+import os
 import pathlib
-from typing import Optional, Tuple
+from concurrent.futures import Executor
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 
 import syphon.core.check
 import syphon.hash
+import syphon.manifest
+
+from ._parallel import ordered, pool
 
 LINUX_HIDDEN_CHAR: str = "."
 
 
+def _append(
+    cache_path: pathlib.Path,
+    sources: List[str],
+    columns: List[str],
+    chunksize: Optional[int],
+    executor: Optional[Executor],
+    jobs: int,
+    entry: Optional[syphon.hash.HashEntry],
+    verbose: bool,
+) -> None:
+    """Append the rows of all sources to the end of the cache file.
+
+    The cache file is truncated to its original size if appending fails.
+
+    If an entry is given, then it must already hold the hash of the cache contents.
+    Its hash is extended with the appended text.
+    """
+    size: int = cache_path.stat().st_size
+    try:
+        with cache_path.open("at", encoding="utf-8", newline="") as output:
+            writer = None if entry is None else syphon.hash.HashWriter(output, entry)
+            write = output.write if writer is None else writer.write
+
+            _write_rows(
+                write, sources, columns, chunksize, executor, jobs, None, verbose
+            )
+
+            if writer is not None:
+                writer.close()
+    except BaseException:
+        os.truncate(cache_path, size)
+        raise
+
+
+def _appendable_columns(
+    cache_path: pathlib.Path, columns: List[str]
+) -> Optional[List[str]]:
+    """Return the cache columns if rows with the given columns can be appended.
+
+    Every column must already exist in the cache and the cache must end with a
+    complete line. Otherwise, None is returned.
+    """
+    with cache_path.open("rb") as cache:
+        cache.seek(0, 2)
+        if cache.tell() == 0:
+            return None
+        cache.seek(cache.tell() - 1)
+        if cache.read(1) != b"\n":
+            return None
+
+    cache_columns: List[str] = _read_columns(str(cache_path))
+    return cache_columns if set(columns).issubset(cache_columns) else None
+
+
+def _combine(
+    cache_filepath: str,
+    sources: List[str],
+    extend_cache: bool,
+    chunksize: Optional[int],
+    jobs: int,
+    verified: Optional[syphon.hash.HashEntry],
+    post_hash: bool,
+    verbose: bool,
+) -> Optional[syphon.hash.HashEntry]:
+    """Write the rows of all sources into the cache file.
+
+    Returns an entry holding the hash of the cache file if post_hash is True.
+    """
+    with pool(jobs) as executor:
+        if extend_cache:
+            return _extend(
+                cache_filepath,
+                sources,
+                chunksize,
+                executor,
+                jobs,
+                verified,
+                post_hash,
+                verbose,
+            )
+
+        entry = syphon.hash.HashEntry(cache_filepath) if post_hash else None
+        columns: List[str] = _union_columns(sources, executor)
+        _write(
+            pathlib.Path(cache_filepath),
+            sources,
+            columns,
+            chunksize,
+            executor,
+            jobs,
+            entry,
+            verbose,
+        )
+        return entry
+
+
+def _extend(
+    cache_filepath: str,
+    sources: List[str],
+    chunksize: Optional[int],
+    executor: Optional[Executor],
+    jobs: int,
+    verified: Optional[syphon.hash.HashEntry],
+    post_hash: bool,
+    verbose: bool,
+) -> Optional[syphon.hash.HashEntry]:
+    """Add the rows of all sources to an existing cache file.
+
+    If possible, rows are appended without reading the existing cache rows. Otherwise,
+    the existing cache is used as the first source of a new cache file.
+
+    If given, the verified entry must hold the hash of the current cache contents. Its
+    hash is extended instead of hashing the cache again.
+
+    The intermediate hash state cannot outlive the build. Objects from hashlib do not
+    expose or serialize their internal state, so a later build must read the cache
+    again to verify it before extending its hash.
+    """
+    cache_path = pathlib.Path(cache_filepath)
+    entry: Optional[syphon.hash.HashEntry] = None
+
+    cache_columns: Optional[List[str]] = _appendable_columns(
+        cache_path, _union_columns(sources, executor)
+    )
+    if cache_columns is not None:
+        if post_hash:
+            entry = (
+                syphon.hash.HashEntry(cache_filepath) if verified is None else verified
+            )
+            # Hash the current cache contents, unless that was already done.
+            _ = entry.hash
+        _append(
+            cache_path,
+            sources,
+            cache_columns,
+            chunksize,
+            executor,
+            jobs,
+            entry,
+            verbose,
+        )
+        return entry
+
+    if post_hash:
+        entry = syphon.hash.HashEntry(cache_filepath)
+    sources = [str(cache_path)] + sources
+    columns: List[str] = _union_columns(sources, executor)
+    _write(cache_path, sources, columns, chunksize, executor, jobs, entry, verbose)
+    return entry
+
+
+def _load_manifest(
+    manifest_filepath: str, cache_filepath: str
+) -> Optional[syphon.manifest.Manifest]:
+    """Return the manifest of the cache file or None if it cannot be trusted."""
+    try:
+        result = syphon.manifest.Manifest.load(manifest_filepath)
+    except (OSError, ValueError):
+        return None
+    return result if result.describes(cache_filepath) else None
+
+
+def _read_columns(filepath: str) -> List[str]:
+    """Return the column headers of a CSV file without reading any rows."""
+    return list(pd.read_csv(filepath, dtype=str, nrows=0).columns)
+
+
+def _read_frames(filepath: str, chunksize: Optional[int]) -> Iterator[pd.DataFrame]:
+    """Yield the rows of a CSV file in chunks, or all at once without a chunksize."""
+    if chunksize is None:
+        yield pd.DataFrame(pd.read_csv(filepath, dtype=str))
+    else:
+        yield from pd.read_csv(filepath, dtype=str, chunksize=chunksize)
+
+
+def _record(
+    cache_filepath: str,
+    sources: List[str],
+    tracked: Optional[syphon.manifest.Manifest],
+    hash_filepath: str,
+    entry: Optional[syphon.hash.HashEntry],
+) -> None:
+    """Update the manifest and the hash file after the cache file is written."""
+    if tracked is not None:
+        tracked.record(*sources)
+        tracked.record_cache(cache_filepath)
+        tracked.save()
+
+    if entry is not None:
+        hash_path = pathlib.Path(hash_filepath)
+        if not hash_path.exists():
+            hash_path.touch()
+
+        with syphon.hash.HashFile(hash_filepath) as hashfile:
+            hashfile.update(entry)
+
+
+def _render(
+    source: str, columns: List[str], chunksize: Optional[int]
+) -> Iterator[Tuple[Tuple[int, int], str]]:
+    """Yield the shape and CSV text of each chunk of a source, laid out by columns."""
+    data: pd.DataFrame
+    for data in _read_frames(source, chunksize):
+        yield _render_frame(data, columns)
+
+
+def _render_all(
+    source: str, columns: List[str], chunksize: Optional[int]
+) -> List[Tuple[Tuple[int, int], str]]:
+    """Process pool entry point for `_render`."""
+    return list(_render(source, columns, chunksize))
+
+
+def _render_frame(
+    data: pd.DataFrame, columns: List[str]
+) -> Tuple[Tuple[int, int], str]:
+    """Return the shape and CSV text of a chunk, laid out by columns."""
+    return (data.shape, data.reindex(columns=columns).to_csv(header=False, index=False))
+
+
+def _rendered_sources(
+    sources: List[str],
+    columns: List[str],
+    chunksize: Optional[int],
+    executor: Optional[Executor],
+    jobs: int,
+) -> Iterator[Tuple[str, Iterable[Tuple[Tuple[int, int], str]]]]:
+    """Yield each source with its rendered chunks in the order sources were given.
+
+    With an executor, up to twice as many sources as there are jobs are rendered
+    ahead of the source being yielded. With a chunksize as well, chunks are read in
+    order by this process and rendered by the executor instead, so that no more than
+    twice as many chunks as there are jobs are held at once.
+    """
+    if executor is None:
+        for source in sources:
+            yield (source, _render(source, columns, chunksize))
+        return
+
+    if chunksize is not None:
+        for source in sources:
+            yield (
+                source,
+                ordered(
+                    _render_frame,
+                    ((data, columns) for data in _read_frames(source, chunksize)),
+                    executor,
+                    2 * jobs,
+                ),
+            )
+        return
+
+    yield from zip(
+        sources,
+        ordered(
+            _render_all,
+            ((source, columns, chunksize) for source in sources),
+            executor,
+            2 * jobs,
+        ),
+    )
+
+
+def _union_columns(
+    sources: List[str], executor: Optional[Executor] = None
+) -> List[str]:
+    """Return every column header of the given sources in order of appearance."""
+    headers: Iterable[List[str]] = (
+        map(_read_columns, sources)
+        if executor is None
+        else executor.map(_read_columns, sources)
+    )
+
+    columns: List[str] = []
+    known: Set[str] = set()
+    for header in headers:
+        for column in header:
+            if column not in known:
+                known.add(column)
+                columns.append(column)
+    return columns
+
+
+def _unbuilt_files(
+    tracked: syphon.manifest.Manifest, files: Iterable[str], verbose: bool
+) -> Optional[List[str]]:
+    """Return files missing from the manifest or None if a full build is required."""
+    added, stale = tracked.diff(files)
+    if len(stale) == 0:
+        return added
+
+    if verbose:
+        for filepath in stale:
+            print(f"Changed since the last build: {filepath}")
+    return None
+
+
+def _write(
+    cache_path: pathlib.Path,
+    sources: List[str],
+    columns: List[str],
+    chunksize: Optional[int],
+    executor: Optional[Executor],
+    jobs: int,
+    entry: Optional[syphon.hash.HashEntry],
+    verbose: bool,
+) -> None:
+    """Write the rows of all sources into a new cache file in a single pass.
+
+    Missing columns are left empty. Output is written beside the cache and moved into
+    place once complete, which allows the cache itself to be one of the sources.
+
+    If an entry is given, then its hash is calculated from the written text.
+    """
+    temp_path = cache_path.with_name(f"{LINUX_HIDDEN_CHAR}{cache_path.name}.tmp")
+    try:
+        with temp_path.open("wt", encoding="utf-8", newline="") as output:
+            writer = None if entry is None else syphon.hash.HashWriter(output, entry)
+            write = output.write if writer is None else writer.write
+
+            write(pd.DataFrame(columns=columns).to_csv(index=False))
+            _write_rows(write, sources, columns, chunksize, executor, jobs, 0, verbose)
+
+            if writer is not None:
+                writer.close()
+        os.replace(temp_path, cache_path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+def _write_rows(
+    write: Callable[[str], int],
+    sources: List[str],
+    columns: List[str],
+    chunksize: Optional[int],
+    executor: Optional[Executor],
+    jobs: int,
+    rows: Optional[int],
+    verbose: bool,
+) -> None:
+    """Write the rows of all sources, laid out by columns, in their given order.
+
+    If more than one job is requested, then sources are parsed in a process pool and
+    written in their original order, so the output does not depend on the job count.
+
+    The number of rows already in the cache is only used for verbose output and may be
+    None if unknown.
+    """
+    for source, rendered in _rendered_sources(
+        sources, columns, chunksize, executor, jobs
+    ):
+        if verbose:
+            print(f"Building from {source}")
+
+        for shape, text in rendered:
+            write(text)
+
+            if verbose and rows is None:
+                print(f"Appending data {shape} onto cache")
+            elif verbose and rows is not None:
+                print(
+                    f"Building data {shape} onto cache "
+                    + f"{(rows, len(columns))} => "
+                    + f"{(rows + shape[0], len(columns))}"
+                )
+
+            if rows is not None:
+                rows += shape[0]
+
+
 def build(
     cache_filepath: str,
     *files: str,
+    chunksize: Optional[int] = None,
     hash_filepath: Optional[str] = None,
     incremental: bool = False,
+    jobs: int = 1,
+    manifest: bool = False,
     overwrite: bool = False,
     post_hash: bool = True,
     verbose: bool = False,
@@ -32,13 +410,28 @@ def build(
     The value of the "incremental" argument is treated as False if the cache does not
     exist.
 
+    When a manifest is used, the files built into the cache are recorded in a manifest
+    file beside the cache (see `syphon.manifest.default_filepath`). If the cache is
+    unchanged since the manifest was written, then a subsequent non-incremental build
+    only adds rows from files missing from the manifest. A full build is performed if a
+    recorded file changed or is not among the given files. Incremental builds update an
+    existing manifest, but never create one.
+
     Args:
         cache_filepath: Path to the target output file.
         *files: CSV files to combine.
+        chunksize: Number of rows to read from a file at once. If not given, then each
+            file is read in its entirety. With more than one job, at most twice as
+            many chunks as there are jobs are held in memory, but files are then read
+            by this process alone and only rendering runs in parallel.
         hash_filepath: Path to a file containing a SHA256 sum of the cache. If not
             given, then the default is calculated by joining the cache directory with
             `syphon.core.check.DEFAULT_FILE`.
         incremental: Whether a build should be performed using an existing cache.
+        jobs: Number of processes used to parse files. Output does not depend on the
+            number of jobs. Without a chunksize, up to twice as many whole files as
+            there are jobs are held in memory at once.
+        manifest: Whether to track the files built into the cache in a manifest file.
         overwrite: Whether an existing cache file should be replaced.
         post_hash: Whether to hash the cache upon completion.
         verbose: Whether activities should be printed to the standard output.
@@ -49,6 +442,7 @@ def build(
     Raises:
         OSError: File operation error. Error type raised may be
             a subclass of OSError.
+        ValueError: Chunksize or jobs is less than 1.
         FileExistsError: Cache file exists and overwrite is
             False.
     """
@@ -66,6 +460,20 @@ def build(
         else hash_filepath
     )
 
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f"Chunksize must be at least 1, received {chunksize}")
+
+    if jobs < 1:
+        raise ValueError(f"Jobs must be at least 1, received {jobs}")
+
+    manifest_filepath: str = syphon.manifest.default_filepath(cache_filepath)
+    tracked: Optional[syphon.manifest.Manifest] = None
+    # Holds the hash of the verified cache contents during incremental builds.
+    verified: Optional[syphon.hash.HashEntry] = None
+
+    # Whether the existing cache contributes rows to this build.
+    extend_cache = False
+    sources: List[str] = list(files)
     if cache_path.exists():
         if not cache_path.is_file():
             raise ValueError(f"Build output is not a file @ {cache_path}")
@@ -73,50 +481,46 @@ def build(
         if not overwrite:
             raise FileExistsError(f"Build output already exists @ {cache_path}")
 
-        if incremental and not syphon.core.check.check(
-            cache_filepath, hash_filepath=hash_filepath, verbose=verbose
-        ):
-            # NOTE: the check function handles printing status, if necessary.
-            return False
+        if manifest:
+            tracked = _load_manifest(manifest_filepath, cache_filepath)
 
-        cache = (
-            pd.DataFrame(pd.read_csv(cache_path, dtype=str))
-            if incremental
-            else pd.DataFrame()
-        )
-    else:
-        cache = pd.DataFrame()
+        if incremental:
+            verified = syphon.hash.HashEntry(cache_filepath)
+            if not syphon.core.check.check_entry(
+                verified, hash_filepath=hash_filepath, verbose=verbose
+            ):
+                # NOTE: the check function handles printing status, if necessary.
+                return False
+            extend_cache = True
+        elif tracked is not None:
+            added: Optional[List[str]] = _unbuilt_files(tracked, files, verbose)
+            if added is None:
+                tracked = None
+            elif len(added) == 0:
+                # Refreshes entries of files that were touched but not changed.
+                tracked.save()
+                if verbose:
+                    print(f"Cache is up to date @ {cache_filepath}")
+                return True
+            else:
+                extend_cache = True
+                sources = added
 
-    for file in files:
-        if verbose:
-            print(f"Building from {file}")
-
-        data = pd.DataFrame(pd.read_csv(file, dtype=str))
+    if manifest and not extend_cache:
+        # Full builds start a new manifest.
+        tracked = syphon.manifest.Manifest(manifest_filepath)
 
-        if verbose:
-            data_shape: Tuple[int, int] = data.shape
-            cache_pre_shape: Tuple[int, int] = cache.shape
-
-        cache = cache.append(data)
-
-        if verbose:
-            print(
-                f"Building data {data_shape} onto cache "
-                + f"{cache_pre_shape} => {cache.shape}"
-            )
-
-        cache.reset_index(drop=True, inplace=True)
-
-    cache.to_csv(cache_filepath, index=False)
-
-    hash_path = pathlib.Path(hash_filepath)
-    if post_hash:
-        if not hash_path.exists():
-            hash_path.touch()
-        new_entry = syphon.hash.HashEntry(cache_filepath)
-
-        with syphon.hash.HashFile(hash_filepath) as hashfile:
-            hashfile.update(new_entry)
+    new_entry: Optional[syphon.hash.HashEntry] = _combine(
+        cache_filepath,
+        sources,
+        extend_cache,
+        chunksize,
+        jobs,
+        verified,
+        post_hash,
+        verbose,
+    )
+    _record(cache_filepath, sources, tracked, hash_filepath, new_entry)
 
     if verbose:
         print(f"Built {cache_filepath}")
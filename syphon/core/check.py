@@ -6,12 +6,114 @@
 """
 import os.path
 import pathlib
-from typing import Callable, Optional
+import time
+from typing import Callable, Dict, Iterator, List
+from typing import NamedTuple as _NamedTuple
+from typing import Optional, Tuple
 
 import syphon.errors
 import syphon.hash
 
 DEFAULT_FILE = ".sha256sums"
+STAT_FILE_SUFFIX = ".stat"
+
+# Files modified this recently may change again without changing their recorded
+# modification time, so they are never trusted by a quick check.
+_RACY_NS: int = 2 * 10**9
+
+
+class _StatRecord(_NamedTuple):
+    # Declaration order affects parameter order!
+    size: int
+    mtime_ns: int
+    inode: int
+    hash: str
+
+
+def _load_stat_records(hash_filepath: str) -> Dict[str, _StatRecord]:
+    """Read the records a quick check trusts, or nothing if there are none."""
+    from json import loads
+
+    try:
+        with open(f"{hash_filepath}{STAT_FILE_SUFFIX}", "r", encoding="utf-8") as file:
+            content = loads(file.read())
+        return {key: _StatRecord(*record) for key, record in content.items()}
+    except (AttributeError, OSError, TypeError, ValueError):
+        return dict()
+
+
+def _record_stats(
+    hash_filepath: str,
+    records: Dict[str, _StatRecord],
+    entries: List[syphon.hash.HashEntry],
+) -> None:
+    """Record the stats of the verified targets of the given entries."""
+    from json import dumps
+
+    now: int = int(time.time() * 10**9)
+    for entry in entries:
+        try:
+            stat = os.stat(entry.filepath)
+        except OSError:
+            continue
+        if now - stat.st_mtime_ns < _RACY_NS:
+            continue
+        records[_stat_key(str(entry.filepath))] = _StatRecord(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            inode=stat.st_ino,
+            hash=entry.hash,
+        )
+
+    stat_path = pathlib.Path(f"{hash_filepath}{STAT_FILE_SUFFIX}")
+    temp_path = stat_path.with_name(f"{stat_path.name}.tmp")
+    try:
+        with temp_path.open("w", encoding="utf-8") as file:
+            file.write(dumps({k: list(v) for k, v in records.items()}, indent=2))
+        os.replace(temp_path, stat_path)
+    except OSError:
+        # Failing to record only costs the next quick check a full hash.
+        pass
+
+
+def _stat_key(filepath: str) -> str:
+    return os.path.normcase(os.path.abspath(filepath))
+
+
+def _unchanged(
+    expected_entry: syphon.hash.HashEntry, records: Dict[str, _StatRecord]
+) -> bool:
+    """Whether the target of the entry matches its record from a previous check."""
+    record: Optional[_StatRecord] = records.get(_stat_key(str(expected_entry.filepath)))
+    if record is None or record.hash != expected_entry.hash:
+        return False
+    try:
+        stat = os.stat(expected_entry.filepath)
+    except OSError:
+        return False
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino) == record[:3]
+
+
+def _print_throughput(filepath: str, size: int, seconds: float) -> None:
+    megabytes: float = size / (1024 * 1024)
+    rate: str = f"{megabytes / seconds:.1f} MiB/s" if seconds > 0 else "n/a"
+    print(f"Hashed {megabytes:.1f} MiB from {filepath} in {seconds:.3f} s ({rate})")
+
+
+def _verify(expected_entry: syphon.hash.HashEntry) -> Optional[bool]:
+    """Whether the target of the entry matches the entry's hash.
+
+    Returns None if the target could not be read.
+    """
+    actual_entry = syphon.hash.HashEntry(
+        str(expected_entry.filepath),
+        binary=expected_entry.binary,
+        hash_type=expected_entry.hash_type,
+    )
+    try:
+        return expected_entry.hash == actual_entry.hash
+    except OSError:
+        return None
 
 
 def check(
@@ -20,6 +122,7 @@ def check(
     hash_line_split: Optional[
         Callable[[str], Optional[syphon.hash.SplitResult]]
     ] = None,
+    quick: bool = False,
     verbose: bool = False,
 ) -> bool:
     # NOTE:
@@ -34,17 +137,162 @@ def check(
         hash_line_split: A callable object that returns a `syphon.hash.SplitResult`
             from a given line or None if the line is in an unexpected format. Returning
             None raises a MalformedLineError.
+        quick: Whether to trust a cache file whose size, modification time, and inode
+            are unchanged since it last passed a quick check. Defaults to False.
         verbose: Whether to print what is being done to the standard output.
 
     Returns:
         True if the cache file passed the integrity check, False otherwise.
     """
 
+    return check_entry(
+        syphon.hash.HashEntry(cache_filepath),
+        hash_filepath=hash_filepath,
+        hash_line_split=hash_line_split,
+        quick=quick,
+        verbose=verbose,
+    )
+
+
+def check_all(
+    hash_filepath: str,
+    *cache_filepaths: str,
+    hash_line_split: Optional[
+        Callable[[str], Optional[syphon.hash.SplitResult]]
+    ] = None,
+    jobs: int = 1,
+    quick: bool = False,
+    verbose: bool = False,
+) -> bool:
+    """Verify the integrity of many built files listed in a single hash file.
+
+    Behaves like the `-c` option of the GNU coreutils sha256sum command. Files are
+    hashed concurrently by a pool of threads.
+
+    Args:
+        hash_filepath: Path to a file containing SHA256 sums.
+        *cache_filepaths: Paths to the files to verify. If none are given, then the
+            target of every entry in the hash file is verified.
+        hash_line_split: A callable object that returns a `syphon.hash.SplitResult`
+            from a given line or None if the line is in an unexpected format. Returning
+            None raises a MalformedLineError.
+        jobs: Number of files hashed at once. Defaults to 1.
+        quick: Whether to trust files whose size, modification time, and inode are
+            unchanged since they last passed a quick check. Defaults to False.
+        verbose: Whether to print what is being done to the standard output.
+
+    Returns:
+        True if every file passed the integrity check, False otherwise.
+
+    Raises:
+        ValueError: If jobs is less than 1.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _print(message: str) -> None:
+        if verbose:
+            print(message)
+
+    if jobs < 1:
+        raise ValueError(f"Expected at least 1 job, received {jobs}")
+
+    hash_path = pathlib.Path(hash_filepath)
+    # Pairs of a reported filepath and the entry expected to match it.
+    targets: List[Tuple[str, Optional[syphon.hash.HashEntry]]]
+    try:
+        with syphon.hash.HashFile(hash_filepath) as hashfile:
+            hashfile.line_split = hash_line_split
+            if len(cache_filepaths) == 0:
+                targets = [(e._original_filepath, e) for e in hashfile]
+            else:
+                targets = [(f, hashfile.find(f)) for f in cache_filepaths]
+    except OSError:
+        _print(f"Error reading hash file @ {hash_path.absolute()}")
+        return False
+    except syphon.errors.MalformedLineError as err:
+        _print(f'Error parsing hash entry "{err.line}"')
+        return False
+
+    records: Dict[str, _StatRecord] = (
+        _load_stat_records(hash_filepath) if quick else dict()
+    )
+
+    def _quick_verify(expected_entry: syphon.hash.HashEntry) -> Optional[bool]:
+        if quick and _unchanged(expected_entry, records):
+            return True
+        return _verify(expected_entry)
+
+    entries: List[syphon.hash.HashEntry] = [e for _, e in targets if e is not None]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        verified: List[Optional[bool]] = list(executor.map(_quick_verify, entries))
+
+    if quick:
+        _record_stats(
+            hash_filepath,
+            records,
+            [e for e, result in zip(entries, verified) if result is True],
+        )
+
+    failed: int = 0
+    unread: int = 0
+    results: Iterator[Optional[bool]] = iter(verified)
+    for filepath, entry in targets:
+        if entry is None:
+            unread += 1
+            _print(f'{filepath}: FAILED no entry found in "{hash_path}"')
+            continue
+        result: Optional[bool] = next(results)
+        if result is None:
+            unread += 1
+            _print(f"{filepath}: FAILED open or read")
+        else:
+            failed += 0 if result else 1
+            _print(f"{filepath}: {'OK' if result else 'FAILED'}")
+
+    if unread > 0:
+        _print(f"WARNING: {unread} listed file(s) could not be read")
+    if failed > 0:
+        _print(f"WARNING: {failed} computed checksum(s) did NOT match")
+    return failed == 0 and unread == 0
+
+
+def check_entry(
+    actual_entry: syphon.hash.HashEntry,
+    hash_filepath: Optional[str] = None,
+    hash_line_split: Optional[
+        Callable[[str], Optional[syphon.hash.SplitResult]]
+    ] = None,
+    quick: bool = False,
+    verbose: bool = False,
+) -> bool:
+    """Verify the integrity of the file targeted by the given entry.
+
+    Behaves like `check`. If the entry's hash is not cached, then the entry is left
+    holding the hash of the current file contents, which lets callers keep extending
+    that hash as they append to the file.
+
+    Args:
+        actual_entry: An entry targeting the file to verify.
+        hash_filepath: Path to a file containing a SHA256 sum of the file. If not
+            given, then the default is calculated by joining the file directory with
+            `syphon.core.check.DEFAULT_FILE`.
+        hash_line_split: A callable object that returns a `syphon.hash.SplitResult`
+            from a given line or None if the line is in an unexpected format. Returning
+            None raises a MalformedLineError.
+        quick: Whether to trust a file whose size, modification time, and inode are
+            unchanged since it last passed a quick check. A trusted file is not
+            hashed, so the entry's hash is left uncached. Defaults to False.
+        verbose: Whether to print what is being done to the standard output.
+
+    Returns:
+        True if the file passed the integrity check, False otherwise.
+    """
+
     def _print(message: str) -> None:
         if verbose:
             print(message)
 
-    actual_entry = syphon.hash.HashEntry(cache_filepath)
+    cache_filepath: str = str(actual_entry.filepath)
     if not actual_entry.filepath.exists():
         _print(f"No file exists @ {actual_entry.filepath}")
         return False
@@ -64,13 +312,7 @@ def check(
         # Find the hash entry for the provided cache filepath.
         with syphon.hash.HashFile(hash_filepath) as hashfile:
             hashfile.line_split = hash_line_split
-            entry: syphon.hash.HashEntry
-            for entry in hashfile:
-                if not entry.filepath.exists():
-                    continue
-                if actual_entry.filepath.samefile(entry.filepath):
-                    expected_entry = entry
-                    break
+            expected_entry = hashfile.find(actual_entry.filepath)
     except OSError:
         _print(f"Error reading hash file @ {hash_path.absolute()}")
         return False
@@ -82,11 +324,29 @@ def check(
         _print(f'No entry for file "{cache_filepath}" found in "{hash_path}"')
         return False
 
+    records: Dict[str, _StatRecord] = (
+        _load_stat_records(hash_filepath) if quick else dict()
+    )
+    if quick and _unchanged(expected_entry, records):
+        _print(f"{cache_filepath}: OK (unchanged since last check)")
+        return True
+
     try:
+        if verbose and not actual_entry.cached:
+            start: float = time.perf_counter()
+            _ = actual_entry.hash
+            _print_throughput(
+                cache_filepath,
+                actual_entry.filepath.stat().st_size,
+                time.perf_counter() - start,
+            )
+
         # The expected entry's hash will already be cached as a side-effect of reading
         # it from the hashfile. That leaves the actual entry to blame for any OSErrors.
         result: bool = expected_entry.hash == actual_entry.hash
         _print(f"{cache_filepath}: {'OK' if result else 'FAILED'}")
+        if quick and result:
+            _record_stats(hash_filepath, records, [expected_entry])
         return result
     except OSError:
         _print(f"Error reading cache file @ {cache_filepath}")
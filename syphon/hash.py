@@ -4,11 +4,14 @@
    Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
 
 """
+import codecs
 import hashlib
+import os
 import pathlib
-from typing import TYPE_CHECKING, Callable, Iterator, List
+import re
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List
 from typing import NamedTuple as _NamedTuple
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 import syphon.errors
 
@@ -16,8 +19,11 @@ if TYPE_CHECKING:
     from _io import _IOBase
 
 
+DEFAULT_BUFFER_SIZE: int = 1024 * 1024
 DEFAULT_HASH_TYPE: str = hashlib.sha256().name
 
+_LINE_PATTERN = re.compile(r"^([a-fA-F0-9]+)\s+(.*)$")
+
 
 class SplitResult(_NamedTuple):
     # Declaration order affects parameter order!
@@ -28,7 +34,12 @@ class SplitResult(_NamedTuple):
 
 class HashEntry(object):
     def __init__(
-        self, filepath: str, binary: bool = False, hash_type: Optional[str] = None
+        self,
+        filepath: str,
+        binary: bool = False,
+        hash_type: Optional[str] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        memory_map: bool = False,
     ):
         """An object whose string value represents a valid hash entry.
 
@@ -37,9 +48,14 @@ class HashEntry(object):
             binary: Whether the target file should be read in binary mode. Defaults
                 to False.
             hash_type: Name of a hash type supported by hashlib. Defaults to "sha256".
+            buffer_size: Number of bytes (characters in text mode) read from the
+                target file at once. Defaults to `DEFAULT_BUFFER_SIZE`.
+            memory_map: Whether to hash a memory map of the target file instead of
+                reading it. Only applies to binary mode. Defaults to False.
 
         Raises:
-            ValueError: If the given hash type is unsupported by hashlib.
+            ValueError: If the given hash type is unsupported by hashlib or the buffer
+                size is less than 1.
         """
         if hash_type is None:
             hash_type = DEFAULT_HASH_TYPE
@@ -47,6 +63,9 @@ class HashEntry(object):
         if hash_type not in hashlib.algorithms_available:
             raise ValueError(f'Unsupported hash type "{hash_type}"')
 
+        if buffer_size < 1:
+            raise ValueError(f"Buffer size must be at least 1, received {buffer_size}")
+
         super().__init__()
         self._hash_cache: str = ""
         self._hash_obj: hashlib._Hash = hashlib.new(hash_type)
@@ -54,7 +73,9 @@ class HashEntry(object):
         # Used only when this object was generated by parsing a hash file.
         self._raw_entry: str = ""
         self.binary: bool = binary
+        self.buffer_size: int = buffer_size
         self.filepath = pathlib.Path(filepath)
+        self.memory_map: bool = memory_map
 
     def __str__(self) -> str:
         return f"{self.hash} {'*' if self.binary else ' '}{self._original_filepath}"
@@ -114,25 +135,44 @@ class HashEntry(object):
             raise ValueError(f'Unsupported hash type "{value}"')
 
     def _hash(self) -> str:
-        """Calculate a hash from the contents of the filepath."""
+        """Calculate a hash from the contents of the filepath.
+
+        The file is read one buffer at a time, so memory use does not depend on the
+        size of the file.
+        """
         if self.binary:
             with self.filepath.open("rb") as binary:
-                self._hash_obj.update(binary.read())
+                if self.memory_map and os.fstat(binary.fileno()).st_size > 0:
+                    import mmap
+
+                    with mmap.mmap(
+                        binary.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mapped:
+                        self._hash_obj.update(mapped)
+                else:
+                    buffer = bytearray(self.buffer_size)
+                    view = memoryview(buffer)
+                    count: int = binary.readinto(buffer)
+                    while count > 0:
+                        self._hash_obj.update(view[:count])
+                        count = binary.readinto(buffer)
         else:
             if TYPE_CHECKING:
                 text: _IOBase
             with self.filepath.open("rt") as text:
-                self._hash_obj.update(bytes(text.read(), text.encoding))
+                # Encoding the text in pieces must match encoding it all at once.
+                encoder = codecs.getincrementalencoder(text.encoding)()
+                block: str = text.read(self.buffer_size)
+                while len(block) > 0:
+                    self._hash_obj.update(encoder.encode(block))
+                    block = text.read(self.buffer_size)
+                self._hash_obj.update(encoder.encode("", final=True))
 
         return self._hash_obj.hexdigest()
 
     @staticmethod
     def _default_line_split(line: str) -> Optional[SplitResult]:
-        import re
-
-        captures: List[Tuple[str, str]] = re.findall(
-            r"^([a-fA-F0-9]+)\s+(.*)$", line.strip()
-        )
+        captures: List[Tuple[str, str]] = _LINE_PATTERN.findall(line.strip())
         try:
             match_tuple: Tuple[str, str] = captures.pop(0)
             filepath: str = match_tuple[1]
@@ -181,26 +221,130 @@ class HashEntry(object):
         return result
 
 
+class HashWriter(object):
+    def __init__(self, stream: "_IOBase", entry: HashEntry):
+        """A write-through text stream wrapper that hashes everything written.
+
+        The calculated hash matches the hash the given entry would calculate by
+        reading the written file. Call `close` once writing is finished to cache the
+        result in the entry. Closing the writer does not close the underlying stream.
+
+        Args:
+            stream: An open text stream. Should be opened with `newline=""` so that
+                written line endings reach the file untranslated.
+            entry: The entry that receives the calculated hash.
+        """
+        super().__init__()
+        self._encoding: str = getattr(stream, "encoding", None) or "utf-8"
+        # A trailing carriage return that may be the first half of a "\r\n" pair.
+        self._pending: str = ""
+        self._stream = stream
+        self.entry = entry
+
+    def close(self) -> None:
+        """Finish hashing and cache the result in the entry."""
+        if len(self._pending) > 0:
+            self.entry._hash_obj.update(bytes("\n", self._encoding))
+            self._pending = ""
+        self.entry._hash_cache = self.entry._hash_obj.hexdigest()
+
+    def write(self, text: str) -> int:
+        """Write the given text to the stream and feed it to the hash.
+
+        Returns:
+            int: The number of characters written.
+        """
+        count: int = self._stream.write(text)
+
+        if not self.entry.binary:
+            # Text mode hashes what a universal newline reader would see.
+            text = self._pending + text
+            self._pending = ""
+            if text.endswith("\r"):
+                self._pending = "\r"
+                text = text[:-1]
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+
+        self.entry._hash_obj.update(bytes(text, self._encoding))
+        return count
+
+
 class _OpenHashFile(object):
     def __init__(self, filepath: pathlib.Path, hash_type: str):
         if TYPE_CHECKING:
             self._file_obj: _IOBase
-        self._file_obj = filepath.open("r+t")  # Read-only text mode.
+        self.filepath = pathlib.Path(filepath)
+        self._file_obj = self.filepath.open("r+t")  # Read-only text mode.
+        # Parsed entries and their raw lines, loaded on first use.
+        self._entries: Optional[List[HashEntry]] = None
+        self._index: Dict[Union[Tuple[int, int], str], int] = dict()
+        self._lines: List[str] = []
+        self._modified: bool = False
         self.hash_type: str = hash_type
         self.line_split: Optional[Callable[[str], Optional[SplitResult]]] = None
 
     def __iter__(self) -> Iterator[HashEntry]:
         return self.entries()
 
+    @staticmethod
+    def _key(filepath: pathlib.Path) -> Optional[Union[Tuple[int, int], str]]:
+        """Identify the file at the given path, or None if it does not exist.
+
+        Files are identified by device and inode, so different paths to the same file
+        share a key. Falls back to the normalized path on file systems that do not
+        report inode numbers.
+        """
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return None
+        if stat.st_ino == 0:
+            return os.path.normcase(os.path.abspath(filepath))
+        return (stat.st_dev, stat.st_ino)
+
+    def _add(self, entry: HashEntry, line: str) -> None:
+        key = _OpenHashFile._key(entry.filepath)
+        if key is not None and key not in self._index:
+            self._index[key] = len(self._lines)
+        self._lines.append(line)
+        if TYPE_CHECKING:
+            assert self._entries is not None
+        self._entries.append(entry)
+
+    def _load(self) -> List[HashEntry]:
+        """Parse and index every entry in the file."""
+        if self._entries is not None:
+            return self._entries
+
+        self._file_obj.seek(0)
+        lines = self._file_obj.readlines()
+        self._entries = []
+        try:
+            for line in lines:
+                entry = HashEntry.from_str(line, self.line_split, self.hash_type)
+                self._add(entry, entry._raw_entry)
+        except syphon.errors.MalformedLineError:
+            self._entries = None
+            self._index.clear()
+            self._lines.clear()
+            raise
+        return self._entries
+
+    def _position(self, filepath: Union[str, pathlib.Path]) -> Optional[int]:
+        self._load()
+        key = _OpenHashFile._key(pathlib.Path(filepath))
+        return None if key is None else self._index.get(key)
+
     def append(self, entry: HashEntry):
-        """Update the given hash.
+        """Add the given hash.
 
-        Returns the stream to its position before this method was called.
+        Changes are written when the file is closed.
 
         Args:
             entry: A new entry.
 
         Raises:
+            MalformedLineError: If an existing line could not be parsed.
             ValueError: If the given entry's hash type does not match this object's
                 hash type.
         """
@@ -209,31 +353,47 @@ class _OpenHashFile(object):
                 f"Expected hash type {self.hash_type}, but received {entry.hash_type}"
             )
 
-        initial_position = self.tell()
-
-        # You could compress the next 2 commands into `...seek(-1, 2)` but
-        # Windows doesn't support "nonzero end-relative seeks".
-        self._file_obj.seek(0, 2)
-        add_newline = False
-        here = self.tell()
-        # Don't want to seek before position 0 nor start the file with a blank line.
-        if here != 0:
-            self._file_obj.seek(here - 1)
-            add_newline = self._file_obj.read() != "\n"
-        self._file_obj.write(("\n" if add_newline else "") + str(entry) + "\n")
-
-        self._file_obj.seek(initial_position)
+        self._load()
+        # Don't continue a final line that lacks its newline.
+        if len(self._lines) > 0 and not self._lines[-1].endswith("\n"):
+            self._lines[-1] += "\n"
+        self._add(entry, str(entry) + "\n")
+        self._modified = True
 
     def close(self) -> None:
+        """Close the file, replacing it in a single step if it was changed."""
         self._file_obj.close()
+        if not self._modified:
+            return
+
+        temp_path = self.filepath.with_name(f"{self.filepath.name}.tmp")
+        with temp_path.open("wt") as file:
+            file.writelines(self._lines)
+        os.replace(temp_path, self.filepath)
+        self._modified = False
 
     def entries(self) -> Iterator[HashEntry]:
         """Iterate through all file entries."""
-        while True:
-            line = self._file_obj.readline()
-            if len(line) == 0:
-                break
-            yield HashEntry.from_str(line, self.line_split, self.hash_type)
+        yield from list(self._load())
+
+    def find(self, filepath: Union[str, pathlib.Path]) -> Optional[HashEntry]:
+        """Return the first entry that targets the given file.
+
+        Args:
+            filepath: The target file.
+
+        Returns:
+            The matching entry, or None if the file does not exist or has no entry.
+
+        Raises:
+            MalformedLineError: If a line could not be parsed.
+        """
+        position: Optional[int] = self._position(filepath)
+        if position is None:
+            return None
+        if TYPE_CHECKING:
+            assert self._entries is not None
+        return self._entries[position]
 
     def tell(self) -> int:
         """Return the current stream position."""
@@ -242,12 +402,13 @@ class _OpenHashFile(object):
     def update(self, entry: HashEntry):
         """Update the given hash or append it if an existing entry is not found.
 
-        Returns the stream to its position before this method was called.
+        Changes are written when the file is closed.
 
         Args:
             entry: An existing entry with a new hash value.
 
         Raises:
+            MalformedLineError: If an existing line could not be parsed.
             ValueError: If the given entry's hash type does not match this object's
                 hash type.
         """
@@ -256,20 +417,20 @@ class _OpenHashFile(object):
                 f"Expected hash type {self.hash_type}, but received {entry.hash_type}"
             )
 
-        initial_position = self.tell()
-
-        previous_position = initial_position
-        found: HashEntry
-        for found in self.entries():
-            if found.filepath.exists() and entry.filepath.samefile(found.filepath):
-                self._file_obj.seek(previous_position)
-                self._file_obj.write(entry.hash)
-                break
-            previous_position = self.tell()
-        else:
+        position: Optional[int] = self._position(entry.filepath)
+        if position is None:
             self.append(entry)
+            return
 
-        self._file_obj.seek(initial_position)
+        if TYPE_CHECKING:
+            assert self._entries is not None
+        found: HashEntry = self._entries[position]
+        # Overwrite the hash at the start of the line, keeping the rest as written.
+        line: str = entry.hash + self._lines[position][len(entry.hash) :]
+        self._lines[position] = line
+        found._hash_cache = entry.hash
+        found._raw_entry = line
+        self._modified = True
 
 
 class HashFile(object):
@@ -0,0 +1,193 @@
+"""syphon.manifest.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import hashlib
+import os
+import pathlib
+from typing import Dict, Iterable, List
+from typing import NamedTuple as _NamedTuple
+from typing import Optional, Tuple
+
+import syphon.hash
+
+FILE_SUFFIX: str = ".manifest"
+
+
+class ManifestEntry(_NamedTuple):
+    # Declaration order affects parameter order!
+    size: int
+    mtime_ns: int
+    hash: str
+
+
+def default_filepath(cache_filepath: str) -> str:
+    """Return the path of the manifest file that belongs beside a cache file.
+
+    The manifest file is hidden and named after the cache file. For example, the
+    manifest of "all_data.csv" is ".all_data.csv.manifest".
+    """
+    head, tail = os.path.split(os.path.abspath(cache_filepath))
+    return os.path.join(head, f".{tail}{FILE_SUFFIX}")
+
+
+class Manifest(object):
+    def __init__(self, filepath: str, hash_type: Optional[str] = None):
+        """A record of the files that were built into a cache file.
+
+        Each file is recorded with its size, modification time, and content hash. The
+        size and modification time of the cache file itself are recorded to detect
+        modification by anything other than a build.
+
+        Args:
+            filepath: Path to the manifest file.
+            hash_type: Name of a hash type supported by hashlib. Defaults to "sha256".
+
+        Raises:
+            ValueError: If the given hash type is unsupported by hashlib.
+        """
+        if hash_type is None:
+            hash_type = syphon.hash.DEFAULT_HASH_TYPE
+
+        if hash_type not in hashlib.algorithms_available:
+            raise ValueError(f'Unsupported hash type "{hash_type}"')
+
+        super().__init__()
+        self.cache: Optional[Tuple[int, int]] = None
+        self.entries: Dict[str, ManifestEntry] = dict()
+        self.filepath = pathlib.Path(filepath)
+        self.hash_type: str = hash_type
+
+    @staticmethod
+    def _key(filepath: str) -> str:
+        return os.path.normcase(os.path.abspath(filepath))
+
+    @staticmethod
+    def _stat(filepath: str) -> Tuple[int, int]:
+        stat = os.stat(filepath)
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _entry(self, filepath: str) -> ManifestEntry:
+        size, mtime_ns = Manifest._stat(filepath)
+        content = syphon.hash.HashEntry(filepath, binary=True, hash_type=self.hash_type)
+        return ManifestEntry(size=size, mtime_ns=mtime_ns, hash=content.hash)
+
+    def describes(self, cache_filepath: str) -> bool:
+        """Whether the cache file is unchanged since it was last recorded."""
+        try:
+            return self.cache == Manifest._stat(cache_filepath)
+        except OSError:
+            return False
+
+    def diff(self, files: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """Compare the given files against the recorded files.
+
+        A recorded file whose size or modification time changed is hashed. If the
+        content is unchanged, then its entry is refreshed and it is not reported.
+
+        Returns:
+            A tuple of (added, stale) filepaths. Added files are given files that are
+            not recorded. Stale files are recorded files that changed or are not among
+            the given files.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        added: List[str] = []
+        stale: List[str] = []
+        given: Dict[str, str] = {Manifest._key(f): f for f in files}
+
+        for key, filepath in given.items():
+            recorded: Optional[ManifestEntry] = self.entries.get(key)
+            if recorded is None:
+                added.append(filepath)
+            elif (recorded.size, recorded.mtime_ns) != Manifest._stat(filepath):
+                current: ManifestEntry = self._entry(filepath)
+                if current.hash != recorded.hash:
+                    stale.append(filepath)
+                else:
+                    self.entries[key] = current
+
+        stale.extend(key for key in self.entries if key not in given)
+        return (added, stale)
+
+    @staticmethod
+    def load(filepath: str) -> "Manifest":
+        """Read a manifest file.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+            ValueError: If the manifest file is malformed.
+        """
+        from json import loads
+
+        with open(filepath, "r", encoding="utf-8") as file:
+            content = loads(file.read())
+
+        try:
+            result = Manifest(filepath, hash_type=content["hash_type"])
+            result.cache = (
+                None
+                if content["cache"] is None
+                else (int(content["cache"]["size"]), int(content["cache"]["mtime_ns"]))
+            )
+            for key, entry in content["files"].items():
+                result.entries[key] = ManifestEntry(
+                    size=int(entry["size"]),
+                    mtime_ns=int(entry["mtime_ns"]),
+                    hash=str(entry["hash"]),
+                )
+        except (AttributeError, KeyError, TypeError) as err:
+            raise ValueError(f"Malformed manifest file @ {filepath}") from err
+
+        return result
+
+    def record(self, *files: str) -> None:
+        """Add or refresh the entries of the given files.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        for filepath in files:
+            self.entries[Manifest._key(filepath)] = self._entry(filepath)
+
+    def record_cache(self, cache_filepath: str) -> None:
+        """Remember the current size and modification time of the cache file.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        self.cache = Manifest._stat(cache_filepath)
+
+    def save(self) -> None:
+        """Write the manifest file.
+
+        The file is replaced in a single step so an interrupted save never leaves a
+        partial manifest behind.
+
+        Raises:
+            OSError: File operation error. Error type raised may be
+                a subclass of OSError.
+        """
+        from json import dumps
+
+        content = {
+            "hash_type": self.hash_type,
+            "cache": (
+                None
+                if self.cache is None
+                else {"size": self.cache[0], "mtime_ns": self.cache[1]}
+            ),
+            "files": {key: entry._asdict() for key, entry in self.entries.items()},
+        }
+
+        temp_path = self.filepath.with_name(f"{self.filepath.name}.tmp")
+        with temp_path.open("w", encoding="utf-8") as file:
+            file.write(dumps(content, indent=2))
+        os.replace(temp_path, self.filepath)
@@ -5,10 +5,19 @@
 
 """
 from .checkcolumns import check_columns
+from .compiledschema import Schema
 from .load import load
-from .resolvepath import resolve_path
+from .resolvepath import resolve_key_path, resolve_path
 from .save import save
 
 DEFAULT_FILE = ".schema.json"
 
-__all__ = ["check_columns", "DEFAULT_FILE", "load", "resolve_path", "save"]
+__all__ = [
+    "check_columns",
+    "DEFAULT_FILE",
+    "load",
+    "resolve_key_path",
+    "resolve_path",
+    "save",
+    "Schema",
+]
@@ -12,17 +12,14 @@ def check_columns(schema: SortedDict, data: DataFrame):
     """Raises an error if a column header does not exist.
 
     Args:
-        schema (SortedDict): Required column names.
+        schema (SortedDict): Required column names. May be a compiled `Schema`.
         datapool (DataFrame): Data to check.
 
     Raises:
         IndexError: Schema value is not a column header of the
             given DataFrame.
+        ValueError: If the schema is invalid.
     """
-    from typing import List
+    from .compiledschema import Schema
 
-    columns: List[str] = list(data.columns)
-    for key in schema:
-        header: str = schema[key]
-        if header not in columns:
-            raise IndexError(f'Cannot find schema-required column "{header}"')
+    Schema.compile(schema).check_columns(data)
@@ -0,0 +1,120 @@
+"""syphon.schema.compiledschema.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+from pandas import DataFrame
+
+
+class Schema(Mapping):
+    def __init__(self, schema: Mapping):
+        """An archive directory storage schema prepared for repeated use.
+
+        A schema maps level numbers (as strings) to column headers. Unlike a
+        `SortedDict` of the same schema, levels are ordered numerically, so level
+        "10" comes after level "2".
+
+        Column positions are remembered for each header they are looked up in, and
+        the path of each partition key is remembered once it is resolved.
+
+        Args:
+            schema: Archive directory storage schema, such as the one returned by
+                `syphon.schema.load`.
+
+        Raises:
+            ValueError: If a key is not a non-negative level number, two keys name the
+                same level, or a value is not a string.
+        """
+        levels: List[Tuple[int, str, str]] = []
+        for key, header in schema.items():
+            try:
+                level = int(key)
+            except (TypeError, ValueError):
+                raise ValueError(f'Schema key "{key}" is not a level number') from None
+            if level < 0:
+                raise ValueError(f'Schema key "{key}" is not a level number')
+            if not isinstance(header, str):
+                raise ValueError(f'Schema value of "{key}" is not a column header')
+            levels.append((level, str(key), header))
+
+        levels.sort()
+        for (level, key, _), (next_level, next_key, _) in zip(levels, levels[1:]):
+            if level == next_level:
+                raise ValueError(f'Schema keys "{key}" and "{next_key}" are one level')
+
+        super().__init__()
+        self.headers: Tuple[str, ...] = tuple(header for _, _, header in levels)
+        self._keys: Tuple[str, ...] = tuple(key for _, key, _ in levels)
+        self._lookup: Dict[str, str] = {key: header for _, key, header in levels}
+        self._paths: Dict[Tuple[Any, ...], str] = dict()
+        self._positions: Dict[Tuple[str, ...], Tuple[int, ...]] = dict()
+
+    def __getitem__(self, key: str) -> str:
+        return self._lookup[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"Schema({dict(self.items())!r})"
+
+    @staticmethod
+    def compile(schema: Mapping) -> "Schema":
+        """Return the given schema if it is compiled, or compile it otherwise.
+
+        Raises:
+            ValueError: If the schema is invalid.
+        """
+        return schema if isinstance(schema, Schema) else Schema(schema)
+
+    def check_columns(self, data: DataFrame):
+        """Raises an error if a column header does not exist.
+
+        Raises:
+            IndexError: Schema value is not a column header of the
+                given DataFrame.
+        """
+        self.positions(data.columns)
+
+    def positions(self, columns: Sequence[str]) -> Tuple[int, ...]:
+        """Return the position of each schema column among the given columns.
+
+        When a column header repeats, the position of its first occurrence is used.
+
+        Raises:
+            IndexError: Schema value is not one of the given columns.
+        """
+        header: Tuple[str, ...] = tuple(columns)
+        if header not in self._positions:
+            lookup: Dict[str, int] = dict()
+            for position, column in enumerate(header):
+                lookup.setdefault(column, position)
+
+            result: List[int] = []
+            for required in self.headers:
+                if required not in lookup:
+                    raise IndexError(f'Cannot find schema-required column "{required}"')
+                result.append(lookup[required])
+            self._positions[header] = tuple(result)
+
+        return self._positions[header]
+
+    def resolve_key_path(self, archive: str, key: Tuple[Any, ...]) -> str:
+        """Use the given partition key to make a path.
+
+        Behaves like `syphon.schema.resolve_key_path`.
+        """
+        from os.path import join
+
+        from .resolvepath import resolve_key_path
+
+        if key not in self._paths:
+            self._paths[key] = resolve_key_path("", key)
+        return join(archive, self._paths[key]) if len(key) != 0 else archive
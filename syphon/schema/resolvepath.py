@@ -4,10 +4,14 @@
    Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
 
 """
+from functools import lru_cache
+from typing import Any, Tuple
+
 from pandas import DataFrame
 from sortedcontainers import SortedDict
 
 
+@lru_cache(maxsize=4096)
 def _normalize(directory: str) -> str:
     """Make lowercase and replace spaces with underscores."""
     result: str = directory.lower()
@@ -29,7 +33,8 @@ def resolve_path(archive: str, schema: SortedDict, datapool: DataFrame) -> str:
 
     Args:
         archive (str): Directory where data is stored.
-        schema (SortedDict): Archive directory storage schema.
+        schema (SortedDict): Archive directory storage schema. May be a
+            compiled `Schema`.
         datapool (DataFrame): Data to use during path resolution.
             For best results, ensure all dtypes are strings.
 
@@ -40,18 +45,19 @@ def resolve_path(archive: str, schema: SortedDict, datapool: DataFrame) -> str:
         IndexError: Schema value is not a column header of the
             given DataFrame.
         ValueError: When a column corresponding to a SortedDict
-            entry contains more than one value.
+            entry contains more than one value, or the schema is invalid.
     """
     from os.path import join
-    from typing import Any, List
+    from typing import List
 
     from numpy import nan
 
+    from .compiledschema import Schema
+
     result: str = archive
 
-    for key in schema:
-        header: str = schema[key]
-        if header not in list(datapool.columns):
+    for header in Schema.compile(schema).headers:
+        if header not in datapool.columns:
             raise IndexError(
                 f"Schema value {header} is not a column in the current DataFrame."
             )
@@ -66,3 +72,22 @@ def resolve_path(archive: str, schema: SortedDict, datapool: DataFrame) -> str:
         result = join(result, _normalize(str(value)))
 
     return result
+
+
+def resolve_key_path(archive: str, key: Tuple[Any, ...]) -> str:
+    """Use the given partition key to make a path.
+
+    Behaves like `resolve_path` for a `DataFrame` holding the single value of each
+    schema column, without looking at the data.
+
+    Args:
+        archive (str): Directory where data is stored.
+        key (Tuple[Any, ...]): The value of each schema column in schema order, as
+            given by `syphon.core.archive.datafilter.keyed_datafilter`.
+
+    Return:
+        str: The resolved path.
+    """
+    from os.path import join
+
+    return join(archive, *(_normalize(str(value)) for value in key))
@@ -19,6 +19,7 @@ from sortedcontainers import SortedDict, SortedList
 import syphon
 import syphon.hash
 import syphon.schema
+from syphon.core.archive.archive import PARTITION_LOCK_FILE
 from syphon.core.archive.filemap import MappingBehavior
 from syphon.core.check import DEFAULT_FILE as DEFAULT_HASH_FILE
 
@@ -831,6 +832,80 @@ class TestArchive(object):
         assert expected_paths == actual_paths
         assert_frame_equal(expected_df, actual_df)
 
+    @staticmethod
+    def test_verbose_reports_file_system_calls(
+        capsys: CaptureFixture, archive_dir: LocalPath
+    ):
+        datafiles: List[str] = [
+            os.path.join(get_data_path(), f"iris-part-{i}-of-6.csv")
+            for i in range(1, 4)
+        ]
+
+        assert syphon.archive(archive_dir, datafiles, verbose=True)
+
+        # All data files share a single archive directory.
+        assert (
+            "Archive file system calls: 1 scandir, 0 makedirs, 3 open"
+            in capsys.readouterr().out
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize("locked", ["source", "partition"])
+    def test_raises_timeouterror_on_held_lock(
+        archive_dir: LocalPath, import_dir: LocalPath, locked: str
+    ):
+        from syphon.core.archive.lockmanager import LockManager
+
+        datafile: LocalPath = import_dir.join("data.csv")
+        datafile.write("Value\n1\n")
+        archive_dir.ensure(dir=True)
+        holder = (
+            LockManager()
+            if locked == "source"
+            else LockManager(filename=PARTITION_LOCK_FILE)
+        )
+        holder.lock(str(import_dir if locked == "source" else archive_dir))
+
+        try:
+            with pytest.raises(TimeoutError):
+                syphon.archive(archive_dir, [str(datafile)], lock_timeout=0.1)
+        finally:
+            holder.release_all()
+        assert not archive_dir.join("data.csv").exists()
+
+    @staticmethod
+    def test_breaks_stale_lock(archive_dir: LocalPath, import_dir: LocalPath):
+        from syphon.core.archive.lockmanager import LockManager
+
+        datafile: LocalPath = import_dir.join("data.csv")
+        datafile.write("Value\n1\n")
+        holder = LockManager()
+        holder.lock(str(import_dir))
+
+        try:
+            assert syphon.archive(
+                archive_dir, [str(datafile)], lock_timeout=10, stale_after=0
+            )
+        finally:
+            holder.release_all()
+
+    @staticmethod
+    @pytest.mark.parametrize("lock_timeout, stale_after", [(-1.0, None), (None, -1.0)])
+    def test_raises_valueerror_on_negative_lock_times(
+        archive_dir: LocalPath,
+        lock_timeout: Optional[float],
+        stale_after: Optional[float],
+    ):
+        datafile = os.path.join(get_data_path(), "iris.csv")
+
+        with pytest.raises(ValueError):
+            syphon.archive(
+                archive_dir,
+                [datafile],
+                lock_timeout=lock_timeout,
+                stale_after=stale_after,
+            )
+
     def test_raises_fileexistserror_on_existing_archive_file(
         self, archive_params: Tuple[str, SortedDict], archive_dir: LocalPath
     ):
@@ -971,3 +1046,528 @@ class TestArchive(object):
             )
 
         assert not os.path.exists(os.path.join(os.path.dirname(datafile), "#lock"))
+
+
+class TestArchiveJobs(object):
+    @staticmethod
+    def _archived_files(archive_dir: LocalPath) -> List[Tuple[str, bytes]]:
+        result: List[Tuple[str, bytes]] = []
+        for root, _, files in os.walk(archive_dir):
+            for f in files:
+                if ".csv" in f:
+                    filepath: str = os.path.join(root, f)
+                    with open(filepath, "rb") as fd:
+                        result.append(
+                            (os.path.relpath(filepath, archive_dir), fd.read())
+                        )
+        return sorted(result)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "jobs, pipeline", [(2, False), (3, False), (1, True), (2, True)]
+    )
+    def test_jobs_match_sequential_archive(
+        capsys: CaptureFixture,
+        archive_dir: LocalPath,
+        tmpdir: LocalPath,
+        jobs: int,
+        pipeline: bool,
+    ):
+        from glob import glob
+
+        schema = SortedDict({"0": "Species", "1": "PetalColor"})
+        datafiles: List[str] = sorted(
+            glob(os.path.join(get_data_path(), "iris-part-*-of-6.csv"))
+        )
+        metafiles: List[str] = sorted(
+            glob(os.path.join(get_data_path(), "iris-part-*-of-6.meta"))
+        )
+        parallel_dir: LocalPath = tmpdir.mkdir("parallel")
+
+        outputs: List[str] = []
+        for destination, j, p in [
+            (archive_dir, 1, False),
+            (parallel_dir, jobs, pipeline),
+        ]:
+            schemafile = os.path.join(destination, syphon.schema.DEFAULT_FILE)
+            syphon.init(schema, schemafile)
+            assert syphon.archive(
+                destination,
+                datafiles,
+                meta_files=metafiles,
+                schema_filepath=schemafile,
+                jobs=j,
+                pipeline=p,
+                verbose=True,
+            )
+            outputs.append(capsys.readouterr().out.replace(str(destination), ""))
+
+        assert len(TestArchiveJobs._archived_files(archive_dir)) > 0
+        assert TestArchiveJobs._archived_files(
+            archive_dir
+        ) == TestArchiveJobs._archived_files(parallel_dir)
+        # Files are archived in the same order.
+        assert outputs[0] == outputs[1]
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_pipeline_skips_empty_datafile(
+        capsys: CaptureFixture, archive_dir: LocalPath, jobs: int
+    ):
+        datafile = os.path.join(get_data_path(), "empty.csv")
+
+        assert not syphon.archive(
+            archive_dir, [datafile], jobs=jobs, pipeline=True, verbose=True
+        )
+        assert "Skipping empty data file" in capsys.readouterr().out
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [1, 2])
+    @pytest.mark.parametrize("pipeline", [True, False])
+    def test_raises_fileexistserror_when_data_files_share_a_target(
+        archive_dir: LocalPath,
+        import_dir: LocalPath,
+        overwrite: bool,
+        jobs: int,
+        pipeline: bool,
+    ):
+        schema = SortedDict({"0": "Name"})
+        schemafile = os.path.join(archive_dir, syphon.schema.DEFAULT_FILE)
+        syphon.init(schema, schemafile)
+
+        datafiles: List[str] = []
+        for subdirectory in ["first", "second"]:
+            datafile: LocalPath = import_dir.mkdir(subdirectory).join("iris.csv")
+            LocalPath(os.path.join(get_data_path(), "iris.csv")).copy(datafile)
+            datafiles.append(str(datafile))
+
+        with pytest.raises(FileExistsError, match="Both"):
+            syphon.archive(
+                archive_dir,
+                datafiles,
+                schema_filepath=schemafile,
+                jobs=jobs,
+                overwrite=overwrite,
+                pipeline=pipeline,
+            )
+
+        assert not os.path.exists(import_dir.join("first", "#lock"))
+
+    @staticmethod
+    @pytest.mark.parametrize("pipeline", [True, False])
+    def test_failed_archive_leaves_nothing_behind(
+        archive_dir: LocalPath, import_dir: LocalPath, pipeline: bool
+    ):
+        datafiles: List[str] = [
+            os.path.join(get_data_path(), "iris.csv"),
+            os.path.join(get_data_path(), "iris_plus.csv"),
+        ]
+        # The last data file collides with the first.
+        LocalPath(datafiles[0]).copy(import_dir.join("iris.csv"))
+        datafiles.append(str(import_dir.join("iris.csv")))
+
+        with pytest.raises(FileExistsError):
+            syphon.archive(archive_dir, datafiles, pipeline=pipeline)
+
+        assert os.listdir(archive_dir) == []
+        # A retry succeeds without overwriting.
+        assert syphon.archive(archive_dir, datafiles[:2], pipeline=pipeline)
+        # Partition locks are released.
+        assert PARTITION_LOCK_FILE not in os.listdir(archive_dir)
+
+    @staticmethod
+    def test_failed_archive_leaves_partition_directories_empty(
+        archive_dir: LocalPath, import_dir: LocalPath, tmpdir: LocalPath
+    ):
+        datafiles: List[str] = [
+            os.path.join(get_data_path(), "iris.csv"),
+            str(import_dir.join("iris.csv")),
+        ]
+        # The last data file collides with the first.
+        LocalPath(datafiles[0]).copy(import_dir.join("iris.csv"))
+        schemafile = str(tmpdir.join(syphon.schema.DEFAULT_FILE))
+        syphon.init(SortedDict({"0": "Name"}), schemafile)
+
+        with pytest.raises(FileExistsError):
+            syphon.archive(archive_dir, datafiles, schema_filepath=schemafile)
+
+        assert len(os.listdir(archive_dir)) > 0
+        for _, _, files in os.walk(archive_dir):
+            assert files == []
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [0, -1])
+    def test_raises_valueerror_on_invalid_jobs(archive_dir: LocalPath, jobs: int):
+        datafile = os.path.join(get_data_path(), "iris.csv")
+
+        with pytest.raises(ValueError, match=str(jobs)):
+            syphon.archive(archive_dir, [datafile], jobs=jobs)
+
+
+class TestArchiveChunks(object):
+    @staticmethod
+    @pytest.mark.parametrize("chunksize", [1, 7, 1000])
+    @pytest.mark.parametrize("use_schema", [True, False])
+    def test_chunks_match_whole_archive(
+        archive_dir: LocalPath, tmpdir: LocalPath, chunksize: int, use_schema: bool
+    ):
+        from glob import glob
+
+        schema = SortedDict({"0": "Species", "1": "PetalColor"})
+        datafiles: List[str] = sorted(
+            glob(os.path.join(get_data_path(), "iris-part-*-of-6.csv"))
+        )
+        metafiles: List[str] = sorted(
+            glob(os.path.join(get_data_path(), "iris-part-*-of-6.meta"))
+        )
+        chunked_dir: LocalPath = tmpdir.mkdir("chunked")
+
+        for destination, c in [(archive_dir, None), (chunked_dir, chunksize)]:
+            schemafile: Optional[str] = None
+            if use_schema:
+                schemafile = os.path.join(destination, syphon.schema.DEFAULT_FILE)
+                syphon.init(schema, schemafile)
+            assert syphon.archive(
+                destination,
+                datafiles,
+                meta_files=metafiles,
+                schema_filepath=schemafile,
+                chunksize=c,
+            )
+
+        assert len(TestArchiveJobs._archived_files(archive_dir)) > 0
+        assert TestArchiveJobs._archived_files(
+            archive_dir
+        ) == TestArchiveJobs._archived_files(chunked_dir)
+
+    @staticmethod
+    def test_chunks_drop_columns_empty_in_every_chunk(
+        archive_dir: LocalPath, import_dir: LocalPath, tmpdir: LocalPath
+    ):
+        datafile: LocalPath = import_dir.join("sparse.csv")
+        datafile.write("Key,Late,Empty,Value\nA,,,1\nB,,,2\nA,x,,3\nB,,,4\n")
+        schema = SortedDict({"0": "Key"})
+        chunked_dir: LocalPath = tmpdir.mkdir("chunked")
+
+        for destination, c in [(archive_dir, None), (chunked_dir, 1)]:
+            schemafile = os.path.join(destination, syphon.schema.DEFAULT_FILE)
+            syphon.init(schema, schemafile)
+            assert syphon.archive(
+                destination, [str(datafile)], schema_filepath=schemafile, chunksize=c
+            )
+
+        expected: List[Tuple[str, bytes]] = TestArchiveJobs._archived_files(archive_dir)
+        assert len(expected) == 2
+        assert all(b"Empty" not in content for _, content in expected)
+        assert expected == TestArchiveJobs._archived_files(chunked_dir)
+
+    @staticmethod
+    def test_chunks_skip_empty_datafile(capsys: CaptureFixture, archive_dir: LocalPath):
+        datafile = os.path.join(get_data_path(), "empty.csv")
+
+        assert not syphon.archive(archive_dir, [datafile], chunksize=2, verbose=True)
+        assert "Skipping empty data file" in capsys.readouterr().out
+
+    @staticmethod
+    def test_raises_fileexistserror_on_existing_archive_file(archive_dir: LocalPath):
+        datafile = os.path.join(get_data_path(), "iris.csv")
+        archive_dir.join("iris.csv").write(rand_string())
+
+        with pytest.raises(FileExistsError, match="iris.csv"):
+            syphon.archive(archive_dir, [datafile], chunksize=10)
+
+    @staticmethod
+    @pytest.mark.parametrize("chunksize", [0, -1])
+    def test_raises_valueerror_on_invalid_chunksize(
+        archive_dir: LocalPath, chunksize: int
+    ):
+        datafile = os.path.join(get_data_path(), "iris.csv")
+
+        with pytest.raises(ValueError, match="Chunksize"):
+            syphon.archive(archive_dir, [datafile], chunksize=chunksize)
+
+    @staticmethod
+    def test_raises_valueerror_with_pipeline(archive_dir: LocalPath):
+        datafile = os.path.join(get_data_path(), "iris.csv")
+
+        with pytest.raises(ValueError, match="pipeline"):
+            syphon.archive(archive_dir, [datafile], chunksize=10, pipeline=True)
+
+
+class TestArchiveRaw(object):
+    @staticmethod
+    @pytest.mark.parametrize("pipeline", [True, False])
+    @pytest.mark.parametrize("use_schema", [True, False])
+    def test_raw_matches_whole_archive(
+        archive_dir: LocalPath, tmpdir: LocalPath, pipeline: bool, use_schema: bool
+    ):
+        from glob import glob
+
+        schema = SortedDict({"0": "Species", "1": "PetalColor"})
+        datafiles: List[str] = sorted(
+            glob(os.path.join(get_data_path(), "iris-part-*-of-6.csv"))
+        )
+        metafiles: List[str] = sorted(
+            glob(os.path.join(get_data_path(), "iris-part-*-of-6.meta"))
+        )
+        raw_dir: LocalPath = tmpdir.mkdir("raw")
+
+        for destination, raw in [(archive_dir, False), (raw_dir, True)]:
+            schemafile: Optional[str] = None
+            if use_schema:
+                schemafile = os.path.join(destination, syphon.schema.DEFAULT_FILE)
+                syphon.init(schema, schemafile)
+            assert syphon.archive(
+                destination,
+                datafiles,
+                meta_files=metafiles,
+                schema_filepath=schemafile,
+                pipeline=pipeline,
+                raw=raw,
+            )
+
+        assert len(TestArchiveJobs._archived_files(archive_dir)) > 0
+        assert TestArchiveJobs._archived_files(
+            archive_dir
+        ) == TestArchiveJobs._archived_files(raw_dir)
+
+    @staticmethod
+    def test_raw_copies_rows_verbatim(archive_dir: LocalPath, import_dir: LocalPath):
+        datafile: LocalPath = import_dir.join("verbatim.csv")
+        datafile.write_binary(b'Key,Empty,Value\na,,"1"\nb,,"two\nlines"\n\na,,NA\n')
+        schemafile = os.path.join(archive_dir, syphon.schema.DEFAULT_FILE)
+        syphon.init(SortedDict({"0": "Key"}), schemafile)
+
+        assert syphon.archive(
+            archive_dir, [str(datafile)], schema_filepath=schemafile, raw=True
+        )
+
+        assert archive_dir.join("a", "verbatim.csv").read_binary() == (
+            f'Key,Empty,Value{os.linesep}a,,"1"{os.linesep}a,,NA{os.linesep}'.encode()
+        )
+        assert archive_dir.join("b", "verbatim.csv").read_binary() == (
+            f'Key,Empty,Value{os.linesep}b,,"two\nlines"{os.linesep}'.encode()
+        )
+
+    @staticmethod
+    def test_raw_appends_metadata_to_rows(
+        archive_dir: LocalPath, import_dir: LocalPath
+    ):
+        datafile: LocalPath = import_dir.join("data.csv")
+        datafile.write("Value\n1\n2\n")
+        metafile: LocalPath = import_dir.join("data.meta")
+        metafile.write('Key,Note\na,"x,y"\n')
+        schemafile = os.path.join(archive_dir, syphon.schema.DEFAULT_FILE)
+        syphon.init(SortedDict({"0": "Key"}), schemafile)
+
+        assert syphon.archive(
+            archive_dir,
+            [str(datafile)],
+            meta_files=[str(metafile)],
+            schema_filepath=schemafile,
+            raw=True,
+        )
+
+        assert (
+            archive_dir.join("a", "data.csv").read_binary()
+            == (
+                f'Value,Key,Note{os.linesep}1,a,"x,y"{os.linesep}2,a,"x,y"{os.linesep}'
+            ).encode()
+        )
+
+    @staticmethod
+    def test_raw_pads_short_rows_before_metadata(
+        archive_dir: LocalPath, import_dir: LocalPath
+    ):
+        datafile: LocalPath = import_dir.join("ragged.csv")
+        datafile.write('a,b,c\n1,x,"y,z"\n2,y\n')
+        metafile: LocalPath = import_dir.join("ragged.meta")
+        metafile.write("m\nmeta\n")
+        schemafile = os.path.join(archive_dir, syphon.schema.DEFAULT_FILE)
+        syphon.init(SortedDict({"0": "m"}), schemafile)
+
+        assert syphon.archive(
+            archive_dir,
+            [str(datafile)],
+            meta_files=[str(metafile)],
+            schema_filepath=schemafile,
+            raw=True,
+        )
+
+        assert archive_dir.join("meta", "ragged.csv").read_binary() == (
+            f'a,b,c,m{os.linesep}1,x,"y,z",meta{os.linesep}2,y,,meta{os.linesep}'
+        ).encode()
+
+    @staticmethod
+    def test_raw_raises_valueerror_on_long_row_with_metadata(
+        archive_dir: LocalPath, import_dir: LocalPath
+    ):
+        datafile: LocalPath = import_dir.join("long.csv")
+        datafile.write("a,b\n1,x\n2,y,z\n")
+        metafile: LocalPath = import_dir.join("long.meta")
+        metafile.write("m\nMETA\n")
+        schemafile = os.path.join(archive_dir, syphon.schema.DEFAULT_FILE)
+        syphon.init(SortedDict({"0": "m"}), schemafile)
+
+        with pytest.raises(ValueError, match="Cannot copy the rows"):
+            syphon.archive(
+                archive_dir,
+                [str(datafile)],
+                meta_files=[str(metafile)],
+                schema_filepath=schemafile,
+                raw=True,
+            )
+
+    @staticmethod
+    def test_raw_skips_empty_datafile(capsys: CaptureFixture, archive_dir: LocalPath):
+        datafile = os.path.join(get_data_path(), "empty.csv")
+
+        assert not syphon.archive(archive_dir, [datafile], raw=True, verbose=True)
+        assert "Skipping empty data file" in capsys.readouterr().out
+
+    @staticmethod
+    def test_raises_indexerror_on_missing_schema_column(archive_dir: LocalPath):
+        datafile = os.path.join(get_data_path(), "iris.csv")
+        schemafile = os.path.join(archive_dir, syphon.schema.DEFAULT_FILE)
+        syphon.init(SortedDict({"0": rand_string()}), schemafile)
+
+        with pytest.raises(IndexError):
+            syphon.archive(
+                archive_dir, [datafile], schema_filepath=schemafile, raw=True
+            )
+
+    @staticmethod
+    def test_raises_valueerror_with_chunksize(archive_dir: LocalPath):
+        datafile = os.path.join(get_data_path(), "iris.csv")
+
+        with pytest.raises(ValueError, match="raw"):
+            syphon.archive(archive_dir, [datafile], chunksize=10, raw=True)
+
+
+class TestArchiveMetadata(object):
+    @staticmethod
+    @pytest.mark.parametrize("pipeline", [True, False])
+    def test_metafiles_are_read_once(
+        monkeypatch: MonkeyPatch, archive_dir: LocalPath, pipeline: bool
+    ):
+        import syphon.core.archive.archive
+
+        read_metafile = syphon.core.archive.archive._read_metafile
+        calls: List[str] = []
+
+        def _counting_read_metafile(metafile: str):
+            calls.append(metafile)
+            return read_metafile(metafile)
+
+        datafiles: List[str] = [
+            os.path.join(get_data_path(), f"iris-part-{i}-of-6.csv")
+            for i in range(1, 4)
+        ]
+        metafiles: List[str] = [
+            os.path.join(get_data_path(), f"iris-part-1-of-6-meta-part-{i}-of-2.meta")
+            for i in range(1, 3)
+        ]
+
+        with monkeypatch.context() as m:
+            m.setattr(
+                syphon.core.archive.archive, "_read_metafile", _counting_read_metafile
+            )
+            assert syphon.archive(
+                archive_dir,
+                datafiles,
+                meta_files=metafiles,
+                filemap_behavior=MappingBehavior.ONE_TO_MANY,
+                pipeline=pipeline,
+            )
+
+        assert sorted(calls) == sorted(metafiles)
+
+    @staticmethod
+    def test_reports_unmatched_files(
+        capsys: CaptureFixture, archive_dir: LocalPath, import_dir: LocalPath
+    ):
+        datafiles: List[str] = [
+            os.path.join(get_data_path(), f"iris-part-{i}-of-6.csv")
+            for i in range(1, 3)
+        ]
+        lone_meta: LocalPath = import_dir.join("iris-part-9-of-6.meta")
+        LocalPath(os.path.join(get_data_path(), "iris-part-2-of-6.meta")).copy(
+            lone_meta
+        )
+        metafiles: List[str] = [
+            os.path.join(get_data_path(), "iris-part-1-of-6.meta"),
+            str(lone_meta),
+        ]
+
+        assert not syphon.archive(
+            archive_dir, datafiles, meta_files=metafiles, verbose=True
+        )
+
+        output: str = capsys.readouterr().out
+        assert f"No metadata file matches data file @ {datafiles[1]}" in output
+        assert f"No data file matches metadata file @ {lone_meta}" in output
+        assert f"No metadata file matches data file @ {datafiles[0]}" not in output
+
+    @staticmethod
+    def test_merge_metafiles_uses_cache():
+        from syphon.core.archive.archive import merge_metafiles
+
+        datafile = os.path.join(get_data_path(), "iris-part-1-of-6.csv")
+        metafile = os.path.join(get_data_path(), "iris-part-1-of-6.meta")
+        cache = {metafile: [("Cached", "value")]}
+
+        actual: Optional[DataFrame] = merge_metafiles(
+            {datafile: [metafile]}, datafile, 3, cache=cache
+        )
+
+        assert actual is not None
+        assert list(actual.columns) == ["Cached"]
+        assert list(actual["Cached"]) == ["value"] * 3
+
+    @staticmethod
+    def test_merge_metafiles_matches_metafile_content():
+        from syphon.core.archive.archive import merge_metafiles
+
+        datafile = os.path.join(get_data_path(), "iris-part-1-of-6.csv")
+        metafile = os.path.join(get_data_path(), "iris-part-1-of-6.meta")
+        meta = DataFrame(read_csv(metafile, dtype=str)).dropna(axis=1, how="all")
+
+        actual: Optional[DataFrame] = merge_metafiles(
+            {datafile: [metafile]}, datafile, 5
+        )
+
+        assert actual is not None
+        assert list(actual.columns) == list(meta.columns)
+        for header in meta.columns:
+            assert list(actual[header]) == [meta[header].iloc[0]] * 5
+
+    @staticmethod
+    @pytest.mark.parametrize("data_rows", [0, 1, 7])
+    @pytest.mark.parametrize(
+        "metadata",
+        [
+            [],
+            [("Flower", "iris")],
+            [("Flower", "iris"), ("Color", "violet"), ("Flower", "iris")],
+        ],
+    )
+    def test_broadcast_matches_repeated_series(
+        metadata: List[Tuple[str, str]], data_rows: int
+    ):
+        from pandas import Series
+
+        from syphon.core.archive.archive import _broadcast
+
+        expected = DataFrame()
+        for header, value in metadata:
+            expected = concat(
+                [expected, Series([value] * data_rows, name=header)], axis=1
+            )
+
+        actual: Optional[DataFrame] = _broadcast(metadata, data_rows)
+
+        if expected.empty:
+            assert actual is None
+        else:
+            assert actual is not None
+            assert_frame_equal(expected, actual, check_index_type=False)
@@ -11,7 +11,7 @@ from pandas import DataFrame, Series, concat
 from pandas.testing import assert_frame_equal
 from sortedcontainers import SortedDict
 
-from syphon.core.archive.datafilter import datafilter
+from syphon.core.archive.datafilter import datafilter, keyed_datafilter
 
 from ... import make_dataframe
 
@@ -166,3 +166,98 @@ class TestDataFilter(object):
                 assert_frame_equal(e, match)
             else:
                 pytest.fail(TestDataFilter.fail_message)
+
+
+def _recursive_datafilter(schema: SortedDict, datapool: DataFrame) -> List[DataFrame]:
+    """Split one schema column at a time, visiting values in order of appearance."""
+    this_schema: SortedDict = schema.copy()
+    try:
+        _, header = this_schema.popitem(index=0)
+    except KeyError:
+        return [datapool]
+
+    result: List[DataFrame] = []
+    for value in datapool.get(header).drop_duplicates().values:
+        new_pool: DataFrame = datapool.loc[datapool.get(header) == value]
+        result.extend(_recursive_datafilter(this_schema, new_pool))
+    return result
+
+
+@pytest.mark.parametrize("levels", [1, 2, 3])
+@pytest.mark.parametrize("rows", [1, 10, 200])
+def test_datafilter_matches_recursive_split_order(levels: int, rows: int):
+    import random
+
+    data: DataFrame = make_dataframe(rows, MAX_COLS)
+    schema = SortedDict()
+    for level in range(levels):
+        header = f"meta{level}"
+        schema[str(level)] = header
+        # Few distinct values interleaved across rows exercise the visiting order.
+        data[header] = [random.choice("abc") for _ in range(rows)]
+
+    expected: List[DataFrame] = _recursive_datafilter(schema, data)
+    actual: List[DataFrame] = datafilter(schema, data)
+
+    assert len(expected) == len(actual)
+    for e, a in zip(expected, actual):
+        assert_frame_equal(e, a)
+
+
+def test_datafilter_missing_column_returns_nothing():
+    data: DataFrame = make_dataframe(MAX_ROWS, MAX_COLS)
+    assert datafilter(SortedDict({"0": "not a column"}), data) == []
+
+
+def test_datafilter_empty_schema_returns_datapool():
+    data: DataFrame = make_dataframe(MAX_ROWS, MAX_COLS)
+    actual: List[DataFrame] = datafilter(SortedDict(), data)
+    assert len(actual) == 1
+    assert actual[0] is data
+
+
+@pytest.mark.parametrize("levels", [0, 1, 3])
+def test_keyed_datafilter_keys_match_partitions(levels: int):
+    import random
+
+    data: DataFrame = make_dataframe(MAX_ROWS * 5, MAX_COLS)
+    schema = SortedDict()
+    for level in range(levels):
+        header = f"meta{level}"
+        schema[str(level)] = header
+        data[header] = [random.choice("abc") for _ in range(MAX_ROWS * 5)]
+
+    expected: List[DataFrame] = datafilter(schema, data)
+    actual: List[Tuple[Tuple[str, ...], DataFrame]] = keyed_datafilter(schema, data)
+
+    assert len(expected) == len(actual)
+    for e, (key, frame) in zip(expected, actual):
+        assert_frame_equal(e, frame)
+        assert len(key) == levels
+        for header, value in zip(schema.values(), key):
+            assert list(frame[header].drop_duplicates()) == [value]
+
+
+def test_keyed_datafilter_groups_by_first_repeated_column():
+    data = DataFrame([["a", "x", "1"], ["b", "x", "2"], ["a", "y", "3"]])
+    data.columns = ["key", "other", "key"]
+
+    actual: List[Tuple[Tuple[str, ...], DataFrame]] = keyed_datafilter(
+        SortedDict({"0": "key"}), data
+    )
+
+    assert [key for key, _ in actual] == [("a",), ("b",)]
+    assert_frame_equal(actual[0][1], data.iloc[[0, 2]])
+    assert_frame_equal(actual[1][1], data.iloc[[1]])
+
+
+def test_keyed_datafilter_uses_cached_positions():
+    from syphon.schema import Schema
+
+    data: DataFrame = make_dataframe(MAX_ROWS, MAX_COLS)
+    data["meta"] = ["a"] * MAX_ROWS
+    schema = Schema(SortedDict({"0": "meta"}))
+
+    keyed_datafilter(schema, data)
+
+    assert schema._positions == {tuple(data.columns): (MAX_COLS,)}
@@ -11,7 +11,7 @@ from typing import Dict, List
 import pytest
 from py._path.local import LocalPath
 
-from syphon.core.archive.filemap import MappingBehavior, filemap
+from syphon.core.archive.filemap import MappingBehavior, filemap, unmatched
 
 from ... import get_data_path, rand_string, randomize
 
@@ -149,3 +149,75 @@ class TestFilemap(object):
     def test_one_to_one_returns_empty_dict_on_bad_map():
         actual_filemap: Dict = filemap(MappingBehavior.ONE_TO_ONE, [rand_string()], [])
         assert {} == actual_filemap
+
+    @staticmethod
+    def test_one_to_one_pairs_many_files():
+        names: List[str] = [rand_string() for _ in range(10000)]
+        datafiles: List[str] = [os.path.join("data", f"{n}.csv") for n in names]
+        metafiles: List[str] = randomize(
+            *[os.path.join("meta", f"{n}.meta") for n in names]
+        )
+
+        expected_filemap: Dict[str, List[str]] = {
+            os.path.join("data", f"{n}.csv"): [os.path.join("meta", f"{n}.meta")]
+            for n in names
+        }
+
+        actual_filemap: Dict[str, List[str]] = filemap(
+            MappingBehavior.ONE_TO_ONE, datafiles, metafiles
+        )
+        assert expected_filemap == actual_filemap
+
+
+class TestUnmatched(object):
+    @staticmethod
+    def test_everything_matched():
+        datafiles: List[str] = glob(
+            os.path.join(get_data_path(), "iris-part-*-of-6.csv")
+        )
+        metafiles: List[str] = glob(
+            os.path.join(get_data_path(), "iris-part-*-of-6.meta")
+        )
+
+        fmap: Dict[str, List[str]] = filemap(
+            MappingBehavior.ONE_TO_ONE, datafiles, metafiles
+        )
+        assert ([], []) == unmatched(fmap, datafiles, metafiles)
+
+    @staticmethod
+    def test_one_to_one_reports_unpaired_files():
+        datafiles: List[str] = sorted(
+            glob(os.path.join(get_data_path(), "iris-part-*-of-6.csv"))
+        )
+        metafiles: List[str] = sorted(
+            glob(os.path.join(get_data_path(), "iris-part-*-of-6.meta"))
+        )
+        lone_meta = os.path.join(get_data_path(), f"{rand_string()}.meta")
+        metafiles[0] = lone_meta
+
+        fmap: Dict[str, List[str]] = filemap(
+            MappingBehavior.ONE_TO_ONE, datafiles, metafiles
+        )
+        assert ([datafiles[0]], [lone_meta]) == unmatched(fmap, datafiles, metafiles)
+
+    @staticmethod
+    def test_one_to_one_reports_everything_on_bad_map():
+        datafiles: List[str] = [rand_string()]
+        metafiles: List[str] = [rand_string(), rand_string()]
+
+        fmap: Dict[str, List[str]] = filemap(
+            MappingBehavior.ONE_TO_ONE, datafiles, metafiles
+        )
+        assert (datafiles, metafiles) == unmatched(fmap, datafiles, metafiles)
+
+    @staticmethod
+    def test_one_to_many_reports_nothing():
+        datafiles: List[str] = [rand_string() for _ in range(3)]
+        metafiles: List[str] = glob(
+            os.path.join(get_data_path(), "iris-part-*-of-6.meta")
+        )
+
+        fmap: Dict[str, List[str]] = filemap(
+            MappingBehavior.ONE_TO_MANY, datafiles, metafiles
+        )
+        assert ([], []) == unmatched(fmap, datafiles, metafiles)
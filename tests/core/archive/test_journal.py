@@ -0,0 +1,267 @@
+"""tests.core.archive.test_journal.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+from typing import List
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from py._path.local import LocalPath
+
+import syphon.core.archive.journal
+from syphon.core.archive.journal import Journal, recover
+
+from ... import rand_string
+
+
+def _journals(archive_dir: LocalPath) -> List[str]:
+    return [
+        f
+        for f in os.listdir(archive_dir)
+        if f.startswith(syphon.core.archive.journal.FILE_PREFIX)
+        and f.endswith(syphon.core.archive.journal.FILE_SUFFIX)
+    ]
+
+
+def _abandon(journal: Journal) -> None:
+    """Leave the journal behind as if the archival died."""
+    assert journal._file is not None
+    journal._file.close()
+    journal._file = None
+
+
+class TestJournal(object):
+    @staticmethod
+    def test_commit_replaces_targets(archive_dir: LocalPath):
+        target: LocalPath = archive_dir.join(rand_string())
+        target.write(rand_string())
+        expected = rand_string()
+
+        journal = Journal(str(archive_dir))
+        temp: str = journal.stage(str(target))
+        LocalPath(temp).write(expected)
+        assert target.read() != expected
+
+        journal.commit()
+
+        assert target.read() == expected
+        assert not os.path.exists(temp)
+        assert _journals(archive_dir) == []
+
+    @staticmethod
+    def test_rollback_removes_staged_files(archive_dir: LocalPath):
+        target: LocalPath = archive_dir.join(rand_string())
+        expected = rand_string()
+        target.write(expected)
+
+        journal = Journal(str(archive_dir))
+        temp: str = journal.stage(str(target))
+        LocalPath(temp).write(rand_string())
+        # Staged files need not have been created.
+        journal.stage(str(archive_dir.join(rand_string())))
+
+        journal.rollback()
+
+        assert target.read() == expected
+        assert not os.path.exists(temp)
+        assert sorted(os.listdir(archive_dir)) == [target.basename]
+
+    @staticmethod
+    def test_staged_files_are_hidden(archive_dir: LocalPath):
+        journal = Journal(str(archive_dir))
+        temp: str = journal.stage(str(archive_dir.join(rand_string())))
+        journal.rollback()
+
+        assert os.path.basename(temp).startswith(".")
+
+    @staticmethod
+    def test_records_are_synced_before_staging(
+        monkeypatch: MonkeyPatch, archive_dir: LocalPath
+    ):
+        synced: List[int] = []
+        fsync = os.fsync
+
+        def _counting_fsync(fd: int) -> None:
+            synced.append(fd)
+            fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", _counting_fsync)
+
+        journal = Journal(str(archive_dir))
+        assert len(synced) > 0
+
+        for call in [
+            lambda: journal.makedirs(str(archive_dir.join(rand_string()))),
+            lambda: journal.stage(str(archive_dir.join(rand_string()))),
+        ]:
+            before: int = len(synced)
+            call()
+            assert len(synced) > before
+
+        journal.rollback()
+
+    @staticmethod
+    def test_rollback_keeps_made_directories(archive_dir: LocalPath):
+        made: LocalPath = archive_dir.join(rand_string(), rand_string())
+
+        journal = Journal(str(archive_dir))
+        journal.makedirs(str(made))
+        LocalPath(journal.stage(str(made.join(rand_string())))).write(rand_string())
+        journal.rollback()
+
+        # Another running archival may be about to write into them.
+        assert made.isdir()
+        assert os.listdir(made) == []
+
+    @staticmethod
+    def test_commit_tolerates_recovered_files(
+        monkeypatch: MonkeyPatch, archive_dir: LocalPath
+    ):
+        targets: List[LocalPath] = [archive_dir.join(rand_string()) for _ in range(2)]
+
+        journal = Journal(str(archive_dir))
+        for target in targets:
+            LocalPath(journal.stage(str(target))).write(target.basename)
+        journal._record("commit", sync=True)
+        os.replace(*journal.staged[0])
+        # Replayed by another archival that took this one for dead.
+        monkeypatch.setattr(syphon.core.archive.journal, "alive", lambda _: False)
+        assert recover(str(archive_dir)) == [journal.filepath]
+
+        journal.commit()
+
+        for target in targets:
+            assert target.read() == target.basename
+        assert _journals(archive_dir) == []
+
+
+class TestRecover(object):
+    @staticmethod
+    def test_nonexistent_archive(tmpdir: LocalPath):
+        assert recover(str(tmpdir.join(rand_string()))) == []
+
+    @staticmethod
+    def test_finishes_committed_journal(
+        monkeypatch: MonkeyPatch, archive_dir: LocalPath
+    ):
+        targets: List[LocalPath] = [archive_dir.join(rand_string()) for _ in range(3)]
+
+        journal = Journal(str(archive_dir))
+        for target in targets:
+            LocalPath(journal.stage(str(target))).write(target.basename)
+        journal._record("commit", sync=True)
+        # Die after replacing the first target.
+        os.replace(*journal.staged[0])
+        _abandon(journal)
+
+        monkeypatch.setattr(syphon.core.archive.journal, "alive", lambda _: False)
+        assert recover(str(archive_dir)) == [journal.filepath]
+        for target in targets:
+            assert target.read() == target.basename
+        assert sorted(os.listdir(archive_dir)) == sorted(t.basename for t in targets)
+
+    @staticmethod
+    def test_undoes_journal_of_dead_archival(
+        monkeypatch: MonkeyPatch, archive_dir: LocalPath
+    ):
+        target: LocalPath = archive_dir.join(rand_string())
+
+        journal = Journal(str(archive_dir))
+        LocalPath(journal.stage(str(target))).write(rand_string())
+        _abandon(journal)
+        # A record cut short by the crash.
+        with open(journal.filepath, "a", encoding="utf-8") as file:
+            file.write('["partial')
+
+        monkeypatch.setattr(syphon.core.archive.journal, "alive", lambda _: False)
+        assert recover(str(archive_dir)) == [journal.filepath]
+        assert os.listdir(archive_dir) == []
+
+    @staticmethod
+    @pytest.mark.parametrize("committed", [True, False])
+    def test_made_directories_are_kept_only_when_committed(
+        monkeypatch: MonkeyPatch, archive_dir: LocalPath, committed: bool
+    ):
+        directory: LocalPath = archive_dir.join(rand_string())
+        target: LocalPath = directory.join(rand_string())
+
+        journal = Journal(str(archive_dir))
+        journal.makedirs(str(directory))
+        LocalPath(journal.stage(str(target))).write(rand_string())
+        if committed:
+            journal._record("commit", sync=True)
+        _abandon(journal)
+
+        monkeypatch.setattr(syphon.core.archive.journal, "alive", lambda _: False)
+        assert recover(str(archive_dir)) == [journal.filepath]
+        assert target.exists() is committed
+        assert directory.exists() is committed
+
+    @staticmethod
+    def test_leaves_committed_journal_of_running_archival(archive_dir: LocalPath):
+        targets: List[LocalPath] = [archive_dir.join(rand_string()) for _ in range(2)]
+
+        journal = Journal(str(archive_dir))
+        for target in targets:
+            LocalPath(journal.stage(str(target))).write(target.basename)
+        journal._record("commit", sync=True)
+        # Recovery runs while the first target is being replaced.
+        os.replace(*journal.staged[0])
+
+        assert recover(str(archive_dir)) == []
+        assert os.path.exists(journal.staged[1][0])
+        assert not targets[1].exists()
+
+        journal.commit()
+
+        for target in targets:
+            assert target.read() == target.basename
+        assert _journals(archive_dir) == []
+
+    @staticmethod
+    def test_recovery_keeps_directories_in_use(
+        monkeypatch: MonkeyPatch, archive_dir: LocalPath
+    ):
+        shared: LocalPath = archive_dir.join(rand_string())
+        made: LocalPath = shared.join(rand_string())
+
+        journal = Journal(str(archive_dir))
+        journal.makedirs(str(made))
+        assert journal.directories == [str(shared), str(made)]
+        # Another archival writes into one of the made directories.
+        kept: LocalPath = shared.join(rand_string())
+        kept.write(rand_string())
+        _abandon(journal)
+
+        monkeypatch.setattr(syphon.core.archive.journal, "alive", lambda _: False)
+        assert recover(str(archive_dir)) == [journal.filepath]
+
+        assert os.listdir(archive_dir) == [shared.basename]
+        assert os.listdir(shared) == [kept.basename]
+
+    @staticmethod
+    def test_leaves_journal_of_running_archival(archive_dir: LocalPath):
+        target: LocalPath = archive_dir.join(rand_string())
+
+        journal = Journal(str(archive_dir))
+        temp: str = journal.stage(str(target))
+        LocalPath(temp).write(rand_string())
+
+        assert recover(str(archive_dir)) == []
+        assert os.path.exists(temp)
+        assert not target.exists()
+
+        journal.rollback()
+
+    @staticmethod
+    def test_raises_valueerror_on_malformed_journal(archive_dir: LocalPath):
+        archive_dir.join(
+            f"{syphon.core.archive.journal.FILE_PREFIX}{rand_string()}"
+            f"{syphon.core.archive.journal.FILE_SUFFIX}"
+        ).write(f"{rand_string()}\n")
+
+        with pytest.raises(ValueError):
+            recover(str(archive_dir))
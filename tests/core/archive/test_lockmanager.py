@@ -9,6 +9,7 @@ from time import sleep
 from typing import List
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
 from py._path.local import LocalPath
 from sortedcontainers import SortedList
 
@@ -178,7 +179,7 @@ def test_lockmanager_release_all_suppress_filenotfounderror(
         assert len(lockman.locks) == 0
 
 
-def test_lockmanager_modifiedtime_updated(tmpdir: LocalPath):
+def test_lockmanager_relock_is_counted(tmpdir: LocalPath):
     lockman = LockManager()
 
     try:
@@ -202,4 +203,153 @@ def test_lockmanager_modifiedtime_updated(tmpdir: LocalPath):
     else:
         post_time = lockfile.mtime()
 
-    assert pre_time < post_time
+    # The lock file is not touched again.
+    assert pre_time == post_time
+    assert lockman.locks == [str(lockfile)]
+
+    # The lock file is removed once released as often as it was locked.
+    lockman.release(str(lockfile))
+    assert exists(str(lockfile))
+    lockman.release(str(lockfile))
+    assert not exists(str(lockfile))
+
+
+def test_lockmanager_lock_all_locks_each_directory_once(
+    monkeypatch: MonkeyPatch, tmpdir: LocalPath
+):
+    directories: List[LocalPath] = [tmpdir.mkdir(name) for name in ["b", "a", "c"]]
+    paths: List[str] = [str(d) for d in directories for _ in range(100)]
+
+    lockman = LockManager()
+    locked: List[str] = []
+    lock = lockman.lock
+
+    def _counting_lock(path: str) -> str:
+        locked.append(path)
+        return lock(path)
+
+    monkeypatch.setattr(lockman, "lock", _counting_lock)
+    actual: List[str] = lockman.lock_all(paths)
+
+    assert locked == sorted(str(d) for d in directories)
+    assert actual == [join(p, lockman.filename) for p in locked]
+
+    lockman.release_all()
+    for d in directories:
+        assert not exists(join(str(d), lockman.filename))
+
+
+def test_lockmanager_lock_all_releases_on_error(tmpdir: LocalPath):
+    locked: LocalPath = tmpdir.mkdir("b")
+    holder = LockManager()
+    holder.lock(str(locked))
+
+    lockman = LockManager(timeout=0.1)
+    with pytest.raises(TimeoutError):
+        lockman.lock_all([str(tmpdir.mkdir("a")), str(locked)])
+    assert len(lockman.locks) == 0
+
+    holder.release_all()
+
+
+def test_lockmanager_filename(tmpdir: LocalPath):
+    lockman = LockManager(filename=".#lock")
+
+    assert lockman.lock(str(tmpdir)) == str(tmpdir.join(".#lock"))
+    assert exists(str(tmpdir.join(".#lock")))
+
+    lockman.release_all()
+
+
+def test_lockmanager_lock_records_holder(tmpdir: LocalPath):
+    from json import loads
+    from os import getpid
+
+    lockman = LockManager()
+    lockfile: str = lockman.lock(str(tmpdir))
+
+    with open(lockfile, "r", encoding="utf-8") as file:
+        holder = loads(file.read())
+    assert holder["pid"] == getpid()
+
+    lockman.release_all()
+
+
+def test_lockmanager_lock_times_out_while_held(tmpdir: LocalPath):
+    holder = LockManager()
+    holder.lock(str(tmpdir))
+
+    with pytest.raises(TimeoutError):
+        LockManager(timeout=0.1).lock(str(tmpdir))
+
+    holder.release_all()
+
+
+def test_lockmanager_lock_waits_for_release(tmpdir: LocalPath):
+    from threading import Timer
+
+    holder = LockManager()
+    lockfile: str = holder.lock(str(tmpdir))
+    Timer(0.2, holder.release_all).start()
+
+    waiter = LockManager(timeout=10)
+    assert waiter.lock(str(tmpdir)) == lockfile
+    assert exists(lockfile)
+    assert len(holder.locks) == 0
+
+    waiter.release_all()
+    assert not exists(lockfile)
+
+
+@pytest.mark.parametrize("dead_holder", [True, False])
+def test_lockmanager_lock_breaks_stale_lock(
+    monkeypatch: MonkeyPatch, tmpdir: LocalPath, dead_holder: bool
+):
+    import syphon.core.archive.lockmanager
+
+    holder = LockManager()
+    lockfile: str = holder.lock(str(tmpdir))
+
+    if dead_holder:
+        monkeypatch.setattr(syphon.core.archive.lockmanager, "alive", lambda _: False)
+        breaker = LockManager(timeout=10)
+    else:
+        breaker = LockManager(timeout=10, stale_after=0)
+
+    assert breaker.lock(str(tmpdir)) == lockfile
+
+    # The previous holder does not delete the new lock file.
+    holder.release_all()
+    assert exists(lockfile)
+
+    breaker.release_all()
+    assert not exists(lockfile)
+
+
+def test_lockmanager_lock_keeps_lock_replaced_after_stale_check(
+    monkeypatch: MonkeyPatch, tmpdir: LocalPath
+):
+    holder = LockManager()
+    holder.lock(str(tmpdir))
+    replacement = LockManager()
+
+    breaker = LockManager(timeout=0.2)
+    checked: List[int] = []
+
+    def _replaced_while_stale(fd: int) -> bool:
+        # The stale lock file is broken and taken by another waiter right after
+        # the breaker read it.
+        if len(checked) == 0:
+            holder.release_all()
+            replacement.lock(str(tmpdir))
+        checked.append(fd)
+        return len(checked) == 1
+
+    monkeypatch.setattr(breaker, "_stale", _replaced_while_stale)
+
+    with pytest.raises(TimeoutError):
+        breaker.lock(str(tmpdir))
+    assert replacement.locks == [str(tmpdir.join(replacement.filename))]
+    assert exists(replacement.locks[0])
+
+    replacement.release_all()
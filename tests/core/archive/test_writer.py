@@ -0,0 +1,209 @@
+"""tests.core.archive.test_writer.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+import pytest
+from py._path.local import LocalPath
+
+from syphon.core.archive.journal import Journal
+from syphon.core.archive.lockmanager import LockManager
+from syphon.core.archive.writer import ArchiveWriter
+
+from ... import rand_string
+
+
+class TestArchiveWriter(object):
+    @staticmethod
+    def test_counts_default():
+        assert ArchiveWriter().counts == {"scandir": 0, "makedirs": 0, "open": 0}
+
+    @staticmethod
+    @pytest.mark.parametrize("max_handles", [0, -1])
+    def test_raises_valueerror_on_invalid_max_handles(max_handles: int):
+        with pytest.raises(ValueError):
+            ArchiveWriter(max_handles=max_handles)
+
+    @staticmethod
+    def test_exists_lists_each_directory_once(tmpdir: LocalPath):
+        existing: LocalPath = tmpdir.join(rand_string())
+        existing.write(rand_string())
+
+        with ArchiveWriter() as writer:
+            assert writer.exists(str(existing))
+            for _ in range(5):
+                assert not writer.exists(str(tmpdir.join(rand_string())))
+            assert not writer.exists(str(tmpdir.join(rand_string(), rand_string())))
+
+            assert writer.counts["scandir"] == 2
+
+    @staticmethod
+    def test_exists_includes_written_files(tmpdir: LocalPath):
+        target: LocalPath = tmpdir.join(rand_string())
+
+        with ArchiveWriter() as writer:
+            assert not writer.exists(str(target))
+            writer.write(str(target), rand_string())
+            assert writer.exists(str(target))
+
+    @staticmethod
+    def test_makedirs_creates_each_directory_once(tmpdir: LocalPath):
+        path: LocalPath = tmpdir.join(rand_string(), rand_string())
+
+        with ArchiveWriter() as writer:
+            for _ in range(3):
+                writer.makedirs(str(path))
+            assert path.isdir()
+            assert writer.counts["makedirs"] == 1
+
+    @staticmethod
+    def test_makedirs_skips_listed_directories(tmpdir: LocalPath):
+        with ArchiveWriter() as writer:
+            writer.exists(str(tmpdir.join(rand_string())))
+            writer.makedirs(str(tmpdir))
+            assert writer.counts["makedirs"] == 0
+
+    @staticmethod
+    def test_write_reuses_open_files(tmpdir: LocalPath):
+        target: LocalPath = tmpdir.join(rand_string())
+        lines = [f"{rand_string()}\n" for _ in range(4)]
+
+        with ArchiveWriter() as writer:
+            writer.write(str(target), lines[0])
+            for line in lines[1:]:
+                writer.write(str(target), line, append=True)
+            assert writer.counts["open"] == 1
+
+        assert target.read() == "".join(lines)
+
+    @staticmethod
+    def test_write_truncates_without_append(tmpdir: LocalPath):
+        target: LocalPath = tmpdir.join(rand_string())
+        target.write(rand_string())
+        expected = rand_string()
+
+        with ArchiveWriter() as writer:
+            writer.write(str(target), rand_string())
+            writer.write(str(target), expected)
+
+        assert target.read() == expected
+
+    @staticmethod
+    def test_write_closes_least_recently_written_file(tmpdir: LocalPath):
+        first: LocalPath = tmpdir.join("first")
+        second: LocalPath = tmpdir.join("second")
+
+        with ArchiveWriter(max_handles=1) as writer:
+            writer.write(str(first), "a")
+            writer.write(str(second), "b")
+            # Closed files are flushed.
+            assert first.read() == "a"
+            writer.write(str(first), "c", append=True)
+            assert writer.counts["open"] == 3
+
+        assert first.read() == "ac"
+        assert second.read() == "b"
+
+    @staticmethod
+    def test_journal_stages_writes_until_commit(tmpdir: LocalPath):
+        target: LocalPath = tmpdir.join(rand_string())
+        expected = rand_string()
+
+        with ArchiveWriter(journal=Journal(str(tmpdir))) as writer:
+            writer.write(str(target), expected)
+            assert not target.exists()
+            assert writer.exists(str(target))
+
+        assert target.read() == expected
+        assert os.listdir(tmpdir) == [target.basename]
+
+    @staticmethod
+    def test_journal_staged_append_starts_from_target(tmpdir: LocalPath):
+        target: LocalPath = tmpdir.join(rand_string())
+        target.write("a")
+
+        with ArchiveWriter(journal=Journal(str(tmpdir))) as writer:
+            writer.write(str(target), "b", append=True)
+
+        assert target.read() == "ab"
+
+    @staticmethod
+    def test_journal_rolls_back_on_error(tmpdir: LocalPath):
+        target: LocalPath = tmpdir.join(rand_string())
+        expected = rand_string()
+        target.write(expected)
+
+        with pytest.raises(RuntimeError):
+            with ArchiveWriter(journal=Journal(str(tmpdir))) as writer:
+                writer.write(str(target), rand_string())
+                writer.write(str(tmpdir.join(rand_string())), rand_string())
+                raise RuntimeError
+
+        assert target.read() == expected
+        assert os.listdir(tmpdir) == [target.basename]
+
+    @staticmethod
+    def test_journal_write_remakes_removed_directory(tmpdir: LocalPath):
+        made: LocalPath = tmpdir.join(rand_string())
+        target: LocalPath = made.join(rand_string())
+        expected = rand_string()
+
+        with ArchiveWriter(journal=Journal(str(tmpdir))) as writer:
+            writer.makedirs(str(made))
+            # Removed by the recovery of another archival.
+            made.remove()
+            writer.write(str(target), expected)
+
+        assert target.read() == expected
+
+    @staticmethod
+    @pytest.mark.parametrize("overwrite", [True, False])
+    def test_commit_rechecks_targets_under_lock(tmpdir: LocalPath, overwrite: bool):
+        target: LocalPath = tmpdir.join(rand_string())
+        expected = rand_string()
+        lockman = LockManager(filename=".#lock")
+
+        writer = ArchiveWriter(
+            journal=Journal(str(tmpdir)), lock_manager=lockman, overwrite=overwrite
+        )
+        assert not writer.exists(str(target))
+        writer.write(str(target), expected)
+        # Another archival creates the target in the meantime.
+        target.write(rand_string())
+
+        if overwrite:
+            writer.commit()
+            assert target.read() == expected
+        else:
+            with pytest.raises(FileExistsError):
+                writer.commit()
+            assert target.read() != expected
+
+        assert len(lockman.locks) == 0
+        assert os.listdir(tmpdir) == [target.basename]
+
+    @staticmethod
+    def test_commit_waits_for_locked_directories(tmpdir: LocalPath):
+        locked: LocalPath = tmpdir.mkdir("locked")
+        free: LocalPath = tmpdir.mkdir("free")
+        holder = LockManager(filename=".#lock")
+        holder.lock(str(locked))
+
+        for directory, committed in [(free, True), (locked, False)]:
+            target: LocalPath = directory.join(rand_string())
+            writer = ArchiveWriter(
+                journal=Journal(str(tmpdir)),
+                lock_manager=LockManager(timeout=0.1, filename=".#lock"),
+            )
+            writer.write(str(target), rand_string())
+            if committed:
+                writer.commit()
+            else:
+                with pytest.raises(TimeoutError):
+                    writer.commit()
+            assert target.exists() is committed
+
+        holder.release_all()
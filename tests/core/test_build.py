@@ -11,6 +11,7 @@ from typing import List, Optional, Union
 import pytest
 from _pytest.capture import CaptureFixture
 from _pytest.fixtures import FixtureRequest
+from _pytest.monkeypatch import MonkeyPatch
 from pandas import DataFrame, read_csv
 from pandas.testing import assert_frame_equal
 from py._path.local import LocalPath
@@ -20,6 +21,7 @@ import syphon
 import syphon.core.build
 import syphon.core.check
 import syphon.hash
+import syphon.manifest
 import syphon.schema
 
 from .. import get_data_path, rand_string
@@ -817,3 +819,405 @@ class TestBuild(object):
             )
             assert datafile in str(errinfo.value)
         assert_post_hash(False, cache_file, hash_filepath=hash_file)
+
+
+class TestBuildChunked(object):
+    @staticmethod
+    @pytest.mark.parametrize("chunksize", [1, 7, 1000])
+    @pytest.mark.parametrize(
+        "datafiles",
+        [
+            ["iris.csv"],
+            [
+                "iris-part-1-of-6.csv",
+                "iris-part-2-of-6-combined.csv",
+                "iris-part-3-of-6.csv",
+            ],
+            [
+                "iris_plus_partial-1-of-2-no-species.csv",
+                "iris_plus_partial-2-of-2-no-petalcolor.csv",
+            ],
+        ],
+    )
+    def test_chunked_build_matches_unchunked_build(
+        capsys: CaptureFixture,
+        tmpdir: LocalPath,
+        hash_file: Optional[LocalPath],
+        chunksize: int,
+        datafiles: List[str],
+        verbose: bool,
+    ):
+        sources: List[str] = [os.path.join(get_data_path(), f) for f in datafiles]
+        expected_cache: LocalPath = tmpdir.join("expected.csv")
+        actual_cache: LocalPath = tmpdir.join("actual.csv")
+
+        assert syphon.build(expected_cache, *sources, post_hash=False)
+        assert syphon.build(
+            actual_cache,
+            *sources,
+            chunksize=chunksize,
+            hash_filepath=hash_file,
+            post_hash=True,
+            verbose=verbose,
+        )
+        assert_captured_outerr(capsys.readouterr(), verbose, False)
+        assert_post_hash(True, actual_cache, hash_filepath=hash_file)
+
+        assert expected_cache.read_binary() == actual_cache.read_binary()
+        assert not os.path.exists(actual_cache.dirpath(".actual.csv.tmp"))
+
+    @staticmethod
+    def test_chunked_incremental_build_extends_cache(
+        capsys: CaptureFixture,
+        cache_file: LocalPath,
+        hash_file: Optional[LocalPath],
+        verbose: bool,
+    ):
+        pre_datafiles: List[str] = [
+            os.path.join(get_data_path(), "iris_plus_partial-1-of-2-no-species.csv")
+        ]
+        datafiles: List[str] = [
+            os.path.join(get_data_path(), "iris_plus_partial-2-of-2-no-petalcolor.csv")
+        ]
+
+        assert syphon.build(
+            cache_file, *pre_datafiles, chunksize=10, hash_filepath=hash_file
+        )
+        assert syphon.build(
+            cache_file,
+            *datafiles,
+            chunksize=10,
+            hash_filepath=hash_file,
+            incremental=True,
+            overwrite=True,
+            verbose=verbose,
+        )
+        assert_captured_outerr(capsys.readouterr(), verbose, False)
+        assert_post_hash(True, cache_file, hash_filepath=hash_file)
+
+        expected_frame = DataFrame(
+            read_csv(
+                os.path.join(
+                    get_data_path(),
+                    "iris_plus_partial-new-data-new-and-missing-columns.csv",
+                ),
+                dtype=str,
+                index_col="Index",
+            )
+        )
+        expected_frame.sort_index(inplace=True)
+
+        actual_frame = DataFrame(read_csv(cache_file, dtype=str, index_col="Index"))
+        actual_frame.sort_index(inplace=True)
+
+        assert_frame_equal(expected_frame, actual_frame, check_exact=True)
+
+    @staticmethod
+    @pytest.mark.parametrize("chunksize", [0, -1])
+    def test_raises_valueerror_when_chunksize_too_small(
+        cache_file: LocalPath, chunksize: int
+    ):
+        with pytest.raises(ValueError, match=str(chunksize)):
+            syphon.build(
+                cache_file,
+                os.path.join(get_data_path(), "iris.csv"),
+                chunksize=chunksize,
+            )
+        assert not os.path.exists(cache_file)
+
+
+class TestBuildJobs(object):
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [2, 3])
+    @pytest.mark.parametrize("chunksize", [None, 7])
+    def test_parallel_build_matches_serial_build(
+        capsys: CaptureFixture,
+        tmpdir: LocalPath,
+        hash_file: Optional[LocalPath],
+        jobs: int,
+        chunksize: Optional[int],
+        verbose: bool,
+    ):
+        sources: List[str] = [
+            os.path.join(get_data_path(), "iris_plus_partial-1-of-2-no-species.csv"),
+            os.path.join(get_data_path(), "iris-part-1-of-6.csv"),
+            os.path.join(get_data_path(), "iris-part-2-of-6-combined.csv"),
+            os.path.join(get_data_path(), "iris_plus_partial-2-of-2-no-petalcolor.csv"),
+            os.path.join(get_data_path(), "iris-part-3-of-6.csv"),
+        ]
+        expected_cache: LocalPath = tmpdir.join("expected.csv")
+        actual_cache: LocalPath = tmpdir.join("actual.csv")
+
+        assert syphon.build(expected_cache, *sources, post_hash=False)
+        assert syphon.build(
+            actual_cache,
+            *sources,
+            chunksize=chunksize,
+            hash_filepath=hash_file,
+            jobs=jobs,
+            post_hash=True,
+            verbose=verbose,
+        )
+        assert_captured_outerr(capsys.readouterr(), verbose, False)
+        assert_post_hash(True, actual_cache, hash_filepath=hash_file)
+
+        assert expected_cache.read_binary() == actual_cache.read_binary()
+
+    @staticmethod
+    def test_chunked_parallel_build_holds_few_chunks(monkeypatch: MonkeyPatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        read_frames = syphon.core.build._read_frames
+        read: List[int] = []
+
+        def _counting_read_frames(filepath: str, chunksize: Optional[int]):
+            for data in read_frames(filepath, chunksize):
+                read.append(data.shape[0])
+                yield data
+
+        monkeypatch.setattr(syphon.core.build, "_read_frames", _counting_read_frames)
+
+        source = os.path.join(get_data_path(), "iris.csv")
+        columns: List[str] = syphon.core.build._read_columns(source)
+        with ThreadPoolExecutor(2) as executor:
+            rendered = syphon.core.build._rendered_sources(
+                [source], columns, 1, executor, 2
+            )
+            _, chunks = next(rendered)
+            next(iter(chunks))
+            # Chunks are read as they are rendered, not the whole source at once.
+            assert len(read) == 2 * 2 + 1
+            for _ in chunks:
+                pass
+            assert len(read) == 150
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [0, -1])
+    def test_raises_valueerror_when_jobs_too_small(cache_file: LocalPath, jobs: int):
+        with pytest.raises(ValueError, match=str(jobs)):
+            syphon.build(
+                cache_file, os.path.join(get_data_path(), "iris.csv"), jobs=jobs
+            )
+        assert not os.path.exists(cache_file)
+
+
+class TestBuildManifest(object):
+    @staticmethod
+    def copy_sources(import_dir: LocalPath, *names: str) -> List[str]:
+        result: List[str] = []
+        for name in names:
+            target: LocalPath = import_dir.join(name)
+            LocalPath(os.path.join(get_data_path(), name)).copy(target)
+            result.append(str(target))
+        return result
+
+    @staticmethod
+    def full_build(tmpdir: LocalPath, *sources: str) -> bytes:
+        expected_cache: LocalPath = tmpdir.join("expected.csv")
+        assert syphon.build(expected_cache, *sources, overwrite=True, post_hash=False)
+        return expected_cache.read_binary()
+
+    @staticmethod
+    def test_full_build_creates_manifest(
+        import_dir: LocalPath, cache_file: LocalPath, hash_file: Optional[LocalPath]
+    ):
+        sources = TestBuildManifest.copy_sources(
+            import_dir, "iris-part-1-of-6.csv", "iris-part-2-of-6.csv"
+        )
+
+        assert syphon.build(
+            cache_file, *sources, hash_filepath=hash_file, manifest=True
+        )
+        assert_post_hash(True, cache_file, hash_filepath=hash_file)
+
+        manifest = syphon.manifest.Manifest.load(
+            syphon.manifest.default_filepath(cache_file)
+        )
+        assert manifest.describes(cache_file)
+        assert manifest.diff(sources) == ([], [])
+
+    @staticmethod
+    def test_unchanged_sources_leave_cache_untouched(
+        capsys: CaptureFixture,
+        import_dir: LocalPath,
+        cache_file: LocalPath,
+        verbose: bool,
+    ):
+        sources = TestBuildManifest.copy_sources(
+            import_dir, "iris-part-1-of-6.csv", "iris-part-2-of-6.csv"
+        )
+        assert syphon.build(cache_file, *sources, manifest=True)
+        expected_stat = os.stat(cache_file)
+
+        assert syphon.build(
+            cache_file, *sources, manifest=True, overwrite=True, verbose=verbose
+        )
+        assert_captured_outerr(capsys.readouterr(), verbose, False)
+
+        actual_stat = os.stat(cache_file)
+        assert expected_stat.st_ino == actual_stat.st_ino
+        assert expected_stat.st_mtime_ns == actual_stat.st_mtime_ns
+
+    @staticmethod
+    def test_new_sources_are_appended(
+        tmpdir: LocalPath,
+        import_dir: LocalPath,
+        cache_file: LocalPath,
+        hash_file: Optional[LocalPath],
+    ):
+        pre_sources = TestBuildManifest.copy_sources(
+            import_dir,
+            "iris_plus_partial-1-of-2-no-species.csv",
+            "iris-part-1-of-6.csv",
+        )
+        sources = pre_sources + TestBuildManifest.copy_sources(
+            import_dir, "iris_plus_partial-2-of-2-no-petalcolor.csv"
+        )
+        assert syphon.build(
+            cache_file, *pre_sources, hash_filepath=hash_file, manifest=True
+        )
+
+        assert syphon.build(
+            cache_file, *sources, hash_filepath=hash_file, manifest=True, overwrite=True
+        )
+        assert_post_hash(True, cache_file, hash_filepath=hash_file)
+
+        assert (
+            TestBuildManifest.full_build(tmpdir, *sources) == cache_file.read_binary()
+        )
+        manifest = syphon.manifest.Manifest.load(
+            syphon.manifest.default_filepath(cache_file)
+        )
+        assert manifest.describes(cache_file)
+        assert manifest.diff(sources) == ([], [])
+
+    @staticmethod
+    @pytest.mark.parametrize("change", ["modify", "remove", "cache"])
+    def test_full_build_when_built_file_changes(
+        tmpdir: LocalPath,
+        import_dir: LocalPath,
+        cache_file: LocalPath,
+        hash_file: Optional[LocalPath],
+        change: str,
+    ):
+        sources = TestBuildManifest.copy_sources(
+            import_dir, "iris-part-1-of-6.csv", "iris-part-2-of-6.csv"
+        )
+        assert syphon.build(
+            cache_file, *sources, hash_filepath=hash_file, manifest=True
+        )
+
+        if change == "modify":
+            LocalPath(os.path.join(get_data_path(), "iris-part-3-of-6.csv")).copy(
+                LocalPath(sources[0])
+            )
+        elif change == "remove":
+            os.remove(sources.pop())
+        else:
+            cache_file.write(rand_string())
+
+        assert syphon.build(
+            cache_file, *sources, hash_filepath=hash_file, manifest=True, overwrite=True
+        )
+        assert_post_hash(True, cache_file, hash_filepath=hash_file)
+
+        assert (
+            TestBuildManifest.full_build(tmpdir, *sources) == cache_file.read_binary()
+        )
+
+    @staticmethod
+    def test_incremental_build_does_not_create_manifest(
+        import_dir: LocalPath, cache_file: LocalPath
+    ):
+        pre_sources = TestBuildManifest.copy_sources(import_dir, "iris-part-1-of-6.csv")
+        sources = TestBuildManifest.copy_sources(import_dir, "iris-part-2-of-6.csv")
+        assert syphon.build(cache_file, *pre_sources)
+
+        assert syphon.build(
+            cache_file, *sources, incremental=True, manifest=True, overwrite=True
+        )
+        assert not os.path.exists(syphon.manifest.default_filepath(cache_file))
+
+
+class TestBuildAppend(object):
+    @staticmethod
+    def prebuild(cache_file: LocalPath, hash_file: Optional[LocalPath]) -> List[str]:
+        """Build the first half of iris_plus.csv and return the second half."""
+        assert syphon.build(
+            cache_file,
+            *[
+                os.path.join(get_data_path(), f"iris-part-{i}-of-6-combined.csv")
+                for i in range(1, 4)
+            ],
+            hash_filepath=hash_file,
+        )
+        return [
+            os.path.join(get_data_path(), f"iris-part-{i}-of-6-combined.csv")
+            for i in range(4, 7)
+        ]
+
+    @staticmethod
+    @pytest.mark.parametrize("chunksize", [None, 9])
+    def test_incremental_appends_in_place(
+        capsys: CaptureFixture,
+        tmpdir: LocalPath,
+        cache_file: LocalPath,
+        hash_file: Optional[LocalPath],
+        chunksize: Optional[int],
+        verbose: bool,
+    ):
+        datafiles: List[str] = TestBuildAppend.prebuild(cache_file, hash_file)
+        expected_inode: int = os.stat(cache_file).st_ino
+
+        assert syphon.build(
+            cache_file,
+            *datafiles,
+            chunksize=chunksize,
+            hash_filepath=hash_file,
+            incremental=True,
+            overwrite=True,
+            verbose=verbose,
+        )
+        assert_captured_outerr(capsys.readouterr(), verbose, False)
+        assert_post_hash(True, cache_file, hash_filepath=hash_file)
+        assert expected_inode == os.stat(cache_file).st_ino
+
+        expected_cache: LocalPath = tmpdir.join("expected.csv")
+        assert syphon.build(
+            expected_cache,
+            *[
+                os.path.join(get_data_path(), f"iris-part-{i}-of-6-combined.csv")
+                for i in range(1, 7)
+            ],
+            post_hash=False,
+        )
+        assert expected_cache.read_binary() == cache_file.read_binary()
+
+    @staticmethod
+    def test_incremental_append_failure_restores_cache(
+        monkeypatch: MonkeyPatch,
+        cache_file: LocalPath,
+        hash_file: Optional[LocalPath],
+    ):
+        datafiles: List[str] = TestBuildAppend.prebuild(cache_file, hash_file)
+        expected_content: bytes = cache_file.read_binary()
+
+        original_render = syphon.core.build._render
+
+        def failing_render(*args, **kwargs):
+            yield from original_render(*args, **kwargs)
+            raise OSError("Simulated failure")
+
+        with monkeypatch.context() as m:
+            m.setattr(syphon.core.build, "_render", failing_render)
+            with pytest.raises(OSError, match="Simulated failure"):
+                syphon.build(
+                    cache_file,
+                    *datafiles,
+                    hash_filepath=hash_file,
+                    incremental=True,
+                    overwrite=True,
+                )
+
+        assert expected_content == cache_file.read_binary()
+        assert_post_hash(True, cache_file, hash_filepath=hash_file)
@@ -117,7 +117,7 @@ def test_check_true(
         captured: CaptureResult = capsys.readouterr()
         assert_captured_outerr(captured, verbose, False)
         if verbose:
-            assert_matches_outerr(captured, ["OK"], [])
+            assert_matches_outerr(captured, ["OK", "MiB/s"], [])
 
 
 class TestPathResolution(object):
@@ -517,3 +517,148 @@ def test_check_false_oserror_hash_file(
             assert_captured_outerr(captured, verbose, False)
             if verbose:
                 assert_matches_outerr(captured, [str(new_hashfile)], [])
+
+
+class TestCheckAll(object):
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [1, 4])
+    @pytest.mark.parametrize("irrelevant", [0, 2])
+    def test_check_all_true(
+        capsys: CaptureFixture,
+        tmpdir: LocalPath,
+        irrelevant: int,
+        jobs: int,
+        verbose: bool,
+    ):
+        new_hashfile: LocalPath = make_hash_entries(tmpdir, 3, irrelevant, 0, None)
+
+        assert syphon.core.check.check_all(new_hashfile, jobs=jobs, verbose=verbose)
+        captured: CaptureResult = capsys.readouterr()
+        assert_captured_outerr(captured, verbose, False)
+        if verbose:
+            assert captured.out.count(": OK") == 3 + irrelevant
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_check_all_given_files(tmpdir: LocalPath, jobs: int):
+        new_hashfile: LocalPath = make_hash_entries(tmpdir, 3, 2, 0, None)
+        cache_files: List[str] = glob(str(new_hashfile.dirpath("*.csv")))
+
+        assert syphon.core.check.check_all(new_hashfile, *cache_files, jobs=jobs)
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_check_all_false_modified(
+        capsys: CaptureFixture, tmpdir: LocalPath, jobs: int
+    ):
+        new_hashfile: LocalPath = make_hash_entries(tmpdir, 3, 0, 0, None)
+        cache_files: List[str] = glob(str(new_hashfile.dirpath("*.csv")))
+        modified: str = random.choice(cache_files)
+        with open(modified, "a") as file:
+            file.write(rand_string())
+
+        assert not syphon.core.check.check_all(new_hashfile, jobs=jobs, verbose=True)
+        captured: CaptureResult = capsys.readouterr()
+        assert captured.out.count(": OK") == 2
+        assert_matches_outerr(captured, [f"{modified}: FAILED", "did NOT match"], [])
+
+    @staticmethod
+    def test_check_all_false_nonexistant(capsys: CaptureFixture, tmpdir: LocalPath):
+        new_hashfile: LocalPath = make_hash_entries(tmpdir, 2, 0, 1, None)
+
+        assert not syphon.core.check.check_all(new_hashfile, verbose=True)
+        captured: CaptureResult = capsys.readouterr()
+        assert captured.out.count(": OK") == 2
+        assert_matches_outerr(captured, ["FAILED open or read"], [])
+
+    @staticmethod
+    def test_check_all_false_no_entry(capsys: CaptureFixture, tmpdir: LocalPath):
+        new_hashfile: LocalPath = make_hash_entries(tmpdir, 1, 0, 0, None)
+        unlisted: LocalPath = [c for c in make_random_file(tmpdir, 1)][0]
+
+        assert not syphon.core.check.check_all(new_hashfile, unlisted, verbose=True)
+        assert_matches_outerr(capsys.readouterr(), [f"{unlisted}: FAILED"], [])
+
+    @staticmethod
+    def test_check_all_false_no_hash_file(tmpdir: LocalPath):
+        assert not syphon.core.check.check_all(tmpdir.join(rand_string()))
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [0, -1])
+    def test_check_all_raises_valueerror(tmpdir: LocalPath, jobs: int):
+        new_hashfile: LocalPath = make_hash_entries(tmpdir, 1, 0, 0, None)
+
+        with pytest.raises(ValueError, match=str(jobs)):
+            syphon.core.check.check_all(new_hashfile, jobs=jobs)
+
+
+class TestCheckQuick(object):
+    @staticmethod
+    def _age(*files: LocalPath):
+        # Recently modified files are never trusted by a quick check.
+        for file in files:
+            stat = os.stat(file)
+            os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**10))
+
+    @staticmethod
+    def test_quick_skips_unchanged_file(monkeypatch: MonkeyPatch, tmpdir: LocalPath):
+        new_hashfile: LocalPath = make_hash_entries(tmpdir, 1, 0, 0, None)
+        cache: LocalPath = LocalPath(glob(str(tmpdir.join("*.csv")))[0])
+        TestCheckQuick._age(cache)
+
+        assert syphon.check(cache, quick=True)
+        assert os.path.exists(f"{new_hashfile}{syphon.core.check.STAT_FILE_SUFFIX}")
+
+        with monkeypatch.context() as m:
+            m.setattr(syphon.hash.HashEntry, "_hash", HashEntryOSError._hash)
+            assert syphon.check(cache, quick=True)
+            assert not syphon.check(cache, quick=False)
+
+    @staticmethod
+    def test_quick_detects_modified_file(tmpdir: LocalPath):
+        make_hash_entries(tmpdir, 1, 0, 0, None)
+        cache: LocalPath = LocalPath(glob(str(tmpdir.join("*.csv")))[0])
+        TestCheckQuick._age(cache)
+
+        assert syphon.check(cache, quick=True)
+        cache.write(rand_string(), mode="a")
+        assert not syphon.check(cache, quick=True)
+
+    @staticmethod
+    def test_quick_does_not_trust_recent_file(
+        monkeypatch: MonkeyPatch, tmpdir: LocalPath
+    ):
+        make_hash_entries(tmpdir, 1, 0, 0, None)
+        cache: LocalPath = LocalPath(glob(str(tmpdir.join("*.csv")))[0])
+
+        assert syphon.check(cache, quick=True)
+
+        with monkeypatch.context() as m:
+            m.setattr(syphon.hash.HashEntry, "_hash", HashEntryOSError._hash)
+            assert not syphon.check(cache, quick=True)
+
+    @staticmethod
+    def test_quick_ignores_malformed_stat_file(tmpdir: LocalPath):
+        new_hashfile: LocalPath = make_hash_entries(tmpdir, 1, 0, 0, None)
+        cache: LocalPath = LocalPath(glob(str(tmpdir.join("*.csv")))[0])
+        LocalPath(f"{new_hashfile}{syphon.core.check.STAT_FILE_SUFFIX}").write(
+            rand_string()
+        )
+
+        assert syphon.check(cache, quick=True)
+
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [1, 4])
+    def test_check_all_quick(monkeypatch: MonkeyPatch, tmpdir: LocalPath, jobs: int):
+        new_hashfile: LocalPath = make_hash_entries(tmpdir, 3, 0, 0, None)
+        caches: List[LocalPath] = [
+            LocalPath(c) for c in glob(str(tmpdir.join("*.csv")))
+        ]
+        TestCheckQuick._age(*caches)
+
+        assert syphon.core.check.check_all(new_hashfile, jobs=jobs, quick=True)
+
+        with monkeypatch.context() as m:
+            m.setattr(syphon.hash.HashEntry, "_hash", HashEntryOSError._hash)
+            assert syphon.core.check.check_all(new_hashfile, jobs=jobs, quick=True)
+            assert not syphon.core.check.check_all(new_hashfile, jobs=jobs)
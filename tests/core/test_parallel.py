@@ -0,0 +1,54 @@
+"""tests.core.test_parallel.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+import pytest
+
+from syphon.core._parallel import ordered, pool
+
+
+class TestOrdered(object):
+    @staticmethod
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_results_are_in_order(jobs: int):
+        with pool(jobs) as executor:
+            assert list(
+                ordered(pow, ((i, 2) for i in range(10)), executor, 2 * jobs)
+            ) == [i**2 for i in range(10)]
+
+    @staticmethod
+    @pytest.mark.parametrize("threaded", [True, False])
+    def test_calls_at_most_ahead(threaded: bool):
+        executor: Optional[Executor] = ThreadPoolExecutor(1) if threaded else None
+        submitted: List[int] = []
+
+        def _calls(count: int) -> Iterator[tuple]:
+            for i in range(count):
+                submitted.append(i)
+                yield (i,)
+
+        results = ordered(abs, _calls(10), executor, 3)
+        assert next(results) == 0
+        assert len(submitted) == (1 if executor is None else 4)
+
+        assert list(results) == list(range(1, 10))
+
+        if executor is not None:
+            executor.shutdown()
+
+
+class TestPool(object):
+    @staticmethod
+    def test_single_job_has_no_pool():
+        with pool(1) as executor:
+            assert executor is None
+
+    @staticmethod
+    def test_multiple_jobs_have_pool():
+        with pool(2) as executor:
+            assert isinstance(executor, Executor)
@@ -84,6 +84,53 @@ def test_hashentry_hash(
     assert expected_hash == entry.hash
 
 
+@pytest.mark.parametrize("buffer_size", [1, 7, 4096])
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_hashentry_hash_buffered(
+    cache_file: LocalPath,
+    data_file: str,
+    binary_hash: bool,
+    buffer_size: int,
+    memory_map: bool,
+):
+    target = LocalPath(os.path.join(get_data_path(), data_file))
+    _copy(target, cache_file)
+    assert os.path.exists(cache_file)
+
+    expected_hash: str = HashEntry(str(cache_file), binary=binary_hash).hash
+    entry = HashEntry(
+        str(cache_file),
+        binary=binary_hash,
+        buffer_size=buffer_size,
+        memory_map=memory_map,
+    )
+
+    assert expected_hash == entry.hash
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+def test_hashentry_hash_buffered_text_translates_newlines(
+    cache_file: LocalPath, newline: str
+):
+    content: str = newline.join(["a,b", "\u00e9,\u00fc", "1,2", ""])
+    with open(cache_file, "w", newline="") as fd:
+        fd.write(content)
+
+    hash_obj = hashlib.new(DEFAULT_HASH_TYPE)
+    with open(cache_file, "r") as fd:
+        hash_obj.update(bytes(fd.read(), fd.encoding))
+    expected_hash: str = hash_obj.hexdigest()
+
+    # A one character buffer splits every "\r\n" pair across reads.
+    assert expected_hash == HashEntry(str(cache_file), buffer_size=1).hash
+
+
+@pytest.mark.parametrize("buffer_size", [0, -1])
+def test_hashentry_init_raises_valueerror_buffer_size(buffer_size: int):
+    with pytest.raises(ValueError, match=str(buffer_size)):
+        HashEntry("datafile", buffer_size=buffer_size)
+
+
 def test_hashentry_hash_uses_cache():
     expected_hash = rand_string()
 
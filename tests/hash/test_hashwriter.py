@@ -0,0 +1,43 @@
+"""tests.hash.test_hashwriter.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+from typing import List, Optional
+
+import pytest
+from py._path.local import LocalPath
+
+from syphon.hash import HashEntry, HashWriter
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [],
+        ["a,b\n", "1,2\n"],
+        ["a,b\r\n", "1,2\r\n"],
+        ["a,b\r", "\n1,2\r", "\n"],
+        ['"multi\rline",b\r', "1,2"],
+    ],
+)
+def test_hashwriter_matches_hashentry(
+    cache_file: LocalPath,
+    chunks: List[str],
+    binary_hash: bool,
+    hash_type: Optional[str],
+):
+    entry = HashEntry(str(cache_file), binary=binary_hash, hash_type=hash_type)
+    with open(cache_file, "wt", newline="") as stream:
+        writer = HashWriter(stream, entry)
+        for chunk in chunks:
+            assert writer.write(chunk) == len(chunk)
+        writer.close()
+
+    assert cache_file.read_binary() == bytes("".join(chunks), stream.encoding)
+    assert entry.cached
+    assert (
+        entry.hash
+        == HashEntry(str(cache_file), binary=binary_hash, hash_type=hash_type).hash
+    )
@@ -278,3 +278,80 @@ class TestUpdate(object):
         with pytest.raises(ValueError, match=entry.hash_type):
             with syphon.hash.HashFile(hash_file) as hashfile:
                 hashfile.update(entry)
+
+
+class TestFind(object):
+    @staticmethod
+    @pytest.mark.parametrize(
+        "entry_position",
+        [CacheEntryPosition.FIRST, CacheEntryPosition.RANDOM, CacheEntryPosition.LAST],
+    )
+    def test_finds_entry_through_another_path(
+        cache_file: LocalPath,
+        hash_file: LocalPath,
+        entry_position: CacheEntryPosition,
+    ):
+        cache_file.write(rand_string())
+
+        expected_entries: List[syphon.hash.HashEntry] = populate_hash_file(
+            hash_file, cache_file=cache_file, cache_position=entry_position
+        )
+        expected_entry = [
+            e for e in expected_entries if os.path.samefile(e.filepath, cache_file)
+        ][0]
+
+        # A path with a redundant component still targets the same file.
+        other_path: str = os.path.join(
+            cache_file.dirname, os.curdir, cache_file.basename
+        )
+
+        with syphon.hash.HashFile(hash_file) as hashfile:
+            actual_entry: Optional[syphon.hash.HashEntry] = hashfile.find(other_path)
+
+        assert actual_entry is not None
+        assert str(expected_entry) == str(actual_entry)
+
+    @staticmethod
+    def test_returns_none_when_entry_does_not_exist(
+        cache_file: LocalPath, hash_file: LocalPath
+    ):
+        cache_file.write(rand_string())
+
+        populate_hash_file(hash_file)
+
+        with syphon.hash.HashFile(hash_file) as hashfile:
+            assert hashfile.find(cache_file) is None
+            assert hashfile.find(rand_string()) is None
+
+
+class TestClose(object):
+    @staticmethod
+    def test_writes_changes_once_on_close(cache_file: LocalPath, hash_file: LocalPath):
+        cache_file.write(rand_string())
+
+        populate_hash_file(hash_file, cache_file=cache_file)
+        expected_content: str = hash_file.read()
+
+        cache_file.write(rand_string())
+        entry = syphon.hash.HashEntry(cache_file)
+
+        with syphon.hash.HashFile(hash_file) as hashfile:
+            hashfile.update(entry)
+            assert hash_file.read() == expected_content
+            actual_entry: Optional[syphon.hash.HashEntry] = hashfile.find(cache_file)
+            assert actual_entry is not None
+            assert actual_entry.hash == entry.hash
+
+        assert hash_file.read() != expected_content
+        assert not os.path.exists(f"{hash_file}.tmp")
+
+    @staticmethod
+    def test_does_not_rewrite_unchanged_file(hash_file: LocalPath):
+        populate_hash_file(hash_file)
+        expected_mtime: int = os.stat(hash_file).st_mtime_ns
+
+        with syphon.hash.HashFile(hash_file) as hashfile:
+            for _ in hashfile:
+                pass
+
+        assert os.stat(hash_file).st_mtime_ns == expected_mtime
@@ -0,0 +1,112 @@
+"""tests.schema.test_compiledschema.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+import pickle
+from typing import Any, Mapping
+
+import pytest
+from pandas import DataFrame
+from sortedcontainers import SortedDict
+
+from syphon.schema import Schema, resolve_key_path
+
+from .. import rand_string
+
+
+class TestSchema(object):
+    @staticmethod
+    def test_levels_are_ordered_numerically():
+        schema = SortedDict({str(level): f"column{level}" for level in range(12)})
+
+        compiled = Schema(schema)
+
+        assert list(compiled) == [str(level) for level in range(12)]
+        assert compiled.headers == tuple(f"column{level}" for level in range(12))
+        # A SortedDict orders "10" and "11" before "2".
+        assert list(schema) != list(compiled)
+
+    @staticmethod
+    def test_is_a_mapping():
+        schema = SortedDict({"0": "column1", "1": "column2"})
+
+        compiled = Schema(schema)
+
+        assert compiled == schema
+        assert compiled["1"] == "column2"
+        assert len(compiled) == 2
+        assert "2" not in compiled
+
+    @staticmethod
+    def test_empty():
+        compiled = Schema(SortedDict())
+
+        assert len(compiled) == 0
+        assert compiled.headers == ()
+        assert compiled.positions(["column1"]) == ()
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "schema",
+        [
+            {"a": "column1"},
+            {"-1": "column1"},
+            {"1": "column1", "01": "column2"},
+            {"0": 0},
+            {"0": None},
+        ],
+    )
+    def test_raises_valueerror_on_invalid_schema(schema: Mapping[Any, Any]):
+        with pytest.raises(ValueError):
+            Schema(schema)
+
+    @staticmethod
+    def test_compile_returns_compiled_schema():
+        compiled = Schema(SortedDict({"0": "column1"}))
+
+        assert Schema.compile(compiled) is compiled
+
+    @staticmethod
+    def test_positions():
+        compiled = Schema(SortedDict({"0": "column3", "1": "column1"}))
+
+        assert compiled.positions(["column1", "column2", "column3"]) == (2, 0)
+        # Repeated columns use their first occurrence.
+        assert compiled.positions(["column3", "column1", "column3"]) == (0, 1)
+
+    @staticmethod
+    def test_positions_raises_indexerror_on_missing_column():
+        compiled = Schema(SortedDict({"0": "column1", "1": "column5"}))
+
+        with pytest.raises(IndexError):
+            compiled.positions(["column1", "column2"])
+        with pytest.raises(IndexError):
+            compiled.check_columns(DataFrame(columns=["column1", "column2"]))
+
+    @staticmethod
+    @pytest.mark.parametrize("key", [(), ("a",), ("a", "b"), (" a ", "b/c", 1.0)])
+    def test_resolve_key_path(key: tuple):
+        archive = rand_string()
+        compiled = Schema(SortedDict({str(i): rand_string() for i in range(len(key))}))
+
+        for _ in range(2):
+            assert compiled.resolve_key_path(archive, key) == resolve_key_path(
+                archive, key
+            )
+        assert compiled.resolve_key_path(
+            os.path.join(archive, "x"), key
+        ) == resolve_key_path(os.path.join(archive, "x"), key)
+
+    @staticmethod
+    def test_pickles():
+        compiled = Schema(SortedDict({"0": "column1", "1": "column2"}))
+        compiled.positions(["column2", "column1"])
+
+        unpickled: Schema = pickle.loads(pickle.dumps(compiled))
+
+        assert unpickled == compiled
+        assert unpickled.headers == compiled.headers
+        assert unpickled.positions(["column2", "column1"]) == (1, 0)
@@ -13,7 +13,7 @@ from pandas import DataFrame, Index
 from pandas._testing import makeCustomIndex
 from sortedcontainers import SortedDict
 
-from syphon.schema import resolve_path
+from syphon.schema import resolve_key_path, resolve_path
 
 from .. import make_dataframe, make_dataframe_value
 
@@ -135,3 +135,32 @@ class TestResolvePath(object):
 
         with pytest.raises(ValueError):
             resolve_path(self.archive, schema, data)
+
+
+class TestResolveKeyPath(object):
+    archive = TestResolvePath.archive
+
+    @pytest.mark.parametrize(
+        "key, expected",
+        [
+            ((), archive),
+            (("val",), join(archive, "val")),
+            (("val", "Value 1."), join(archive, "val", "value_1")),
+            (("Value 1.", "Value 1.", 3), join(archive, "value_1", "value_1", "3")),
+        ],
+    )
+    def test_resolve_key_path(self, key: tuple, expected: str):
+        assert resolve_key_path(self.archive, key) == expected
+
+    @pytest.mark.parametrize(
+        "schema", [TestResolvePath.single_schema, TestResolvePath.multi_schema2]
+    )
+    def test_resolve_key_path_matches_resolve_path(self, schema: SortedDict):
+        data: DataFrame = make_dataframe(
+            5, 4, data_gen_f=TestResolvePath.data_gen_normalizable
+        )
+        key = tuple("Value 1." for _ in schema)
+
+        assert resolve_key_path(self.archive, key) == resolve_path(
+            self.archive, schema, data
+        )
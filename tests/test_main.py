@@ -80,6 +80,56 @@ class TestMain(object):
         assert syphon.__main__.main(_archive_args(archive_dir, one_to_one=True)) == 0
         assert len(glob(os.path.join(archive_dir, "**"), recursive=True)) > 1
 
+    @staticmethod
+    @pytest.mark.parametrize("pipeline", [True, False])
+    def test_archive_jobs(archive_dir: LocalPath, pipeline: bool):
+        from glob import glob
+
+        assert syphon.__main__.main(_init_args(archive_dir)) == 0
+        arguments = _archive_args(archive_dir, one_to_one=True)
+        arguments.extend(["--jobs", "2"])
+        if pipeline:
+            arguments.append("--pipeline")
+        assert syphon.__main__.main(arguments) == 0
+        assert len(glob(os.path.join(archive_dir, "**"), recursive=True)) > 1
+
+    @staticmethod
+    def test_archive_chunksize(archive_dir: LocalPath):
+        from glob import glob
+
+        assert syphon.__main__.main(_init_args(archive_dir)) == 0
+        arguments = _archive_args(archive_dir, one_to_one=True)
+        arguments.extend(["--chunksize", "10"])
+        assert syphon.__main__.main(arguments) == 0
+        assert len(glob(os.path.join(archive_dir, "**"), recursive=True)) > 1
+
+    @staticmethod
+    def test_archive_lock_options(archive_dir: LocalPath):
+        from glob import glob
+
+        assert syphon.__main__.main(_init_args(archive_dir)) == 0
+        arguments = _archive_args(archive_dir, one_to_one=True)
+        arguments.extend(["--lock-timeout", "10", "--stale-after", "3600"])
+        assert syphon.__main__.main(arguments) == 0
+        assert len(glob(os.path.join(archive_dir, "**"), recursive=True)) > 1
+
+    @staticmethod
+    def test_archive_raw(archive_dir: LocalPath):
+        from glob import glob
+
+        assert syphon.__main__.main(_init_args(archive_dir)) == 0
+        arguments = _archive_args(archive_dir, one_to_one=True)
+        arguments.append("--raw")
+        assert syphon.__main__.main(arguments) == 0
+        assert len(glob(os.path.join(archive_dir, "**"), recursive=True)) > 1
+
+    @staticmethod
+    def test_archive_complains_about_chunksize_with_pipeline(archive_dir: LocalPath):
+        arguments = _archive_args(archive_dir, one_to_one=True)
+        arguments.extend(["--chunksize", "10", "--pipeline"])
+        with pytest.raises(SystemExit):
+            syphon.__main__.main(arguments)
+
     @staticmethod
     def test_archive_complains_when_hashfile_given_without_increment(
         capsys: CaptureFixture, tmpdir: LocalPath, archive_dir: LocalPath
@@ -140,6 +190,31 @@ class TestMain(object):
             )
         assert cache_file.size() > 0
 
+    @staticmethod
+    @pytest.mark.parametrize("no_manifest", [True, False])
+    def test_build_manifest(
+        archive_dir: LocalPath, cache_file: LocalPath, no_manifest: bool
+    ):
+        import syphon.manifest
+
+        assert syphon.__main__.main(_init_args(archive_dir)) == 0
+        assert syphon.__main__.main(_archive_args(archive_dir)) == 0
+
+        arguments = ["syphon", "-f"] + _build_args(archive_dir, cache_file)[1:]
+        if no_manifest:
+            arguments.append("--no-manifest")
+
+        assert syphon.__main__.main(arguments) == 0
+        expected_content: bytes = cache_file.read_binary()
+        assert syphon.__main__.main(arguments) == 0
+        assert syphon.__main__.main(_check_args(cache_file)) == 0
+
+        assert expected_content == cache_file.read_binary()
+        assert (
+            os.path.exists(syphon.manifest.default_filepath(cache_file))
+            is not no_manifest
+        )
+
     @staticmethod
     def test_build_no_hash(archive_dir: LocalPath, cache_file: LocalPath):
         assert not os.path.exists(cache_file)
@@ -154,6 +229,19 @@ class TestMain(object):
         assert not os.path.exists(cache_file.dirpath(syphon.core.check.DEFAULT_FILE))
         assert cache_file.size() > 0
 
+    @staticmethod
+    def test_build_jobs(archive_dir: LocalPath, cache_file: LocalPath):
+        assert not os.path.exists(cache_file)
+        assert syphon.__main__.main(_init_args(archive_dir)) == 0
+        assert syphon.__main__.main(_archive_args(archive_dir)) == 0
+
+        arguments = _build_args(archive_dir, cache_file)
+        arguments.extend(["--jobs", "2"])
+
+        assert syphon.__main__.main(arguments) == 0
+        assert syphon.__main__.main(_check_args(cache_file)) == 0
+        assert cache_file.size() > 0
+
     @staticmethod
     def test_check(archive_dir: LocalPath, cache_file: LocalPath):
         assert syphon.__main__.main(_init_args(archive_dir)) == 0
@@ -161,6 +249,47 @@ class TestMain(object):
         assert syphon.__main__.main(_build_args(archive_dir, cache_file)) == 0
         assert syphon.__main__.main(_check_args(cache_file)) == 0
 
+    @staticmethod
+    @pytest.mark.parametrize("given_sources", [True, False])
+    def test_check_hashfile(
+        archive_dir: LocalPath, tmpdir: LocalPath, given_sources: bool
+    ):
+        caches: List[LocalPath] = [tmpdir.join(f"cache{i}.csv") for i in range(3)]
+        hashfile: LocalPath = tmpdir.join(syphon.core.check.DEFAULT_FILE)
+
+        assert syphon.__main__.main(_init_args(archive_dir)) == 0
+        assert syphon.__main__.main(_archive_args(archive_dir)) == 0
+        for cache in caches:
+            assert syphon.__main__.main(_build_args(archive_dir, cache)) == 0
+
+        arguments = ["syphon", "check", "--hashfile", str(hashfile), "--jobs", "2"]
+        if given_sources:
+            arguments.extend(str(c) for c in caches)
+
+        assert syphon.__main__.main(arguments) == 0
+        caches[0].write(rand_string(), mode="a")
+        assert syphon.__main__.main(arguments) == 1
+
+    @staticmethod
+    @pytest.mark.parametrize("mode", ["--quick", "--full"])
+    def test_check_mode(archive_dir: LocalPath, cache_file: LocalPath, mode: str):
+        assert syphon.__main__.main(_init_args(archive_dir)) == 0
+        assert syphon.__main__.main(_archive_args(archive_dir)) == 0
+        assert syphon.__main__.main(_build_args(archive_dir, cache_file)) == 0
+        assert syphon.__main__.main(_check_args(cache_file) + [mode]) == 0
+
+    @staticmethod
+    def test_check_complains_about_extra_sources(cache_file: LocalPath):
+        with pytest.raises(SystemExit):
+            syphon.__main__.main(
+                _check_args(cache_file) + [rand_string(), rand_string()]
+            )
+
+    @staticmethod
+    def test_check_complains_about_jobs_without_hashfile(cache_file: LocalPath):
+        with pytest.raises(SystemExit):
+            syphon.__main__.main(_check_args(cache_file) + ["--jobs", "2"])
+
     @staticmethod
     def test_init(archive_dir: LocalPath):
         assert len(archive_dir.listdir()) == 0
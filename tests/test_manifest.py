@@ -0,0 +1,102 @@
+"""tests.test_manifest.py
+
+   Copyright Keithley Instruments, LLC.
+   Licensed under MIT (https://github.com/tektronix/syphon/blob/master/LICENSE)
+
+"""
+import os
+
+import pytest
+from py._path.local import LocalPath
+
+from syphon.hash import HashEntry
+from syphon.manifest import Manifest, default_filepath
+
+from . import rand_string
+
+
+def test_default_filepath(cache_file: LocalPath):
+    assert default_filepath(str(cache_file)) == str(
+        cache_file.dirpath(f".{cache_file.basename}.manifest")
+    )
+
+
+def test_manifest_init_raises_valueerror(tmpdir: LocalPath):
+    bad_hash_type = rand_string()
+
+    with pytest.raises(ValueError, match=bad_hash_type):
+        Manifest(str(tmpdir.join("manifest")), hash_type=bad_hash_type)
+
+
+def test_manifest_save_load_roundtrip(tmpdir: LocalPath, cache_file: LocalPath):
+    datafile: LocalPath = tmpdir.join("data.csv")
+    datafile.write(rand_string())
+    cache_file.write(rand_string())
+
+    expected = Manifest(str(tmpdir.join("manifest")))
+    expected.record(str(datafile))
+    expected.record_cache(str(cache_file))
+    expected.save()
+
+    actual = Manifest.load(str(tmpdir.join("manifest")))
+    assert actual.cache == expected.cache
+    assert actual.entries == expected.entries
+    assert actual.hash_type == expected.hash_type
+    assert actual.describes(str(cache_file))
+
+    entry = actual.entries[os.path.normcase(str(datafile))]
+    assert entry.size == datafile.size()
+    assert entry.hash == HashEntry(str(datafile), binary=True).hash
+
+
+@pytest.mark.parametrize("content", ["", "[]", '{"files": {}}'])
+def test_manifest_load_raises_valueerror(tmpdir: LocalPath, content: str):
+    manifest_file: LocalPath = tmpdir.join("manifest")
+    manifest_file.write(content)
+
+    with pytest.raises(ValueError):
+        Manifest.load(str(manifest_file))
+
+
+def test_manifest_describes_changed_cache(tmpdir: LocalPath, cache_file: LocalPath):
+    cache_file.write(rand_string())
+
+    manifest = Manifest(str(tmpdir.join("manifest")))
+    assert not manifest.describes(str(cache_file))
+    manifest.record_cache(str(cache_file))
+    assert manifest.describes(str(cache_file))
+
+    cache_file.write(rand_string(12))
+    assert not manifest.describes(str(cache_file))
+    cache_file.remove()
+    assert not manifest.describes(str(cache_file))
+
+
+def test_manifest_diff(tmpdir: LocalPath):
+    unchanged: LocalPath = tmpdir.join("unchanged.csv")
+    touched: LocalPath = tmpdir.join("touched.csv")
+    modified: LocalPath = tmpdir.join("modified.csv")
+    missing: LocalPath = tmpdir.join("missing.csv")
+    added: LocalPath = tmpdir.join("added.csv")
+    for file in (unchanged, touched, modified, missing, added):
+        file.write(rand_string())
+
+    manifest = Manifest(str(tmpdir.join("manifest")))
+    manifest.record(str(unchanged), str(touched), str(modified), str(missing))
+
+    stat = os.stat(touched)
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    modified.write(rand_string(12))
+
+    actual_added, actual_stale = manifest.diff(
+        [str(unchanged), str(touched), str(modified), str(added)]
+    )
+    assert actual_added == [str(added)]
+    assert sorted(actual_stale) == sorted(
+        [str(modified), os.path.normcase(str(missing))]
+    )
+    # Touched files with unchanged content are refreshed.
+    assert (
+        manifest.entries[os.path.normcase(str(touched))].mtime_ns
+        == os.stat(touched).st_mtime_ns
+    )